@@ -4,4 +4,4 @@ Connect4
 
 _MIN_PYTHON_VERSION = "3.9"
 
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
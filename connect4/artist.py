@@ -1,9 +1,7 @@
 import logging
+import time
 from abc import ABC, abstractmethod
-
-import matplotlib.pyplot as plt
-import numpy as np
-from matplotlib import colors
+from typing import Any, List
 
 from connect4.board import Connect4Board, Connect4DiskColour
 
@@ -85,51 +83,144 @@ class Connect4ArtistMatplotlib(Connect4Artist):
     """
     Artists drawing the graphics of connect-4 using Matplotlib
 
+    The image of the board is created once, and only the cells of the columns whose height changed are updated at
+    every draw. In incremental mode, the board is blitted over a cached background instead of redrawing the whole
+    figure, when the backend supports it. Redraws closer than ``min_interval`` are skipped, e.g. for fast AI-vs-AI
+    demos: the changes are shown at the next redraw, and always once the board is full.
+
+    Matplotlib is imported when the first artist is created, so that headless games do not pay for it.
+
     Attributes
     ----------
     board: Connect4Board
         the board used for the game
+    incremental : bool
+        whether the board is blitted instead of redrawing the whole figure
+    min_interval : float
+        minimum time between two redraws, in seconds
     """
 
-    def __init__(self, board: Connect4Board) -> None:
+    def __init__(self, board: Connect4Board, incremental: bool = True, min_interval: float = 0.0) -> None:
         """
         Parameters
         ----------
         board: Connect4Board
             board for the game
+        incremental : bool
+            blit the board instead of redrawing the whole figure, if the backend supports it
+        min_interval : float
+            minimum time between two redraws, in seconds. 0 to redraw at every move
         """
+        import matplotlib.pyplot as plt
+        import numpy as np
+        from matplotlib import colors
+
         self.board = board
+        self.min_interval = min_interval
         plt.set_loglevel("critical")
         logging.getLogger("PIL").setLevel(logging.WARNING)
         self._fig, self._axis = plt.subplots(1, 1)
+        self.incremental = incremental and self._fig.canvas.supports_blit
         self._axis.set_xticks(range(0, self.board.columns))
         self._axis.set_yticks(range(0, self.board.rows))
-        self._axis.set_xticks(np.arange(-0.5, self.board.columns), minor=True)
-        self._axis.set_yticks(np.arange(-0.5, self.board.rows), minor=True)
         self._axis.set_xticklabels(range(0, self.board.columns))
         self._axis.set_yticklabels(range(0, self.board.rows))
-        self._axis.grid(which="minor", color="k", linewidth=2)
         self._cmap = colors.ListedColormap(["y", "w", "r"])
         self._vmin = np.min([e.value for e in Connect4DiskColour])
         self._vmax = np.max([e.value for e in Connect4DiskColour])
+        self._matrix = np.full((self.board.rows, self.board.columns), Connect4DiskColour.invalid.value)
+        self._heights = [0] * self.board.columns
+        self._image = self._axis.imshow(
+            self._matrix,
+            origin="lower",
+            cmap=self._cmap,
+            vmin=self._vmin,
+            vmax=self._vmax,
+            animated=self.incremental,
+        )
+        # The grid is drawn over the image, so it is blitted with it
+        self._grid = [
+            self._axis.vlines(
+                np.arange(-0.5, self.board.columns),
+                -0.5,
+                self.board.rows - 0.5,
+                colors="k",
+                linewidth=2,
+                animated=self.incremental,
+            ),
+            self._axis.hlines(
+                np.arange(-0.5, self.board.rows),
+                -0.5,
+                self.board.columns - 0.5,
+                colors="k",
+                linewidth=2,
+                animated=self.incremental,
+            ),
+        ]
+        self._axis.set_xlim(-0.5, self.board.columns - 0.5)
+        self._axis.set_ylim(-0.5, self.board.rows - 0.5)
+        self._background: Any = None
+        self._last_refresh = -float("inf")
+        # Whether the image changed since the last redraw
+        self._pending = True
+        if self.incremental:
+            self._fig.canvas.mpl_connect("draw_event", self._on_draw)
         plt.show(block=False)
 
-    def _refresh(self) -> None:
-        """Refresh graphical representation of the board."""
+    @property
+    def _animated(self) -> List[Any]:
+        """Artists blitted over the background."""
+        return [self._image] + self._grid
+
+    def _on_draw(self, event: Any) -> None:
+        """Cache the background after a full redraw of the figure, e.g. on resize, and blit the board over it."""
+        self._background = self._fig.canvas.copy_from_bbox(self._fig.bbox)
+        for artist in self._animated:
+            self._fig.draw_artist(artist)
 
-        self._fig.canvas.draw()
+    def _refresh(self, full: bool = False) -> None:
+        """
+        Refresh graphical representation of the board.
+
+        Parameters
+        ----------
+        full: bool
+            redraw the whole figure, e.g. after a change outside the board
+        """
+        if full or not self.incremental or self._background is None:
+            self._fig.canvas.draw()
+        else:
+            self._fig.canvas.restore_region(self._background)
+            for artist in self._animated:
+                self._fig.draw_artist(artist)
+            self._fig.canvas.blit(self._fig.bbox)
         self._fig.canvas.flush_events()
+        self._last_refresh = time.perf_counter()
+        self._pending = False
+
+    def _update_image(self) -> None:
+        """Copy the cells of the columns whose height changed since the last update into the image."""
+        changed = False
+        for column, drawn_height in enumerate(self._heights):
+            height = self.board.disks_in_column(column)
+            if height == drawn_height:
+                continue
+            # Disks inserted or removed since the last update
+            for row in range(min(height, drawn_height), max(height, drawn_height)):
+                self._matrix[row, column] = self.board.cell(row, column).value
+            self._heights[column] = height
+            changed = True
+        if changed:
+            self._image.set_data(self._matrix)
+            self._pending = True
 
     def draw(self) -> None:
         """Draw graphical representation of the board."""
-
-        self._axis.imshow(
-            self.board.as_matrix(),
-            origin="lower",
-            cmap=self._cmap,
-            vmin=self._vmin,
-            vmax=self._vmax,
-        )
+        self._update_image()
+        if not self._pending:
+            return
+        if time.perf_counter() - self._last_refresh < self.min_interval and not self.board.is_full():
+            return
         self._refresh()
 
     def draw_gameover(self, winner: Connect4DiskColour) -> None:
@@ -141,6 +232,7 @@ class Connect4ArtistMatplotlib(Connect4Artist):
         winner: Connect4DiskColour
             winning colour
         """
+        self._update_image()
         self._fig.suptitle(f"{winner.name.upper()} WINS")
-        self._refresh()
+        self._refresh(full=True)
         input("Game over. Press any key to return.")
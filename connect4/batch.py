@@ -0,0 +1,231 @@
+from typing import List, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from connect4.board import Connect4Board, Connect4DiskColour
+
+
+class Connect4BoardBatch:
+    """
+    A batch of connect-4 boards of the same size, updated with vectorized NumPy operations
+
+    Attributes
+    ----------
+    rows : int
+        number of rows
+    columns : int
+        number of columns
+    cells : npt.NDArray[np.int8]
+        ``(size, rows, columns)`` array of the disk colour values, as in ``Connect4Board.as_matrix``
+    heights : npt.NDArray[np.int8]
+        ``(size, columns)`` array of the number of disks in every column
+    """
+
+    def __init__(self, size: int, rows: int, columns: int) -> None:
+        """
+        Parameters
+        ----------
+        size : int
+            number of boards
+        rows : int
+            number of rows
+        columns : int
+            number of columns
+        """
+        self.rows: int = rows
+        self.columns: int = columns
+        self.cells: npt.NDArray[np.int8] = np.zeros((size, rows, columns), dtype=np.int8)
+        self.heights: npt.NDArray[np.int8] = np.zeros((size, columns), dtype=np.int8)
+
+    @classmethod
+    def from_boards(cls, boards: List[Connect4Board]) -> "Connect4BoardBatch":
+        """
+        Build a batch from a list of boards.
+
+        Parameters
+        ----------
+        boards : List[Connect4Board]
+            boards, all of the same size
+
+        Returns
+        ----------
+        Connect4BoardBatch
+            batch holding a copy of the boards
+        """
+        batch = cls(len(boards), boards[0].rows, boards[0].columns)
+        for idx, board in enumerate(boards):
+            if board.rows != batch.rows or board.columns != batch.columns:
+                raise ValueError("All the boards must have the same size.")
+            batch.cells[idx] = board.as_matrix()
+            batch.heights[idx] = [board.disks_in_column(column) for column in range(board.columns)]
+        return batch
+
+    def __len__(self) -> int:
+        """
+        Number of boards in the batch.
+
+        Returns
+        ----------
+        int
+            Number of boards
+        """
+        return self.cells.shape[0]
+
+    def available_columns(self) -> npt.NDArray[np.bool_]:
+        """
+        Mask of the available columns, i.e. where there is space for more disks.
+
+        Returns
+        ----------
+        npt.NDArray[np.bool_]
+            ``(size, columns)`` mask, True where a disk can be inserted
+        """
+        return self.heights < self.rows
+
+    def is_full(self) -> npt.NDArray[np.bool_]:
+        """
+        Mask of the full boards.
+
+        Returns
+        ----------
+        npt.NDArray[np.bool_]
+            ``(size,)`` mask, True where the board is full
+        """
+        return np.all(self.heights >= self.rows, axis=1)
+
+    def insert(
+        self,
+        columns: npt.NDArray[np.int_],
+        colours: Union[Connect4DiskColour, npt.NDArray[np.int8]],
+        active: Optional[npt.NDArray[np.bool_]] = None,
+    ) -> npt.NDArray[np.int_]:
+        """
+        Insert one disk in every active board.
+
+        Parameters
+        ----------
+        columns : npt.NDArray[np.int_]
+            ``(size,)`` column where to insert the disk in every board
+        colours : Union[Connect4DiskColour, npt.NDArray[np.int8]]
+            colour of all the disks, or ``(size,)`` colour values of the disk of every board
+        active : Optional[npt.NDArray[np.bool_]]
+            ``(size,)`` mask of the boards where to insert a disk. None for all the boards
+
+        Returns
+        ----------
+        npt.NDArray[np.int_]
+            ``(size,)`` row of every inserted disk, -1 for inactive boards
+        """
+        board_idx = np.arange(len(self)) if active is None else np.flatnonzero(active)
+        columns = np.asarray(columns)[board_idx]
+        if isinstance(colours, Connect4DiskColour):
+            values = np.full(len(board_idx), colours.value, dtype=np.int8)
+        else:
+            values = np.asarray(colours, dtype=np.int8)[board_idx]
+        if np.any((columns < 0) | (columns >= self.columns)):
+            raise ValueError("Invalid column")
+        rows = self.heights[board_idx, columns].astype(np.int_)
+        if np.any(rows >= self.rows):
+            raise ValueError("Column is full")
+        self.cells[board_idx, rows, columns] = values
+        self.heights[board_idx, columns] += 1
+        inserted_rows = np.full(len(self), -1, dtype=np.int_)
+        inserted_rows[board_idx] = rows
+        return inserted_rows
+
+    def winners(self, num_disks: int = 4) -> npt.NDArray[np.int8]:
+        """
+        Colour having at least a given number of connected disks in every board.
+
+        Windows of consecutive cells are summed along every direction: a window is complete when its sum is
+        ``num_disks`` times a colour value.
+
+        Parameters
+        ----------
+        num_disks : int
+            number of connected disks needed to win
+
+        Returns
+        ----------
+        npt.NDArray[np.int8]
+            ``(size,)`` colour value of the winner of every board, ``Connect4DiskColour.invalid.value`` if none
+        """
+        cells = self.cells.astype(np.int16)
+        rows, columns, k = self.rows, self.columns, num_disks
+        window_sums = []
+        if columns >= k:
+            window_sums.append(sum(cells[:, :, i : columns - k + 1 + i] for i in range(k)))
+        if rows >= k:
+            window_sums.append(sum(cells[:, i : rows - k + 1 + i, :] for i in range(k)))
+        if rows >= k and columns >= k:
+            window_sums.append(sum(cells[:, i : rows - k + 1 + i, i : columns - k + 1 + i] for i in range(k)))
+            window_sums.append(sum(cells[:, i : rows - k + 1 + i, k - 1 - i : columns - i] for i in range(k)))
+        winners = np.full(len(self), Connect4DiskColour.invalid.value, dtype=np.int8)
+        for colour in (Connect4DiskColour.red, Connect4DiskColour.yellow):
+            won = np.zeros(len(self), dtype=bool)
+            for sums in window_sums:
+                won |= np.any(sums.reshape(len(self), -1) == k * colour.value, axis=1)
+            winners[won] = colour.value
+        return winners
+
+    def random_playouts(
+        self,
+        colours: Union[Connect4DiskColour, npt.NDArray[np.int8]],
+        rng: Optional[np.random.Generator] = None,
+        num_disks: int = 4,
+    ) -> npt.NDArray[np.int8]:
+        """
+        Play random moves in all the boards until every game is over.
+
+        Parameters
+        ----------
+        colours : Union[Connect4DiskColour, npt.NDArray[np.int8]]
+            colour to move in all the boards, or ``(size,)`` colour value to move in every board
+        rng : Optional[np.random.Generator]
+            random number generator. None for a new unseeded generator
+        num_disks : int
+            number of connected disks needed to win
+
+        Returns
+        ----------
+        npt.NDArray[np.int8]
+            ``(size,)`` colour value of the winner of every board, ``Connect4DiskColour.invalid.value`` for draws
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        if isinstance(colours, Connect4DiskColour):
+            to_move = np.full(len(self), colours.value, dtype=np.int8)
+        else:
+            to_move = np.array(colours, dtype=np.int8)
+        winners = self.winners(num_disks)
+        active = (winners == Connect4DiskColour.invalid.value) & ~self.is_full()
+        while np.any(active):
+            priorities = rng.random((len(self), self.columns))
+            priorities[~self.available_columns()] = -1.0
+            self.insert(np.argmax(priorities, axis=1), to_move, active)
+            to_move = np.where(active, -to_move, to_move)
+            winners = self.winners(num_disks)
+            active &= (winners == Connect4DiskColour.invalid.value) & ~self.is_full()
+        return winners
+
+    def board(self, index: int) -> Connect4Board:
+        """
+        Copy a board of the batch into a ``Connect4Board``.
+
+        The move order is not stored by the batch: disks are inserted column by column.
+
+        Parameters
+        ----------
+        index : int
+            index of the board in the batch
+
+        Returns
+        ----------
+        Connect4Board
+            copy of the board
+        """
+        board = Connect4Board(self.rows, self.columns)
+        for column in range(self.columns):
+            for row in range(self.heights[index, column]):
+                board.insert_disk(Connect4DiskColour(int(self.cells[index, row, column])), column)
+        return board
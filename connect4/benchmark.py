@@ -0,0 +1,338 @@
+import platform
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence
+
+from connect4 import __version__
+from connect4.artist import Connect4ArtistTrivial
+from connect4.board import Connect4Board, Connect4Disk, Connect4DiskColour
+from connect4.game import Connect4Game
+from connect4.player import Connect4DummyPlayer, Connect4ShortSightedAI
+from connect4.simulation import Connect4PlayerFactory
+
+DEFAULT_FILL_LEVELS = (0.0, 0.25, 0.5, 0.75, 0.95)
+
+
+@dataclass
+class Connect4BenchmarkResult:
+    """
+    Timings of a benchmark
+
+    Attributes
+    ----------
+    name : str
+        benchmark name
+    params : Dict[str, Any]
+        benchmark parameters, e.g. the fill level of the board
+    number : int
+        number of operations per repeat
+    times : List[float]
+        wall-clock time of every repeat, in seconds
+    """
+
+    name: str
+    params: Dict[str, Any]
+    number: int
+    times: List[float] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Identifier of the benchmark and of its parameters, to compare results across runs."""
+        return self.name + "".join(f"[{name}={value}]" for name, value in sorted(self.params.items()))
+
+    @property
+    def best(self) -> float:
+        """Time per operation of the fastest repeat, in seconds: the least noisy estimate."""
+        return min(self.times) / self.number
+
+    @property
+    def median(self) -> float:
+        """Median time per operation over the repeats, in seconds."""
+        return statistics.median(self.times) / self.number
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Machine-readable summary of the benchmark.
+
+        Returns
+        ----------
+        Dict[str, Any]
+            summary of the benchmark
+        """
+        return {
+            "key": self.key,
+            "name": self.name,
+            "params": self.params,
+            "number": self.number,
+            "repeats": len(self.times),
+            "best": self.best,
+            "median": self.median,
+            "ops_per_second": 1 / self.best if self.best else float("inf"),
+        }
+
+
+def _measure(
+    name: str,
+    params: Dict[str, Any],
+    func: Callable[[], Any],
+    number: int,
+    repeats: int,
+) -> Connect4BenchmarkResult:
+    """
+    Time repeated calls of a function.
+
+    Parameters
+    ----------
+    name: str
+        benchmark name
+    params: Dict[str, Any]
+        benchmark parameters
+    func: Callable[[], Any]
+        operation to time
+    number: int
+        calls per repeat
+    repeats: int
+        number of repeats
+
+    Returns
+    ----------
+    Connect4BenchmarkResult
+        timings of the repeats
+    """
+    result = Connect4BenchmarkResult(name, params, number)
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        result.times.append(time.perf_counter() - start)
+    return result
+
+
+def random_position(fill_level: float, rows: int = 6, columns: int = 7, seed: int = 0) -> Connect4Board:
+    """
+    Board filled with random moves, the red player moving first, without any connected disks.
+
+    Parameters
+    ----------
+    fill_level: float
+        fraction of the cells to fill
+    rows : int
+        number of rows
+    columns : int
+        number of columns
+    seed: int
+        seed of the random moves
+
+    Returns
+    ----------
+    Connect4Board
+        the board, possibly less filled if every move ends the game
+    """
+    rng = random.Random(seed)
+    board = Connect4Board(rows, columns)
+    colour, opponent_colour = Connect4DiskColour.red, Connect4DiskColour.yellow
+    while len(board) < round(fill_level * rows * columns):
+        columns_left = [column for column in board.available_columns() if not board.is_winning_move(colour, column)]
+        if not columns_left:
+            break
+        board.insert_disk(colour, rng.choice(columns_left))
+        colour, opponent_colour = opponent_colour, colour
+    return board
+
+
+def _colour_to_move(board: Connect4Board) -> Connect4DiskColour:
+    """Colour to move, the red player moving first."""
+    return Connect4DiskColour.red if len(board) % 2 == 0 else Connect4DiskColour.yellow
+
+
+def board_benchmarks(
+    fill_levels: Sequence[float] = DEFAULT_FILL_LEVELS,
+    number: int = 1000,
+    repeats: int = 5,
+) -> List[Connect4BenchmarkResult]:
+    """
+    Time the board operations on positions of increasing fill level.
+
+    ``insert_disk`` and ``push_move`` are timed together with the ``undo_last`` and ``pop_move`` restoring the
+    position.
+
+    Parameters
+    ----------
+    fill_levels: Sequence[float]
+        fractions of the board filled
+    number: int
+        operations per repeat
+    repeats: int
+        number of repeats
+
+    Returns
+    ----------
+    List[Connect4BenchmarkResult]
+        timings of every operation at every fill level
+    """
+    results = []
+    for fill_level in fill_levels:
+        board = random_position(fill_level)
+        params = {"fill_level": fill_level}
+        colour = _colour_to_move(board)
+        column = board.available_columns()[0]
+        # The last disk inserted, or the first one on an empty board
+        if board.moves:
+            last_column = board.moves[-1]
+            opponent_colour = Connect4DiskColour.yellow if colour == Connect4DiskColour.red else Connect4DiskColour.red
+            last_disk = Connect4Disk(board.disks_in_column(last_column) - 1, last_column, opponent_colour)
+        else:
+            last_disk = Connect4Disk(0, column, colour)
+
+        def insert_disk() -> None:
+            board.insert_disk(colour, column)
+            board.undo_last()
+
+        def push_move() -> None:
+            board.push_move(colour, column)
+            board.pop_move()
+
+        results += [
+            _measure("insert_disk", params, insert_disk, number, repeats),
+            _measure("push_move", params, push_move, number, repeats),
+            _measure("available_columns", params, board.available_columns, number, repeats),
+            _measure(
+                "max_num_connected_disks", params, lambda: board.max_num_connected_disks(last_disk), number, repeats
+            ),
+            _measure("connections_after", params, lambda: board.connections_after(colour, column), number, repeats),
+            _measure("wins_after", params, lambda: board.wins_after(last_disk), number, repeats),
+            _measure("is_winning_move", params, lambda: board.is_winning_move(colour, column), number, repeats),
+            _measure("as_matrix", params, board.as_matrix, number, repeats),
+            _measure("copy", params, board.copy, number, repeats),
+            _measure("to_bytes", params, board.to_bytes, number, repeats),
+        ]
+    return results
+
+
+def player_benchmarks(
+    fill_levels: Sequence[float] = DEFAULT_FILL_LEVELS,
+    number: int = 100,
+    repeats: int = 5,
+) -> List[Connect4BenchmarkResult]:
+    """
+    Time the move choice of ``Connect4ShortSightedAI`` on positions of increasing fill level.
+
+    Parameters
+    ----------
+    fill_levels: Sequence[float]
+        fractions of the board filled
+    number: int
+        moves per repeat
+    repeats: int
+        number of repeats
+
+    Returns
+    ----------
+    List[Connect4BenchmarkResult]
+        latency of the move choice at every fill level
+    """
+    results = []
+    for fill_level in fill_levels:
+        board = random_position(fill_level)
+        player = Connect4ShortSightedAI(board, _colour_to_move(board))
+        results.append(
+            _measure("short_sighted.choose_column", {"fill_level": fill_level}, player.choose_column, number, repeats)
+        )
+    return results
+
+
+def game_benchmarks(number: int = 100, repeats: int = 5, seed: int = 0) -> List[Connect4BenchmarkResult]:
+    """
+    Time whole games played by ``Connect4Game.play`` with ``Connect4ArtistTrivial``.
+
+    Parameters
+    ----------
+    number: int
+        games per repeat
+    repeats: int
+        number of repeats
+    seed: int
+        seed of the ``random`` module generator, restored at the end
+
+    Returns
+    ----------
+    List[Connect4BenchmarkResult]
+        time per game of every pairing of players
+    """
+    pairings: Dict[str, Connect4PlayerFactory] = {
+        "dummy": Connect4DummyPlayer,
+        "short_sighted": Connect4ShortSightedAI,
+    }
+    results = []
+    random_state = random.getstate()
+    random.seed(seed)
+    try:
+        for name, factory in pairings.items():
+
+            def play() -> None:
+                board = Connect4Board(6, 7)
+                Connect4Game(
+                    board,
+                    yellow_player=factory(board, Connect4DiskColour.yellow),
+                    red_player=factory(board, Connect4DiskColour.red),
+                    artist=Connect4ArtistTrivial(board),
+                ).play()
+
+            results.append(_measure("game.play", {"players": name}, play, number, repeats))
+    finally:
+        random.setstate(random_state)
+    return results
+
+
+def run_benchmarks(quick: bool = False) -> Dict[str, Any]:
+    """
+    Run the whole benchmark suite.
+
+    Parameters
+    ----------
+    quick: bool
+        run every benchmark with a few operations only, e.g. to check that the suite works
+
+    Returns
+    ----------
+    Dict[str, Any]
+        machine-readable report: environment and results of every benchmark
+    """
+    board_number, player_number, game_number, repeats = (100, 10, 5, 1) if quick else (10000, 100, 100, 5)
+    results = (
+        board_benchmarks(number=board_number, repeats=repeats)
+        + player_benchmarks(number=player_number, repeats=repeats)
+        + game_benchmarks(number=game_number, repeats=repeats)
+    )
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [result.as_dict() for result in results],
+    }
+
+
+def compare_benchmarks(baseline: Dict[str, Any], report: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Compare two reports of ``run_benchmarks``, e.g. of two commits.
+
+    Parameters
+    ----------
+    baseline: Dict[str, Any]
+        reference report
+    report: Dict[str, Any]
+        new report
+
+    Returns
+    ----------
+    Dict[str, float]
+        ratio of the best time per operation to the baseline, by benchmark key. Above 1 means slower
+    """
+    baseline_times = {result["key"]: result["best"] for result in baseline["results"]}
+    return {
+        result["key"]: result["best"] / baseline_times[result["key"]]
+        for result in report["results"]
+        if baseline_times.get(result["key"])
+    }
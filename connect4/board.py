@@ -1,10 +1,29 @@
-import logging
+import math
+import struct
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, List, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-import numpy as np
-import numpy.typing as npt
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Header of the serialized boards: rows, columns, number of connected disks to win
+_BYTES_HEADER = struct.Struct("<HHH")
+
+Connect4BoardType = TypeVar("Connect4BoardType", bound="Connect4Board")
 
 
 class Connect4DiskColour(Enum):
@@ -15,11 +34,18 @@ class Connect4DiskColour(Enum):
     invalid = 0
 
 
+# Colour of the disks by cell value
+_CELL_COLOURS = (Connect4DiskColour.invalid, Connect4DiskColour.red, Connect4DiskColour.yellow)
+
+
 @dataclass(frozen=True)
 class Connect4Disk:
     """
     Connect-4 disk in the board
 
+    Disks are slotted. The board stores plain integers and only builds disks at its public interface: search loops
+    use ``Connect4Board.push_move``, ``Connect4Board.pop_move`` and ``Connect4Board.connections_after`` instead.
+
     Attributes
     ----------
     row : int
@@ -30,10 +56,16 @@ class Connect4Disk:
         colour
     """
 
+    __slots__ = ("row", "column", "colour")
+
     row: int
     column: int
     colour: Connect4DiskColour
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Frozen slotted instances cannot be restored attribute by attribute
+        return self.__class__, (self.row, self.column, self.colour)
+
 
 def disk_distance(disk1: Connect4Disk, disk2: Connect4Disk) -> float:
     """
@@ -51,7 +83,7 @@ def disk_distance(disk1: Connect4Disk, disk2: Connect4Disk) -> float:
     flot
         distance between the two disks
     """
-    return np.sqrt((disk1.row - disk2.row) ** 2 + (disk1.column - disk2.column) ** 2)
+    return math.sqrt((disk1.row - disk2.row) ** 2 + (disk1.column - disk2.column) ** 2)
 
 
 def consecutive_elements(s: Set[Any], elem: Any, order_fun: Callable[[Any], int]) -> List[Any]:
@@ -92,15 +124,35 @@ class Connect4Board:
     """
     A connect-4 board
 
+    The board is stored as bitboards: one integer mask per colour plus the height of every column.
+    Cell ``(row, column)`` maps to bit ``column * (rows + 1) + row``; the extra bit on top of every column is
+    always empty and stops shifted masks from wrapping from one column into the next. Python integers grow to any
+    number of words, so any board size fits, e.g. 100x100 for connect-5 variants. The cells are also stored in a byte
+    array with the same layout, so that connections through a cell are counted in time bounded by ``connect``
+    whatever the size of the board.
+
+    The evaluation state holds, for every line of ``connect`` cells (window), the number of disks of each colour in it,
+    the number of windows without opponent disks (open lines) and the empty cells completing a line (threats). It is
+    built the first time it is queried, then kept up to date at every insertion and removal; boards that are never
+    evaluated do not pay for it.
+
+    Boards are copied, serialized and pickled from the bitboards, in constant size for a given board size, along with
+    the move history when pickled.
+
     Attributes
     ----------
     rows : int
         number of rows
     columns : int
         number of columns
+    connect : int
+        number of connected disks to win
     """
 
-    def __init__(self, rows: int, columns: int) -> None:
+    # Windows and windows through every cell, by board size and number of connected disks to win
+    _WINDOWS: Dict[Tuple[int, int, int], Tuple[List[Tuple[int, ...]], List[Tuple[int, ...]]]] = {}
+
+    def __init__(self, rows: int, columns: int, connect: int = 4) -> None:
         """
         Parameters
         ----------
@@ -108,10 +160,40 @@ class Connect4Board:
             number of rows
         columns : int
             number of columns
+        connect : int
+            number of connected disks to win
         """
+        if connect < 1:
+            raise ValueError(f"Invalid number of connected disks to win: {connect}")
         self.rows: int = rows
         self.columns: int = columns
-        self._disks: List[Connect4Disk] = []
+        self.connect: int = connect
+        self._column_height: int = rows + 1
+        # Bit shifts for the vertical, horizontal and the two diagonal directions
+        self._shifts: Tuple[int, int, int, int] = (
+            1,
+            self._column_height,
+            self._column_height + 1,
+            self._column_height - 1,
+        )
+        # One bit at the bottom of every column
+        self._bottom_mask: int = sum(1 << (column * self._column_height) for column in range(columns))
+        self._red_mask: int = 0
+        self._yellow_mask: int = 0
+        # Colour index + 1 of the disk in every cell, 0 if empty, indexed like the bitboards
+        self._cells: bytearray = bytearray(columns * self._column_height)
+        self._heights: List[int] = [0] * columns
+        self._num_disks: int = 0
+        # Columns of the inserted disks, in insertion order
+        self._moves: List[int] = []
+        self._window_length: int = connect
+        # Evaluation state, by colour index (0 for red, 1 for yellow), built on the first query
+        self._evaluated: bool = False
+        self._windows: List[Tuple[int, ...]] = []
+        self._cell_windows: List[Tuple[int, ...]] = []
+        self._window_disks: Tuple[List[int], List[int]] = ([], [])
+        self._open_windows: Tuple[List[int], List[int]] = ([], [])
+        self._threats: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
 
     def __len__(self) -> int:
         """
@@ -122,7 +204,270 @@ class Connect4Board:
         int
             Number of disks
         """
-        return len(self._disks)
+        return self._num_disks
+
+    @property
+    def moves(self) -> Tuple[int, ...]:
+        """
+        Columns of the inserted disks, in insertion order.
+
+        Returns
+        ----------
+        Tuple[int, ...]
+            column indices of the moves played so far
+        """
+        return tuple(self._moves)
+
+    def _bit_index(self, row: int, column: int) -> int:
+        """
+        Index of the bit representing a cell.
+
+        Parameters
+        ----------
+        row: int
+            row
+        column: int
+            column
+
+        Returns
+        ----------
+        int
+            bit index
+        """
+        return column * self._column_height + row
+
+    def _build_windows(self) -> Tuple[List[Tuple[int, ...]], List[Tuple[int, ...]]]:
+        """
+        All the lines of consecutive cells where a player can win, shared by the boards of the same size.
+
+        Returns
+        ----------
+        Tuple[List[Tuple[int, ...]], List[Tuple[int, ...]]]
+            bit indices of the cells of every window, and indices of the windows through every cell
+        """
+        size = (self.rows, self.columns, self.connect)
+        if size in Connect4Board._WINDOWS:
+            return Connect4Board._WINDOWS[size]
+        length = self._window_length
+        windows = []
+        for d_row, d_column in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+            for row in range(self.rows):
+                for column in range(self.columns):
+                    last_row, last_column = row + (length - 1) * d_row, column + (length - 1) * d_column
+                    if 0 <= last_row < self.rows and 0 <= last_column < self.columns:
+                        windows.append(
+                            tuple(self._bit_index(row + i * d_row, column + i * d_column) for i in range(length)),
+                        )
+        cell_windows: List[List[int]] = [[] for _ in range(self.columns * self._column_height)]
+        for window_idx, window in enumerate(windows):
+            for index in window:
+                cell_windows[index].append(window_idx)
+        Connect4Board._WINDOWS[size] = windows, [tuple(indices) for indices in cell_windows]
+        return Connect4Board._WINDOWS[size]
+
+    def _evaluate(self) -> None:
+        """Build the evaluation state from the disks on the board, unless it is already maintained."""
+        if self._evaluated:
+            return
+        self._windows, self._cell_windows = self._build_windows()
+        cells = self._cells
+        self._window_disks = (
+            [sum(cells[index] == 1 for index in window) for window in self._windows],
+            [sum(cells[index] == 2 for index in window) for window in self._windows],
+        )
+        self._open_windows = ([0] * (self._window_length + 1), [0] * (self._window_length + 1))
+        self._threats = ({}, {})
+        red_counts, yellow_counts = self._window_disks
+        for window_idx in range(len(self._windows)):
+            self._count_window(window_idx, red_counts[window_idx], yellow_counts[window_idx], 1)
+        self._evaluated = True
+
+    def _count_window(self, window_idx: int, red_disks: int, yellow_disks: int, sign: int) -> None:
+        """
+        Add or remove the contribution of a window to the open lines and threats.
+
+        Parameters
+        ----------
+        window_idx: int
+            window index
+        red_disks: int
+            red disks in the window
+        yellow_disks: int
+            yellow disks in the window
+        sign: int
+            1 to add the contribution, -1 to remove it
+        """
+        for colour_idx, disks, opponent_disks in ((0, red_disks, yellow_disks), (1, yellow_disks, red_disks)):
+            if opponent_disks:
+                continue
+            self._open_windows[colour_idx][disks] += sign
+            if disks == self._window_length - 1:
+                empty = next(index for index in self._windows[window_idx] if not self._cells[index])
+                threats = self._threats[colour_idx]
+                threats[empty] = threats.get(empty, 0) + sign
+                if not threats[empty]:
+                    del threats[empty]
+
+    def _update_windows(self, index: int, colour_idx: int, delta: int) -> None:
+        """
+        Update the evaluation state after a disk has been inserted in or removed from a cell.
+
+        Parameters
+        ----------
+        index: int
+            bit index of the changed cell
+        colour_idx: int
+            colour index of the disk: 0 for red, 1 for yellow
+        delta: int
+            1 if the disk has been inserted, -1 if it has been removed
+        """
+        red_counts, yellow_counts = self._window_disks
+        counts, opponent_counts = self._window_disks[colour_idx], self._window_disks[1 - colour_idx]
+        changed = []
+        for window_idx in self._cell_windows[index]:
+            disks = counts[window_idx]
+            # Windows holding both colours before and after the change contribute nothing
+            if opponent_counts[window_idx] and disks and disks + delta:
+                counts[window_idx] = disks + delta
+            else:
+                changed.append(window_idx)
+        if not changed:
+            return
+        # Contributions are removed with the cell as it was, and added back with the cell as it is
+        cells = self._cells
+        value = cells[index]
+        cells[index] = 0 if delta > 0 else colour_idx + 1
+        for window_idx in changed:
+            self._count_window(window_idx, red_counts[window_idx], yellow_counts[window_idx], -1)
+        cells[index] = value
+        for window_idx in changed:
+            counts[window_idx] += delta
+            self._count_window(window_idx, red_counts[window_idx], yellow_counts[window_idx], 1)
+
+    def _colour_mask(self, colour: Connect4DiskColour) -> int:
+        """
+        Bitboard of the disks of a given colour.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            colour
+
+        Returns
+        ----------
+        int
+            bit mask of the disks matching the colour
+        """
+        if colour is Connect4DiskColour.red:
+            return self._red_mask
+        if colour is Connect4DiskColour.yellow:
+            return self._yellow_mask
+        return 0
+
+    def position_key(self) -> int:
+        """
+        Compact key uniquely identifying the disks on the board.
+
+        In every column, the bit above the topmost disk is set and the bits below it mark the red disks.
+
+        Returns
+        ----------
+        int
+            position key
+        """
+        return self._red_mask + (self._red_mask | self._yellow_mask) + self._bottom_mask
+
+    def mirror_key(self) -> int:
+        """
+        Position key of the mirror image of the board, whose columns are in reverse order.
+
+        Returns
+        ----------
+        int
+            position key of the mirrored position
+        """
+        key = self.position_key()
+        column_mask = (1 << self._column_height) - 1
+        mirrored = 0
+        for _ in range(self.columns):
+            mirrored = mirrored << self._column_height | key & column_mask
+            key >>= self._column_height
+        return mirrored
+
+    def canonical_key(self) -> int:
+        """
+        Position key shared by the position and its mirror image, which have the same value.
+
+        Caches keyed by it hold half as many positions. Moves are mapped between the orientation of the board and the
+        canonical one by ``canonical_column``.
+
+        Returns
+        ----------
+        int
+            smallest of the position key and of the mirrored position key
+        """
+        return min(self.position_key(), self.mirror_key())
+
+    def is_canonical(self) -> bool:
+        """
+        Whether the board is in the canonical orientation, i.e. its position key is the canonical key.
+
+        Returns
+        ----------
+        bool
+            False if the canonical orientation is the mirror image of the board
+        """
+        return self.position_key() <= self.mirror_key()
+
+    def mirror_column(self, column_index: int) -> int:
+        """
+        Column of the mirror image of the board matching a column.
+
+        Parameters
+        ----------
+        column_index: int
+            Column index
+
+        Returns
+        ----------
+        int
+            mirrored column index
+        """
+        return self.columns - 1 - column_index
+
+    def canonical_column(self, column_index: int) -> int:
+        """
+        Map a column between the orientation of the board and the canonical orientation, in either direction.
+
+        Parameters
+        ----------
+        column_index: int
+            Column index
+
+        Returns
+        ----------
+        int
+            the column itself if the board is canonical, the mirrored column otherwise
+        """
+        return column_index if self.is_canonical() else self.mirror_column(column_index)
+
+    def cell(self, row: int, column_index: int) -> Connect4DiskColour:
+        """
+        Colour of the disk in a cell.
+
+        Parameters
+        ----------
+        row: int
+            Row index
+        column_index: int
+            Column index
+
+        Returns
+        ----------
+        Connect4DiskColour
+            Colour of the disk, invalid if the cell is empty
+        """
+        return _CELL_COLOURS[self._cells[column_index * self._column_height + row]]
 
     def disks_in_column(self, column_index: int) -> int:
         """
@@ -138,7 +483,7 @@ class Connect4Board:
         int
             Number of disks in column
         """
-        return len([disk for disk in self._disks if disk.column == column_index])
+        return self._heights[column_index]
 
     def available_columns(self) -> List[int]:
         """
@@ -149,24 +494,39 @@ class Connect4Board:
         List[int]
             list of the available column indices
         """
-        disks_per_column = [self.disks_in_column(col_idx) for col_idx in range(self.columns)]
-        return [column_idx for column_idx, disks in enumerate(disks_per_column) if disks < self.rows]
+        return [column_idx for column_idx, height in enumerate(self._heights) if height < self.rows]
 
-    def _disks_by_colour(self, colour: Connect4DiskColour) -> List[Connect4Disk]:
+    def _connected_disks(self, disk: Connect4Disk, shift: int) -> List[Connect4Disk]:
         """
-        Filter inserted disks by colour.
+        Find disks connected to a given one along the direction of a bit shift.
+
+        The given disk is considered to be on the board, whether it has been inserted or not.
 
         Parameters
         ----------
-        colour: Connect4DiskColour
-            colour
+        disk: Connect4Disk
+            the disk
+        shift: int
+            bit shift between two consecutive cells of the direction
 
         Returns
         ----------
         List[Connect4Disk]
-            list of inserted disks matching the colour
+            list of connected disks, including the given one
         """
-        return [d for d in self._disks if d.colour == colour]
+        index = self._bit_index(disk.row, disk.column)
+        cells, value = self._cells, _CELL_COLOURS.index(disk.colour)
+        first = index
+        while first - shift >= 0 and cells[first - shift] == value:
+            first -= shift
+        last = index
+        while last + shift < len(cells) and cells[last + shift] == value:
+            last += shift
+        connected = []
+        for idx in range(first, last + 1, shift):
+            column, row = divmod(idx, self._column_height)
+            connected.append(Connect4Disk(row, column, disk.colour))
+        return connected
 
     def _horizontally_connected_disks(self, disk: Connect4Disk) -> List[Connect4Disk]:
         """
@@ -182,9 +542,7 @@ class Connect4Board:
         List[Connect4Disk]
             list of horizontally connected disks
         """
-        disks_same_row = {d for d in self._disks_by_colour(disk.colour) if d.row == disk.row}
-        disks_same_row.add(disk)
-        return consecutive_elements(disks_same_row, disk, lambda x: x.column)
+        return self._connected_disks(disk, self._shifts[1])
 
     def _vertically_connected_disks(self, disk: Connect4Disk) -> List[Connect4Disk]:
         """
@@ -200,9 +558,7 @@ class Connect4Board:
         List[Connect4Disk]
             list of vertically connected disks
         """
-        disks_same_column = {d for d in self._disks_by_colour(disk.colour) if d.column == disk.column}
-        disks_same_column.add(disk)
-        return consecutive_elements(disks_same_column, disk, lambda x: x.row)
+        return self._connected_disks(disk, self._shifts[0])
 
     def _diagonally_connected_disks(self, disk: Connect4Disk) -> Tuple[List[Connect4Disk], List[Connect4Disk]]:
         """
@@ -218,22 +574,7 @@ class Connect4Board:
         Tuple[List[Connect4Disk], List[Connect4Disk]]
             connected disks on the two diagonal directions
         """
-        # Ordering function used to order disks on the diagonal
-        def diagonal_order_fun(d1: Connect4Disk, d2: Connect4Disk) -> int:
-            return int(round(disk_distance(d1, d2) / np.sqrt(2)))
-
-        # First diagonal
-        disks_diag1 = {d for d in self._disks_by_colour(disk.colour) if (d.row - disk.row) == (d.column - disk.column)}
-        disks_diag1.add(disk)
-        bottom_diag1_disk = Connect4Disk(0, disk.column - disk.row, Connect4DiskColour.invalid)
-        diag1_connections = consecutive_elements(disks_diag1, disk, lambda x: diagonal_order_fun(x, bottom_diag1_disk))
-
-        # Second diagonal
-        disks_diag2 = {d for d in self._disks_by_colour(disk.colour) if (d.row - disk.row) == -(d.column - disk.column)}
-        disks_diag2.add(disk)
-        bottom_diag2_disk = Connect4Disk(0, disk.column + disk.row, Connect4DiskColour.invalid)
-        diag2_connections = consecutive_elements(disks_diag2, disk, lambda x: diagonal_order_fun(x, bottom_diag2_disk))
-        return diag1_connections, diag2_connections
+        return self._connected_disks(disk, self._shifts[2]), self._connected_disks(disk, self._shifts[3])
 
     def max_num_connected_disks(self, disk: Connect4Disk) -> int:
         """
@@ -249,24 +590,276 @@ class Connect4Board:
         int
             max number of connected disks, including the current one
         """
-        horizontal_connections = self._horizontally_connected_disks(disk)
-        vertical_connections = self._vertically_connected_disks(disk)
-        diagonal1_connections, diagonal2_connections = self._diagonally_connected_disks(disk)
-        logging.debug(
-            f"Connections for: {disk}, vertical: {len(vertical_connections)}, "
-            f"horizontal: {len(horizontal_connections)},"
-            f"diagonal: {len(diagonal1_connections)}, {len(diagonal2_connections)}",
-        )
+        value = _CELL_COLOURS.index(disk.colour)
+        if not value:
+            return 1
+        return self._max_connected(self._bit_index(disk.row, disk.column), value, max(self.rows, self.columns))
 
-        return max(
-            len(connections)
-            for connections in [
-                horizontal_connections,
-                vertical_connections,
-                diagonal1_connections,
-                diagonal2_connections,
-            ]
-        )
+    def _max_connected(self, index: int, value: int, limit: int) -> int:
+        """
+        Max number of connected disks through a cell, the cell included, counted up to a limit.
+
+        Only the cells within ``limit - 1`` steps of the cell are read, whatever the size of the board.
+
+        Parameters
+        ----------
+        index: int
+            bit index of the cell
+        value: int
+            cell value of the disks: 1 for red, 2 for yellow
+        limit: int
+            connections are not counted beyond this number
+
+        Returns
+        ----------
+        int
+            max number of connected disks, at most the limit
+        """
+        cells = self._cells
+        size = len(cells)
+        max_connections = 1
+        for shift in self._shifts:
+            connections = 1
+            idx = index + shift
+            while idx < size and cells[idx] == value and connections < limit:
+                connections += 1
+                idx += shift
+            idx = index - shift
+            while idx >= 0 and cells[idx] == value and connections < limit:
+                connections += 1
+                idx -= shift
+            if connections > max_connections:
+                if connections >= limit:
+                    return limit
+                max_connections = connections
+        return max_connections
+
+    def connections_after(self, colour: Connect4DiskColour, column_index: int) -> int:
+        """
+        Max number of connected disks if a disk was inserted in a column, without inserting it or building disks.
+
+        Connections are counted up to ``connect``, in time bounded by ``connect`` whatever the size of the board.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour of the disk
+        column_index: int
+            Column where the disk would be inserted
+
+        Returns
+        ----------
+        int
+            max number of connected disks, including the new one, at most ``connect``
+        """
+        row = self._heights[column_index]
+        if row >= self.rows:
+            raise Connect4InvalidMove("Column is full", Connect4Disk(row, column_index, colour))
+        value = 1 if colour is Connect4DiskColour.red else 2
+        return self._max_connected(column_index * self._column_height + row, value, self.connect)
+
+    def wins_after(self, disk: Connect4Disk) -> bool:
+        """
+        True if a disk connects ``connect`` disks, whether it has been inserted or not.
+
+        Only the cells within ``connect - 1`` steps of the disk are read, and nothing is allocated.
+
+        Parameters
+        ----------
+        disk: Connect4Disk
+            the disk
+
+        Returns
+        ----------
+        bool
+            True if the disk wins the game
+        """
+        value = _CELL_COLOURS.index(disk.colour)
+        return bool(value) and self._wins_at(self._bit_index(disk.row, disk.column), value)
+
+    def is_winning_move(self, colour: Connect4DiskColour, column_index: int) -> bool:
+        """
+        True if inserting a disk in a column would win the game, without inserting it.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour of the disk
+        column_index: int
+            Column where the disk would be inserted
+
+        Returns
+        ----------
+        bool
+            True if the move wins the game
+        """
+        row = self._heights[column_index]
+        if row >= self.rows:
+            raise Connect4InvalidMove("Column is full", Connect4Disk(row, column_index, colour))
+        value = 1 if colour is Connect4DiskColour.red else 2
+        return self._wins_at(column_index * self._column_height + row, value)
+
+    def _wins_at(self, index: int, value: int) -> bool:
+        """
+        True if a disk in a cell connects ``connect`` disks, walking outwards from the cell.
+
+        Parameters
+        ----------
+        index: int
+            bit index of the cell
+        value: int
+            cell value of the disk: 1 for red, 2 for yellow
+
+        Returns
+        ----------
+        bool
+            True if the disk wins the game
+        """
+        cells = self._cells
+        size = len(cells)
+        needed = self.connect - 1
+        if needed <= 0:
+            return True
+        for shift in self._shifts:
+            connections = 0
+            idx = index + shift
+            while idx < size and cells[idx] == value:
+                connections += 1
+                if connections == needed:
+                    return True
+                idx += shift
+            idx = index - shift
+            while idx >= 0 and cells[idx] == value:
+                connections += 1
+                if connections == needed:
+                    return True
+                idx -= shift
+        return False
+
+    def has_connected(self, colour: Connect4DiskColour, num_disks: Optional[int] = None) -> bool:
+        """
+        True if the board holds at least a given number of connected disks of a colour.
+
+        The whole board is checked at once by shifting and masking the colour bitboard, with a number of shifts
+        logarithmic in the number of disks.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            colour
+        num_disks: Optional[int]
+            number of connected disks to look for. None for ``connect``
+
+        Returns
+        ----------
+        bool
+            True if there are enough connected disks in any direction
+        """
+        if num_disks is None:
+            num_disks = self.connect
+        mask = self._colour_mask(colour)
+        for shift in self._shifts:
+            # Bits starting a run of ``length`` disks, doubling the length while it fits
+            connected, length = mask, 1
+            while 2 * length <= num_disks:
+                connected &= connected >> (length * shift)
+                length *= 2
+            if length < num_disks:
+                connected &= connected >> ((num_disks - length) * shift)
+            if connected:
+                return True
+        return False
+
+    @staticmethod
+    def _colour_index(colour: Connect4DiskColour) -> int:
+        """
+        Index of a colour in the evaluation state.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            red or yellow
+
+        Returns
+        ----------
+        int
+            0 for red, 1 for yellow
+        """
+        return 0 if colour is Connect4DiskColour.red else 1
+
+    def open_lines(self, colour: Connect4DiskColour, num_disks: int) -> int:
+        """
+        Number of lines of ``connect`` cells holding a given number of disks of a colour and none of the opponent.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            red or yellow
+        num_disks: int
+            number of disks of the colour in the line
+
+        Returns
+        ----------
+        int
+            number of open lines
+        """
+        self._evaluate()
+        return self._open_windows[self._colour_index(colour)][num_disks]
+
+    def live_lines(self, colour: Connect4DiskColour) -> int:
+        """
+        Number of lines of ``connect`` cells where a colour can still win and already has disks.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            red or yellow
+
+        Returns
+        ----------
+        int
+            number of live lines
+        """
+        self._evaluate()
+        return sum(self._open_windows[self._colour_index(colour)][1:])
+
+    def threats(self, colour: Connect4DiskColour) -> List[Tuple[int, int]]:
+        """
+        Empty cells where a disk of a colour would complete a line of ``connect``.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            red or yellow
+
+        Returns
+        ----------
+        List[Tuple[int, int]]
+            row and column of every threat
+        """
+        self._evaluate()
+        return sorted(divmod(index, self._column_height)[::-1] for index in self._threats[self._colour_index(colour)])
+
+    def heuristic_score(self, colour: Connect4DiskColour) -> float:
+        """
+        Heuristic score of the position for a colour, from the open lines of both colours.
+
+        A line with n disks weighs 4^(n-1); the opponent's lines count negatively.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            red or yellow
+
+        Returns
+        ----------
+        float
+            score, positive when the position favours the colour
+        """
+        self._evaluate()
+        colour_idx = self._colour_index(colour)
+        own, opponent = self._open_windows[colour_idx], self._open_windows[1 - colour_idx]
+        return float(sum(4 ** (n - 1) * (own[n] - opponent[n]) for n in range(1, self._window_length)))
 
     def insert_disk(self, colour: Connect4DiskColour, column_index: int) -> Connect4Disk:
         """
@@ -284,14 +877,186 @@ class Connect4Board:
         Connect4Disk
             Inserted disk
         """
-        disks_in_col = self.disks_in_column(column_index)
-        new_disk = Connect4Disk(disks_in_col, column_index, colour)
-        if disks_in_col >= self.rows:
-            raise Connect4InvalidMove("Column is full", new_disk)
-        if column_index >= self.columns:
-            raise Connect4InvalidMove("Invalid column", new_disk)
-        self._disks.append(new_disk)
-        return new_disk
+        return Connect4Disk(
+            self._insert(self._checked_colour_index(colour, column_index), column_index), column_index, colour
+        )
+
+    def push_move(self, colour: Connect4DiskColour, column_index: int) -> int:
+        """
+        Insert disk in the board without building a ``Connect4Disk``: the fast path of ``insert_disk``.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour of the disk
+        column_index: int
+            Column where to insert the disk
+
+        Returns
+        ----------
+        int
+            Row of the inserted disk
+        """
+        return self._insert(self._checked_colour_index(colour, column_index), column_index)
+
+    def _checked_colour_index(self, colour: Connect4DiskColour, column_index: int) -> int:
+        """
+        Check that a disk can be inserted in a column.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour of the disk
+        column_index: int
+            Column where to insert the disk
+
+        Returns
+        ----------
+        int
+            colour index of the disk: 0 for red, 1 for yellow
+        """
+        if not 0 <= column_index < self.columns:
+            raise Connect4InvalidMove("Invalid column", Connect4Disk(0, column_index, colour))
+        if self._heights[column_index] >= self.rows:
+            raise Connect4InvalidMove("Column is full", Connect4Disk(self._heights[column_index], column_index, colour))
+        if colour is Connect4DiskColour.red:
+            return 0
+        if colour is Connect4DiskColour.yellow:
+            return 1
+        raise Connect4InvalidMove("Invalid colour", Connect4Disk(self._heights[column_index], column_index, colour))
+
+    def _insert(self, colour_idx: int, column_index: int) -> int:
+        """
+        Insert disk in a column which is not full.
+
+        Parameters
+        ----------
+        colour_idx: int
+            colour index of the disk: 0 for red, 1 for yellow
+        column_index: int
+            Column where to insert the disk
+
+        Returns
+        ----------
+        int
+            Row of the inserted disk
+        """
+        row = self._heights[column_index]
+        index = column_index * self._column_height + row
+        if colour_idx:
+            self._yellow_mask |= 1 << index
+        else:
+            self._red_mask |= 1 << index
+        self._cells[index] = colour_idx + 1
+        if self._evaluated:
+            self._update_windows(index, colour_idx, 1)
+        self._heights[column_index] = row + 1
+        self._num_disks += 1
+        self._moves.append(column_index)
+        return row
+
+    def _remove_top_disk(self, column_index: int) -> int:
+        """
+        Remove the topmost disk of a column, leaving the move history untouched.
+
+        Parameters
+        ----------
+        column_index: int
+            Column where to remove the disk from
+
+        Returns
+        ----------
+        int
+            colour index of the removed disk: 0 for red, 1 for yellow
+        """
+        row = self._heights[column_index] - 1
+        index = column_index * self._column_height + row
+        colour_idx = self._cells[index] - 1
+        if colour_idx:
+            self._yellow_mask ^= 1 << index
+        else:
+            self._red_mask ^= 1 << index
+        self._cells[index] = 0
+        if self._evaluated:
+            self._update_windows(index, colour_idx, -1)
+        self._heights[column_index] = row
+        self._num_disks -= 1
+        return colour_idx
+
+    def _removed_disk(self, column_index: int, colour_idx: int) -> Connect4Disk:
+        """
+        Disk just removed from the top of a column.
+
+        Parameters
+        ----------
+        column_index: int
+            Column the disk was removed from
+        colour_idx: int
+            colour index of the disk: 0 for red, 1 for yellow
+
+        Returns
+        ----------
+        Connect4Disk
+            Removed disk
+        """
+        colour = Connect4DiskColour.yellow if colour_idx else Connect4DiskColour.red
+        return Connect4Disk(self._heights[column_index], column_index, colour)
+
+    def undo_last(self) -> Connect4Disk:
+        """
+        Remove the last inserted disk from the board.
+
+        Returns
+        ----------
+        Connect4Disk
+            Removed disk
+        """
+        if not self._moves:
+            raise Connect4InvalidMove("Board is empty", Connect4Disk(-1, -1, Connect4DiskColour.invalid))
+        column_index = self._moves.pop()
+        return self._removed_disk(column_index, self._remove_top_disk(column_index))
+
+    def pop_move(self) -> int:
+        """
+        Remove the last inserted disk without building a ``Connect4Disk``: the fast path of ``undo_last``.
+
+        Returns
+        ----------
+        int
+            Column of the removed disk
+        """
+        if not self._moves:
+            raise Connect4InvalidMove("Board is empty", Connect4Disk(-1, -1, Connect4DiskColour.invalid))
+        column_index = self._moves.pop()
+        self._remove_top_disk(column_index)
+        return column_index
+
+    def pop_disk(self, column_index: int) -> Connect4Disk:
+        """
+        Remove the topmost disk of a column.
+
+        The most recent move in that column is dropped from the move history.
+
+        Parameters
+        ----------
+        column_index: int
+            Column where to remove the disk from
+
+        Returns
+        ----------
+        Connect4Disk
+            Removed disk
+        """
+        if not 0 <= column_index < self.columns:
+            raise Connect4InvalidMove("Invalid column", Connect4Disk(-1, column_index, Connect4DiskColour.invalid))
+        if self._heights[column_index] == 0:
+            raise Connect4InvalidMove("Column is empty", Connect4Disk(-1, column_index, Connect4DiskColour.invalid))
+        if self._moves[-1] == column_index:
+            self._moves.pop()
+        else:
+            last_move_idx = len(self._moves) - 1 - self._moves[::-1].index(column_index)
+            del self._moves[last_move_idx]
+        return self._removed_disk(column_index, self._remove_top_disk(column_index))
 
     def is_full(self) -> bool:
         """
@@ -302,18 +1067,148 @@ class Connect4Board:
         bool
             True if full
         """
-        return len(self) >= self.rows * self.columns
+        return self._num_disks >= self.rows * self.columns
 
-    def as_matrix(self) -> npt.NDArray[np.int_]:
+    def as_matrix(self, dtype: "npt.DTypeLike" = int) -> "npt.NDArray[np.int_]":
         """
         Returns the matrix representation of the board.
 
+        NumPy is imported on the first call, so that boards can be used without it.
+
+        Parameters
+        ----------
+        dtype: npt.DTypeLike
+            data type of the matrix, e.g. ``np.int8`` to save memory
+
         Returns
         ----------
         npt.NDArray[int]
             Matrix representing the board
         """
-        mat = np.full((self.rows, self.columns), Connect4DiskColour.invalid.value)
-        for disk in self._disks:
-            mat[disk.row, disk.column] = disk.colour.value
+        import numpy as np
+
+        mat = np.full((self.rows, self.columns), Connect4DiskColour.invalid.value, dtype=dtype)
+        values = [colour.value for colour in _CELL_COLOURS]
+        for column, height in enumerate(self._heights):
+            for row in range(height):
+                mat[row, column] = values[self._cells[self._bit_index(row, column)]]
         return mat
+
+    def copy(self: Connect4BoardType) -> Connect4BoardType:
+        """
+        Independent copy of the board, including the move history and the evaluation state if it is built.
+
+        Returns
+        ----------
+        Connect4Board
+            copy of the board
+        """
+        board = self.__class__.__new__(self.__class__)
+        board.__dict__.update(self.__dict__)
+        board._heights = self._heights.copy()
+        board._cells = self._cells.copy()
+        board._moves = self._moves.copy()
+        if self._evaluated:
+            board._window_disks = (self._window_disks[0].copy(), self._window_disks[1].copy())
+            board._open_windows = (self._open_windows[0].copy(), self._open_windows[1].copy())
+            board._threats = (self._threats[0].copy(), self._threats[1].copy())
+        return board
+
+    def __copy__(self: Connect4BoardType) -> Connect4BoardType:
+        return self.copy()
+
+    def __deepcopy__(self: Connect4BoardType, memo: Dict[int, Any]) -> Connect4BoardType:
+        return self.copy()
+
+    def key(self) -> Tuple[int, int, int, int]:
+        """
+        Compact hashable key identifying the board size, the rule and the disks on the board, but not the move order.
+
+        Returns
+        ----------
+        Tuple[int, int, int, int]
+            rows, columns, number of connected disks to win and position key
+        """
+        return self.rows, self.columns, self.connect, self.position_key()
+
+    def _key_size(self) -> int:
+        """
+        Size of the position key in bytes.
+
+        Returns
+        ----------
+        int
+            number of bytes holding any position key of the board size
+        """
+        return (self.columns * self._column_height + 7) // 8
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the disks on the board, but not the move order.
+
+        The size of the result only depends on the size of the board: 6 bytes for the size and the number of connected
+        disks to win, then the position key.
+
+        Returns
+        ----------
+        bytes
+            serialized board
+        """
+        return _BYTES_HEADER.pack(self.rows, self.columns, self.connect) + self.position_key().to_bytes(
+            self._key_size(), "little"
+        )
+
+    @classmethod
+    def from_bytes(
+        cls: Type[Connect4BoardType],
+        data: bytes,
+        moves: Optional[Sequence[int]] = None,
+    ) -> Connect4BoardType:
+        """
+        Deserialize a board serialized by ``to_bytes``.
+
+        Parameters
+        ----------
+        data: bytes
+            serialized board
+        moves: Optional[Sequence[int]]
+            columns of the disks in insertion order, as in ``moves``. None to list the disks column by column
+
+        Returns
+        ----------
+        Connect4Board
+            the board
+        """
+        if len(data) < _BYTES_HEADER.size:
+            raise ValueError("Truncated board")
+        rows, columns, connect = _BYTES_HEADER.unpack_from(data)
+        board = cls(rows, columns, connect)
+        if len(data) != _BYTES_HEADER.size + board._key_size():
+            raise ValueError(f"Invalid board size: {len(data)} bytes for a {rows}x{columns} board")
+        key = int.from_bytes(data[_BYTES_HEADER.size :], "little")
+        column_mask = (1 << board._column_height) - 1
+        occupied = 0
+        for column in range(columns):
+            column_key = key >> column * board._column_height & column_mask
+            height = column_key.bit_length() - 1
+            if height < 0:
+                raise ValueError(f"Invalid column: {column}")
+            shift = column * board._column_height
+            board._red_mask |= (column_key ^ 1 << height) << shift
+            occupied |= ((1 << height) - 1) << shift
+            board._heights[column] = height
+            for row in range(height):
+                board._cells[shift + row] = 1 if column_key >> row & 1 else 2
+        board._yellow_mask = occupied ^ board._red_mask
+        board._num_disks = sum(board._heights)
+        if moves is None:
+            board._moves = [column for column in range(columns) for _ in range(board._heights[column])]
+        else:
+            if sorted(moves) != [column for column in range(columns) for _ in range(board._heights[column])]:
+                raise ValueError("The moves do not match the disks")
+            board._moves = list(moves)
+        return board
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the board as its serialized bytes and move history, without the evaluation state."""
+        return self.__class__.from_bytes, (self.to_bytes(), self.moves)
@@ -0,0 +1,184 @@
+import struct
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.player import Connect4NegamaxAI
+from connect4.transposition import Connect4TranspositionTable
+
+# Header: magic, format version, rows, columns, number of connected disks to win, number of entries
+_HEADER = struct.Struct("<4sHBBBQ")
+_MAGIC = b"C4OB"
+_VERSION = 3
+
+
+def build_opening_book(
+    max_plies: int,
+    rows: int = 6,
+    columns: int = 7,
+    max_depth: int = 8,
+    connect: int = 4,
+) -> Dict[int, Tuple[int, int]]:
+    """
+    Search the best move of every position reachable from the empty board.
+
+    The red player moves first. Positions already won are skipped. A position and its mirror image share one entry,
+    keyed by ``Connect4Board.canonical_key``, whose column is in the canonical orientation.
+
+    Parameters
+    ----------
+    max_plies: int
+        positions with up to this number of disks are searched
+    rows : int
+        number of rows
+    columns : int
+        number of columns
+    max_depth: int
+        search depth of every position, in plies
+    connect : int
+        number of connected disks to win
+
+    Returns
+    ----------
+    Dict[int, Tuple[int, int]]
+        best column and score of every position, by canonical position key
+    """
+    board = Connect4Board(rows, columns, connect)
+    table = Connect4TranspositionTable()
+    players = {
+        colour: Connect4NegamaxAI(board, colour, max_time=None, max_depth=max_depth, transposition_table=table)
+        for colour in (Connect4DiskColour.red, Connect4DiskColour.yellow)
+    }
+    entries: Dict[int, Tuple[int, int]] = {}
+
+    def visit(colour: Connect4DiskColour, opponent_colour: Connect4DiskColour) -> None:
+        key = board.canonical_key()
+        if key in entries or board.is_full():
+            return
+        player = players[colour]
+        entries[key] = (board.canonical_column(player.choose_column()), int(player.searched_score))
+        if len(board) >= max_plies:
+            return
+        for column in board.available_columns():
+            disk = board.insert_disk(colour, column)
+            if not board.wins_after(disk):
+                visit(opponent_colour, colour)
+            board.undo_last()
+
+    visit(Connect4DiskColour.red, Connect4DiskColour.yellow)
+    return entries
+
+
+def write_opening_book(
+    path: str,
+    rows: int,
+    columns: int,
+    entries: Dict[int, Tuple[int, int]],
+    connect: int = 4,
+) -> None:
+    """
+    Serialize an opening book.
+
+    The file holds a fixed-size header followed by the sorted position keys (uint64), the scores (int32) and the
+    best columns (int8), so that it can be memory-mapped and binary searched.
+
+    Parameters
+    ----------
+    path: str
+        output file
+    rows : int
+        number of rows
+    columns : int
+        number of columns
+    entries: Dict[int, Tuple[int, int]]
+        best column and score of every position, by canonical position key
+    connect : int
+        number of connected disks to win
+    """
+    if (rows + 1) * columns + 1 > 64:
+        raise ValueError("Position keys of the board do not fit in 64 bits.")
+    keys = np.array(sorted(entries), dtype=np.uint64)
+    scores = np.array([entries[int(key)][1] for key in keys], dtype=np.int32)
+    best_columns = np.array([entries[int(key)][0] for key in keys], dtype=np.int8)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, rows, columns, connect, len(keys)))
+        f.write(keys.tobytes())
+        f.write(scores.tobytes())
+        f.write(best_columns.tobytes())
+
+
+class Connect4OpeningBook:
+    """
+    Read-only opening book, memory-mapped from a file written by ``write_opening_book``.
+
+    The file is mapped read-only, so worker processes loading the same book share its pages.
+
+    Attributes
+    ----------
+    rows : int
+        number of rows
+    columns : int
+        number of columns
+    connect : int
+        number of connected disks to win
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            opening book file
+        """
+        with open(path, "rb") as f:
+            magic, version, rows, columns, connect, num_entries = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a connect-4 opening book.")
+        self.rows: int = rows
+        self.columns: int = columns
+        self.connect: int = connect
+        if num_entries == 0:
+            self._keys = np.empty(0, dtype=np.uint64)
+            self._scores = np.empty(0, dtype=np.int32)
+            self._best_columns = np.empty(0, dtype=np.int8)
+            return
+        offset = _HEADER.size
+        self._keys = np.memmap(path, dtype=np.uint64, mode="r", offset=offset, shape=(num_entries,))
+        offset += self._keys.nbytes
+        self._scores = np.memmap(path, dtype=np.int32, mode="r", offset=offset, shape=(num_entries,))
+        offset += self._scores.nbytes
+        self._best_columns = np.memmap(path, dtype=np.int8, mode="r", offset=offset, shape=(num_entries,))
+
+    def __len__(self) -> int:
+        """
+        Number of positions in the book.
+
+        Returns
+        ----------
+        int
+            Number of positions
+        """
+        return len(self._keys)
+
+    def lookup(self, board: Connect4Board) -> Optional[Tuple[int, int]]:
+        """
+        Look up the current position of a board.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board
+
+        Returns
+        ----------
+        Optional[Tuple[int, int]]
+            best column and its score, None if the position is not in the book or the board has another size or rule
+        """
+        if board.rows != self.rows or board.columns != self.columns or board.connect != self.connect:
+            return None
+        key = np.uint64(board.canonical_key())
+        idx = int(np.searchsorted(self._keys, key))
+        if idx == len(self._keys) or self._keys[idx] != key:
+            return None
+        return board.canonical_column(int(self._best_columns[idx])), int(self._scores[idx])
@@ -0,0 +1,249 @@
+import os
+from types import TracebackType
+from typing import Iterator, List, Optional, Sequence, Set, Tuple, Type
+
+import numpy as np
+import numpy.typing as npt
+
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.game import Connect4GameResult
+from connect4.record import read_games
+
+Connect4Shard = Tuple[npt.NDArray[np.int8], npt.NDArray[np.int8], npt.NDArray[np.int8]]
+
+_ARRAYS = ("positions", "colours", "outcomes")
+_OUTCOMES = {
+    Connect4GameResult.draw: Connect4DiskColour.invalid.value,
+    Connect4GameResult.red_wins: Connect4DiskColour.red.value,
+    Connect4GameResult.yellow_wins: Connect4DiskColour.yellow.value,
+}
+
+
+def _shard_path(directory: str, shard: int, name: str) -> str:
+    """
+    Path of an array of a shard.
+
+    Parameters
+    ----------
+    directory: str
+        dataset directory
+    shard: int
+        shard index
+    name: str
+        array name
+
+    Returns
+    ----------
+    str
+        path of the ``.npy`` file
+    """
+    return os.path.join(directory, f"shard-{shard:05d}-{name}.npy")
+
+
+class Connect4DatasetWriter:
+    """
+    Export of the positions of played games to memory-mapped NumPy shards, for training evaluation models
+
+    Every position where a player has to move is exported with the colour to move and the outcome of the game (colour
+    value of the winner, 0 for draws). Every shard holds three ``.npy`` arrays of up to ``shard_size`` rows:
+    ``positions`` (boards as in ``Connect4Board.as_matrix``), ``colours`` and ``outcomes``, all ``int8``. Arrays are
+    filled in place through memory maps, so the memory used does not depend on the size of the dataset.
+
+    Positions can be augmented with their mirror image, which has the same value, and deduplicated by position key:
+    only the first occurrence of a position is kept.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        rows: int,
+        columns: int,
+        shard_size: int = 2**16,
+        mirror: bool = True,
+        deduplicate: bool = True,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        directory: str
+            output directory, created if needed
+        rows : int
+            number of rows of the boards
+        columns : int
+            number of columns of the boards
+        shard_size: int
+            maximum number of positions per shard
+        mirror: bool
+            also export the mirror image of every position
+        deduplicate: bool
+            skip the positions already exported
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory: str = directory
+        self.rows: int = rows
+        self.columns: int = columns
+        self.shard_size: int = shard_size
+        self.mirror: bool = mirror
+        self.deduplicate: bool = deduplicate
+        self.num_positions: int = 0
+        self.num_shards: int = 0
+        self._seen: Set[int] = set()
+        self._arrays: List[np.memmap] = []
+        self._filled: int = 0
+
+    def _new_shard(self) -> None:
+        """Close the current shard and start a new one."""
+        self._close_shard()
+        shapes = [(self.shard_size, self.rows, self.columns), (self.shard_size,), (self.shard_size,)]
+        self._arrays = [
+            np.lib.format.open_memmap(_shard_path(self.directory, self.num_shards, name), "w+", np.int8, shape)
+            for name, shape in zip(_ARRAYS, shapes)
+        ]
+        self._filled = 0
+        self.num_shards += 1
+
+    def _close_shard(self) -> None:
+        """Flush the current shard, shrinking it to the positions it holds."""
+        arrays, self._arrays = self._arrays, []
+        for array in arrays:
+            array.flush()
+        if not arrays or self._filled == self.shard_size:
+            return
+        paths = [_shard_path(self.directory, self.num_shards - 1, name) for name in _ARRAYS]
+        for path, array in zip(paths, arrays):
+            with open(path + ".tmp", "wb") as f:
+                np.save(f, np.array(array[: self._filled]))
+        del arrays, array
+        for path in paths:
+            os.replace(path + ".tmp", path)
+
+    def _add_position(self, key: int, matrix: npt.NDArray[np.int8], colour: int, outcome: int) -> None:
+        """
+        Export a position, unless it is a duplicate.
+
+        Parameters
+        ----------
+        key: int
+            position key
+        matrix: npt.NDArray[np.int8]
+            board matrix
+        colour: int
+            colour value of the player to move
+        outcome: int
+            colour value of the winner, 0 for draws
+        """
+        if self.deduplicate:
+            if key in self._seen:
+                return
+            self._seen.add(key)
+        if not self._arrays or self._filled == self.shard_size:
+            self._new_shard()
+        positions, colours, outcomes = self._arrays
+        positions[self._filled] = matrix
+        colours[self._filled] = colour
+        outcomes[self._filled] = outcome
+        self._filled += 1
+        self.num_positions += 1
+
+    def add_game(self, moves: Sequence[int], result: Connect4GameResult) -> None:
+        """
+        Export the positions of a game.
+
+        Parameters
+        ----------
+        moves: Sequence[int]
+            columns played, the red player moving first
+        result: Connect4GameResult
+            result of the game
+        """
+        board = Connect4Board(self.rows, self.columns)
+        matrix = np.zeros((self.rows, self.columns), dtype=np.int8)
+        outcome = _OUTCOMES[result]
+        colour, opponent_colour = Connect4DiskColour.red, Connect4DiskColour.yellow
+        for column in moves:
+            self._add_position(board.position_key(), matrix, colour.value, outcome)
+            if self.mirror:
+                self._add_position(board.mirror_key(), matrix[:, ::-1], colour.value, outcome)
+            disk = board.insert_disk(colour, column)
+            matrix[disk.row, disk.column] = colour.value
+            colour, opponent_colour = opponent_colour, colour
+
+    def close(self) -> None:
+        """Flush the last shard."""
+        self._close_shard()
+
+    def __enter__(self) -> "Connect4DatasetWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def export_records(
+    record_path: str,
+    directory: str,
+    shard_size: int = 2**16,
+    mirror: bool = True,
+    deduplicate: bool = True,
+) -> Connect4DatasetWriter:
+    """
+    Export the positions of the games of a record file, streaming through it.
+
+    Parameters
+    ----------
+    record_path: str
+        game record file, see ``Connect4GameWriter``
+    directory: str
+        output directory, created if needed
+    shard_size: int
+        maximum number of positions per shard
+    mirror: bool
+        also export the mirror image of every position
+    deduplicate: bool
+        skip the positions already exported
+
+    Returns
+    ----------
+    Connect4DatasetWriter
+        the closed writer, with the number of positions and shards exported
+    """
+    writer = None
+    try:
+        for record in read_games(record_path):
+            if writer is None:
+                writer = Connect4DatasetWriter(
+                    directory, record.rows, record.columns, shard_size, mirror=mirror, deduplicate=deduplicate
+                )
+            writer.add_game(record.moves, record.result)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError(f"No games in {record_path}")
+    return writer
+
+
+def load_shards(directory: str) -> Iterator[Connect4Shard]:
+    """
+    Iterate over the shards of an exported dataset, memory-mapped read-only.
+
+    Parameters
+    ----------
+    directory: str
+        dataset directory
+
+    Yields
+    ----------
+    Connect4Shard
+        positions, colours to move and outcomes of every shard, in order
+    """
+    shard = 0
+    while os.path.exists(_shard_path(directory, shard, _ARRAYS[0])):
+        positions, colours, outcomes = (np.load(_shard_path(directory, shard, name), mmap_mode="r") for name in _ARRAYS)
+        yield positions, colours, outcomes
+        shard += 1
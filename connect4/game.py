@@ -1,10 +1,17 @@
+import time
+from concurrent.futures import Executor
 from enum import Enum, auto
 from itertools import cycle
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from connect4.artist import Connect4Artist
 from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.instrumentation import Connect4GameObserver, Connect4MoveEvent
 from connect4.player import Connect4Player
 
+if TYPE_CHECKING:
+    from connect4.record import Connect4GameWriter
+
 
 class Connect4GameResult(Enum):
     """The connect-4 game result"""
@@ -32,6 +39,12 @@ class Connect4Game:
         player using red disks
     artist : Connect4Artist
         artist used to draw the board
+    recorder : Optional[Connect4GameWriter]
+        writer fed with the moves and the result of the game
+    observers : Sequence[Connect4GameObserver]
+        event sinks notified of the moves and of their timings
+    move_timeout : Optional[float]
+        time allowed to every player to choose a move, in seconds
     """
 
     def __init__(
@@ -40,6 +53,9 @@ class Connect4Game:
         yellow_player: Connect4Player,
         red_player: Connect4Player,
         artist: Connect4Artist,
+        recorder: Optional["Connect4GameWriter"] = None,
+        observers: Sequence[Connect4GameObserver] = (),
+        move_timeout: Optional[float] = None,
     ) -> None:
         """
         Parameters
@@ -52,6 +68,13 @@ class Connect4Game:
             player using red disks
         artist : Connect4Artist
             artist used to draw the board
+        recorder : Optional[Connect4GameWriter]
+            writer fed with the moves and the result of the game. None not to record it
+        observers : Sequence[Connect4GameObserver]
+            event sinks notified of the moves and of their timings, e.g. a ``Connect4MetricsCollector``
+        move_timeout : Optional[float]
+            time allowed to every player to choose a move, in seconds, after which the player plays its best move so
+            far or a fallback move. None for no limit
         """
         self.board: Connect4Board = board
         self.yellow_player: Connect4Player = yellow_player
@@ -59,29 +82,169 @@ class Connect4Game:
         if not yellow_player.colour == Connect4DiskColour.yellow or not red_player.colour == Connect4DiskColour.red:
             raise Connect4InvalidGame("Wrong color configuration")
         self.artist: Connect4Artist = artist
+        self.recorder: Optional["Connect4GameWriter"] = recorder
+        self.observers: Sequence[Connect4GameObserver] = observers
+        self.move_timeout: Optional[float] = move_timeout
 
     def play(self) -> Connect4GameResult:
         """
         Play the connect-4 game.
 
-        The red player moves first.
+        The red player moves first. With a move timeout, the game is played by ``play_async`` in a new event loop.
 
         Returns
         ----------
         Connect4GameResult
             The result of the game
         """
-        self.artist.draw()
+        if self.move_timeout is not None:
+            import asyncio
+
+            return asyncio.run(self.play_async())
+        self._start()
+        result = Connect4GameResult.draw
         player_cycle = cycle([self.red_player, self.yellow_player])
-        while not self.board.is_full():
+        while not self.board.is_full() and result == Connect4GameResult.draw:
             curr_player = next(player_cycle)
+            self._notify_move_started(curr_player)
+            start = time.perf_counter()
             chosen_column = curr_player.choose_column()
-            disk = self.board.insert_disk(curr_player.colour, chosen_column)
+            result = self._play_column(curr_player, chosen_column, time.perf_counter() - start)
+        return self._end(result)
+
+    async def play_async(self, executor: Optional[Executor] = None) -> Connect4GameResult:
+        """
+        Play the connect-4 game in an asyncio event loop, alongside other games.
+
+        Moves are chosen by ``Connect4Player.choose_column_async``, so that the event loop is not blocked while a
+        player thinks, within the move timeout. The red player moves first.
+
+        Parameters
+        ----------
+        executor: Optional[Executor]
+            executor running the synchronous ``choose_column`` of the players. None for the default executor of the
+            event loop
+
+        Returns
+        ----------
+        Connect4GameResult
+            The result of the game
+        """
+        self._start()
+        result = Connect4GameResult.draw
+        player_cycle = cycle([self.red_player, self.yellow_player])
+        while not self.board.is_full() and result == Connect4GameResult.draw:
+            curr_player = next(player_cycle)
+            self._notify_move_started(curr_player)
+            start = time.perf_counter()
+            chosen_column = await curr_player.choose_column_async(executor, self.move_timeout)
+            result = self._play_column(curr_player, chosen_column, time.perf_counter() - start)
+        return self._end(result)
+
+    def _start(self) -> None:
+        """Notify the observers and draw the empty board."""
+        for observer in self.observers:
+            observer.game_started(self)
+        self.artist.draw()
+
+    def _notify_move_started(self, player: Connect4Player) -> None:
+        """
+        Notify the observers that a player is about to choose a move.
+
+        Parameters
+        ----------
+        player: Connect4Player
+            player to move
+        """
+        for observer in self.observers:
+            observer.move_started(player.colour, len(self.board))
+
+    def _play_column(self, player: Connect4Player, column: int, choose_time: float) -> Connect4GameResult:
+        """
+        Insert the disk chosen by a player, draw it and check whether it wins.
+
+        Parameters
+        ----------
+        player: Connect4Player
+            player who moved
+        column: int
+            column chosen by the player
+        choose_time: float
+            time spent by the player choosing the column, in seconds
+
+        Returns
+        ----------
+        Connect4GameResult
+            the winner, draw if the game goes on or ends in a draw
+        """
+        if not self.observers:
+            disk = self.board.insert_disk(player.colour, column)
+            if self.recorder is not None:
+                self.recorder.add_move(column)
             self.artist.draw()
-            if self.board.max_num_connected_disks(disk) >= 4:
-                self.artist.draw_gameover(curr_player.colour)
-                if curr_player.colour == Connect4DiskColour.red:
-                    return Connect4GameResult.red_wins
-                elif curr_player.colour == Connect4DiskColour.yellow:
-                    return Connect4GameResult.yellow_wins
-        return Connect4GameResult.draw
+            if self.board.wins_after(disk):
+                return self._game_over(player)
+            return Connect4GameResult.draw
+
+        ply = len(self.board)
+        start = time.perf_counter()
+        disk = self.board.insert_disk(player.colour, column)
+        inserted = time.perf_counter()
+        if self.recorder is not None:
+            self.recorder.add_move(column)
+        recorded = time.perf_counter()
+        self.artist.draw()
+        drawn = time.perf_counter()
+        wins = self.board.wins_after(disk)
+        checked = time.perf_counter()
+        event = Connect4MoveEvent(
+            player.colour,
+            column,
+            ply,
+            choose_time=choose_time,
+            insert_time=inserted - start,
+            win_check_time=checked - drawn,
+            draw_time=drawn - recorded,
+        )
+        for observer in self.observers:
+            observer.move_ended(event)
+        return self._game_over(player) if wins else Connect4GameResult.draw
+
+    def _game_over(self, winner: Connect4Player) -> Connect4GameResult:
+        """
+        Draw the end of the game.
+
+        Parameters
+        ----------
+        winner: Connect4Player
+            player who won
+
+        Returns
+        ----------
+        Connect4GameResult
+            the result of the game
+        """
+        self.artist.draw_gameover(winner.colour)
+        if winner.colour == Connect4DiskColour.red:
+            return Connect4GameResult.red_wins
+        return Connect4GameResult.yellow_wins
+
+    def _end(self, result: Connect4GameResult) -> Connect4GameResult:
+        """
+        Record the game and notify the observers of its end.
+
+        Parameters
+        ----------
+        result: Connect4GameResult
+            the result of the game
+
+        Returns
+        ----------
+        Connect4GameResult
+            the result of the game
+        """
+        if self.recorder is not None:
+            self.recorder.end_game(result)
+        for observer in self.observers:
+            observer.game_ended(result, len(self.board))
+        return result
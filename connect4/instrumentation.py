@@ -0,0 +1,270 @@
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict
+
+from connect4.board import Connect4DiskColour
+
+if TYPE_CHECKING:
+    from connect4.game import Connect4Game, Connect4GameResult
+
+# Histogram buckets per doubling of the duration: quantiles are within 2**(1/8) - 1, about 9%, of the exact ones
+_BUCKETS_PER_OCTAVE = 8
+_SMALLEST_DURATION = 1e-9
+
+
+@dataclass(frozen=True)
+class Connect4MoveEvent:
+    """
+    Timings of a move of a game, in seconds
+
+    Attributes
+    ----------
+    colour : Connect4DiskColour
+        colour of the player who moved
+    column : int
+        column played
+    ply : int
+        number of disks on the board before the move
+    choose_time : float
+        time spent in ``choose_column`` by the player
+    insert_time : float
+        time spent inserting the disk in the board
+    win_check_time : float
+        time spent checking whether the move wins
+    draw_time : float
+        time spent drawing the board
+    """
+
+    colour: Connect4DiskColour
+    column: int
+    ply: int
+    choose_time: float
+    insert_time: float
+    win_check_time: float
+    draw_time: float
+
+    @property
+    def total_time(self) -> float:
+        """Time spent on the whole move."""
+        return self.choose_time + self.insert_time + self.win_check_time + self.draw_time
+
+
+class Connect4GameObserver:
+    """
+    Event sink of ``Connect4Game.play``, notified at the start and the end of the game and of every move
+
+    Methods do nothing by default: observers override the events they need.
+    """
+
+    def game_started(self, game: "Connect4Game") -> None:
+        """
+        The game is starting.
+
+        Parameters
+        ----------
+        game: Connect4Game
+            the game
+        """
+
+    def move_started(self, colour: Connect4DiskColour, ply: int) -> None:
+        """
+        A player is about to choose a move.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            colour of the player
+        ply: int
+            number of disks on the board
+        """
+
+    def move_ended(self, event: Connect4MoveEvent) -> None:
+        """
+        A move has been played and drawn.
+
+        Parameters
+        ----------
+        event: Connect4MoveEvent
+            the move and its timings
+        """
+
+    def game_ended(self, result: "Connect4GameResult", num_moves: int) -> None:
+        """
+        The game is over.
+
+        Parameters
+        ----------
+        result: Connect4GameResult
+            result of the game
+        num_moves: int
+            number of moves played
+        """
+
+
+class Connect4Histogram:
+    """
+    Histogram of durations with logarithmic buckets
+
+    The memory used does not depend on the number of durations, and quantiles are estimated within about 9%.
+
+    Attributes
+    ----------
+    count : int
+        number of durations
+    total : float
+        sum of the durations, in seconds
+    max : float
+        largest duration, in seconds
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    @staticmethod
+    def _bucket(duration: float) -> int:
+        """
+        Bucket of a duration.
+
+        Parameters
+        ----------
+        duration: float
+            duration, in seconds
+
+        Returns
+        ----------
+        int
+            bucket index
+        """
+        if duration <= _SMALLEST_DURATION:
+            return 0
+        return math.ceil(math.log2(duration / _SMALLEST_DURATION) * _BUCKETS_PER_OCTAVE)
+
+    def add(self, duration: float) -> None:
+        """
+        Add a duration.
+
+        Parameters
+        ----------
+        duration: float
+            duration, in seconds
+        """
+        bucket = self._bucket(duration)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def merge(self, other: "Connect4Histogram") -> None:
+        """
+        Add the durations of another histogram.
+
+        Parameters
+        ----------
+        other: Connect4Histogram
+            other histogram
+        """
+        for bucket, count in other._buckets.items():
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """Mean duration, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the durations.
+
+        Parameters
+        ----------
+        q: float
+            quantile, between 0 and 1, e.g. 0.99 for the 99th percentile
+
+        Returns
+        ----------
+        float
+            upper bound of the bucket holding the quantile, in seconds
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(self.max, _SMALLEST_DURATION * 2 ** (bucket / _BUCKETS_PER_OCTAVE))
+        return self.max
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Machine-readable summary of the durations.
+
+        Returns
+        ----------
+        Dict[str, float]
+            summary of the durations
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class Connect4MetricsCollector(Connect4GameObserver):
+    """
+    Observer aggregating the timings of the moves of any number of games
+
+    Histograms are kept for the time spent by every colour in ``choose_column``, and by the board (insertion and win
+    check), the artist and the whole move. Counters are kept for the games, the moves and every result.
+
+    Attributes
+    ----------
+    histograms : Dict[str, Connect4Histogram]
+        histograms of the durations, by name
+    counters : Dict[str, int]
+        counters, by name
+    """
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, Connect4Histogram] = {
+            name: Connect4Histogram()
+            for name in ("choose_column.red", "choose_column.yellow", "insert", "win_check", "draw", "move")
+        }
+        self.counters: Dict[str, int] = {name: 0 for name in ("games", "moves", "red_wins", "yellow_wins", "draw")}
+
+    def game_started(self, game: "Connect4Game") -> None:
+        self.counters["games"] += 1
+
+    def move_ended(self, event: Connect4MoveEvent) -> None:
+        self.counters["moves"] += 1
+        self.histograms[f"choose_column.{event.colour.name}"].add(event.choose_time)
+        self.histograms["insert"].add(event.insert_time)
+        self.histograms["win_check"].add(event.win_check_time)
+        self.histograms["draw"].add(event.draw_time)
+        self.histograms["move"].add(event.total_time)
+
+    def game_ended(self, result: "Connect4GameResult", num_moves: int) -> None:
+        self.counters[result.name] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Machine-readable export of the counters and histograms.
+
+        Returns
+        ----------
+        Dict[str, Any]
+            counters, and count, mean, p50, p99 and max of every histogram
+        """
+        return {
+            "counters": dict(self.counters),
+            "histograms": {name: histogram.as_dict() for name, histogram in self.histograms.items()},
+        }
@@ -1,9 +1,46 @@
+import math
+import random
+import time
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, wait
 from random import randrange
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, TypeVar
 
-import numpy as np
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.transposition import Connect4Bound, Connect4TranspositionTable
 
-from connect4.board import Connect4Board, Connect4Disk, Connect4DiskColour
+if TYPE_CHECKING:
+    # Imported on first use, like asyncio: worker processes playing synchronous games do not pay for them
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.synchronize import Event
+
+    from connect4.book import Connect4OpeningBook
+
+Connect4PooledPlayerType = TypeVar("Connect4PooledPlayerType", bound="_Connect4PooledPlayer")
+
+# Interval at which a player waiting for its workers checks whether it is interrupted, in seconds
+_POLL_INTERVAL = 0.01
+# Size of the transposition table of every root move searched in a worker process
+_WORKER_TABLE_SIZE = 2**14
+# Number of nodes between two checks of the stop event by the searches of the worker processes
+_STOP_CHECK_NODES = 1024
+
+# Set by the player owning the pool of a worker process to stop its searches
+_worker_stop_event: Optional["Event"] = None
+
+
+def _init_worker(stop_event: "Event") -> None:
+    """
+    Initialize a worker process of a player.
+
+    Parameters
+    ----------
+    stop_event: Event
+        Event set by the player to stop the searches
+    """
+    global _worker_stop_event
+    _worker_stop_event = stop_event
 
 
 class Connect4Player(ABC):
@@ -18,6 +55,9 @@ class Connect4Player(ABC):
         This player's disk colour
     """
 
+    # Whether choose_column returns its best move so far as soon as the player is interrupted
+    interruptible: bool = False
+
     def __init__(self, board: Connect4Board, colour: Connect4DiskColour):
         """
         Parameters
@@ -29,6 +69,7 @@ class Connect4Player(ABC):
         """
         self.board = board
         self.colour = colour
+        self._interrupted = False
 
     @abstractmethod
     def choose_column(self) -> int:
@@ -42,12 +83,74 @@ class Connect4Player(ABC):
         """
         ...
 
+    async def choose_column_async(self, executor: Optional[Executor] = None, timeout: Optional[float] = None) -> int:
+        """
+        Choose where to insert the next disk without blocking the event loop, within a deadline.
+
+        By default ``choose_column`` runs in an executor. When it takes longer than the timeout, interruptible players
+        are interrupted and play their best move so far, the others play ``fallback_column`` while ``choose_column``
+        is left to finish in the background. Players whose ``choose_column`` modifies the board must be interruptible.
+        The board must not be modified until the column is returned.
+
+        Parameters
+        ----------
+        executor: Optional[Executor]
+            executor running ``choose_column``. None for the default executor of the event loop
+        timeout: Optional[float]
+            time allowed to choose the move, in seconds. None for no limit
+
+        Returns
+        ----------
+        int
+            Chosen column index
+        """
+        import asyncio
+
+        future = asyncio.get_running_loop().run_in_executor(executor, self.choose_column)
+        if timeout is None:
+            return await future
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            if not self.interruptible:
+                return self.fallback_column()
+        self._interrupted = True
+        try:
+            return await future
+        finally:
+            self._interrupted = False
+
+    def fallback_column(self) -> int:
+        """
+        Column played when ``choose_column`` misses its deadline: a random available column.
+
+        Returns
+        ----------
+        int
+            Chosen column index
+        """
+        return random.choice(self.board.available_columns())
+
 
 class Connect4DummyPlayer(Connect4Player):
     """
     Dummy connect-4 AI player. It draws random numbers
     """
 
+    def __init__(self, board: Connect4Board, colour: Connect4DiskColour, rng: Optional[random.Random] = None):
+        """
+        Parameters
+        ----------
+        board: Connect4Board
+            The board of the game
+        colour: Connect4DiskColour
+            This player's disk colour
+        rng: Optional[random.Random]
+            Random number generator. None to use the ``random`` module
+        """
+        super().__init__(board, colour)
+        self._randrange = randrange if rng is None else rng.randrange
+
     def choose_column(self) -> int:
         """
         Choose where to insert the next disk.
@@ -60,7 +163,7 @@ class Connect4DummyPlayer(Connect4Player):
             Chosen column index
         """
         valid_columns = self.board.available_columns()
-        return valid_columns[randrange(len(valid_columns))]
+        return valid_columns[self._randrange(len(valid_columns))]
 
 
 class Connect4ShortSightedAI(Connect4Player):
@@ -69,7 +172,7 @@ class Connect4ShortSightedAI(Connect4Player):
     """
 
     @staticmethod
-    def _get_move_score(max_num_connections: int, weight_factor: float = 1.0) -> float:
+    def _get_move_score(max_num_connections: int, weight_factor: float = 1.0, connect: int = 4) -> float:
         """
          Get a score based on the number of connections created by a move.
 
@@ -79,12 +182,14 @@ class Connect4ShortSightedAI(Connect4Player):
              max number of disks connected by a move
         weight_factor: float
              Weighting factor to be applied on the calculated score
+        connect: int
+             Number of connected disks to win
          Returns
          -------
          float
              Chosen column index
         """
-        if max_num_connections >= 4:
+        if max_num_connections >= connect:
             return weight_factor * 1000
         else:
             return weight_factor * max_num_connections
@@ -102,19 +207,14 @@ class Connect4ShortSightedAI(Connect4Player):
         """
         valid_columns = self.board.available_columns()
         opponent_colour = Connect4DiskColour.yellow if self.colour == Connect4DiskColour.red else Connect4DiskColour.red
-        connections_my_move = [
-            self.board.max_num_connected_disks(Connect4Disk(self.board.disks_in_column(c), c, self.colour))
-            for c in valid_columns
-        ]
-        connections_opponent = [
-            self.board.max_num_connected_disks(Connect4Disk(self.board.disks_in_column(c), c, opponent_colour))
-            for c in valid_columns
-        ]
-        my_scores = [self._get_move_score(con) for con in connections_my_move]
-        opponents_scores = [self._get_move_score(con, weight_factor=0.7) for con in connections_opponent]
+        connections_my_move = [self.board.connections_after(self.colour, c) for c in valid_columns]
+        connections_opponent = [self.board.connections_after(opponent_colour, c) for c in valid_columns]
+        connect = self.board.connect
+        my_scores = [self._get_move_score(con, connect=connect) for con in connections_my_move]
+        opponents_scores = [self._get_move_score(con, 0.7, connect) for con in connections_opponent]
 
-        my_best_move_idx = np.argmax(my_scores)
-        opponent_best_move_idx = np.argmax(opponents_scores)
+        my_best_move_idx = my_scores.index(max(my_scores))
+        opponent_best_move_idx = opponents_scores.index(max(opponents_scores))
 
         if my_scores[my_best_move_idx] > opponents_scores[opponent_best_move_idx]:
             return valid_columns[my_best_move_idx]
@@ -122,6 +222,933 @@ class Connect4ShortSightedAI(Connect4Player):
             return valid_columns[opponent_best_move_idx]
 
 
+class _Connect4PooledPlayer(Connect4Player):
+    """
+    Connect-4 player spreading its search over a persistent pool of worker processes.
+
+    The pool is created at the first move and kept between moves. It is shut down by ``close``, at the end of a
+    ``with`` block or when the player is garbage collected. Setting the stop event of the pool asks the searches of the
+    workers to stop.
+
+    Attributes
+    ----------
+    workers: int
+        Number of worker processes. 0 to search in the calling process only
+    """
+
+    def __init__(self, board: Connect4Board, colour: Connect4DiskColour, workers: int = 0):
+        """
+        Parameters
+        ----------
+        board: Connect4Board
+            The board of the game
+        colour: Connect4DiskColour
+            This player's disk colour
+        workers: int
+            Number of worker processes. 0 to search in the calling process only
+        """
+        super().__init__(board, colour)
+        self.workers = workers
+        self._executor: Optional["ProcessPoolExecutor"] = None
+        self._stop_event: Optional["Event"] = None
+
+    def _worker_pool(self) -> "ProcessPoolExecutor":
+        """
+        The pool of worker processes, created on first use.
+
+        Returns
+        -------
+        ProcessPoolExecutor
+            The pool
+        """
+        if self._executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._stop_event = multiprocessing.Event()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self._stop_event,)
+            )
+            weakref.finalize(self, self._executor.shutdown, wait=False)
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self: Connect4PooledPlayerType) -> Connect4PooledPlayerType:
+        """
+        Use the player as a context manager, shutting down the worker processes at the end.
+
+        Returns
+        -------
+        _Connect4PooledPlayer
+            This player
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Shut down the worker processes."""
+        self.close()
+
+
+class _SearchAborted(Exception):
+    """Raised to unwind a search when its budget is exhausted"""
+
+
+def _negamax_worker(
+    board: Connect4Board,
+    colour: Connect4DiskColour,
+    column: int,
+    depth: int,
+    alpha: float,
+    max_nodes: Optional[int],
+    max_time: Optional[float],
+) -> Tuple[Optional[float], int]:
+    """
+    Search a root move in a worker process, with a transposition table of its own.
+
+    Parameters
+    ----------
+    board: Connect4Board
+        Snapshot of the board of the game
+    colour: Connect4DiskColour
+        Colour to move
+    column: int
+        Root move to search
+    depth: int
+        Search depth from the root, in plies
+    alpha: float
+        Best score of the root moves already searched: lower scores are only bounded
+    max_nodes: Optional[int]
+        Budget of searched nodes
+    max_time: Optional[float]
+        Wall-clock budget, in seconds
+
+    Returns
+    -------
+    Tuple[Optional[float], int]
+        Score of the move from the point of view of the colour to move (None if the budget was exhausted) and number
+        of nodes visited
+    """
+    player = Connect4NegamaxAI(
+        board,
+        colour,
+        max_time=None,
+        max_nodes=max_nodes,
+        transposition_table=Connect4TranspositionTable(_WORKER_TABLE_SIZE),
+    )
+    player._deadline = None if max_time is None else time.perf_counter() + max_time
+    player._worker_stop_event = _worker_stop_event
+    board.push_move(colour, column)
+    try:
+        score = -player._negamax(player._opponent_colour, colour, depth - 1, -float("inf"), -alpha, 1)
+    except _SearchAborted:
+        return None, player.searched_nodes
+    return score, player.searched_nodes
+
+
+class Connect4NegamaxAI(_Connect4PooledPlayer):
+    """
+    Connect-4 AI player. It runs a negamax search with alpha-beta pruning.
+
+    The search is deepened iteratively until the time or node budget is exhausted, and the best move of the deepest
+    completed iteration is played. Moves are searched from the center columns outwards, starting from the best move
+    stored in the transposition table. The table is kept across moves and can be shared between players.
+    Positions found in the opening book are not searched. An interrupted search, e.g. by the move timeout of
+    ``choose_column_async``, also plays the best move of the deepest completed iteration.
+
+    With worker processes, the first root move of an iteration is searched in the calling process, then the other
+    ones in the workers, on snapshots of the board, with transposition tables of their own and the score of the first
+    move as lower bound. The node budget is split between the root moves. The best score wins,
+    ties going to the first move in search order, so that the move played does not depend on the order the workers
+    finish in. The pool is kept between moves and shut down by ``close``, at the end of a ``with`` block or when the
+    player is garbage collected.
+
+    Attributes
+    ----------
+    board: Connect4Board
+        The board of the game
+    colour: Connect4DiskColour
+        This player's disk colour
+    max_time: Optional[float]
+        Wall-clock budget per move, in seconds
+    max_nodes: Optional[int]
+        Budget of searched nodes per move
+    max_depth: Optional[int]
+        Maximum search depth, in plies
+    transposition_table: Connect4TranspositionTable
+        Table of the positions already searched
+    opening_book: Optional[Connect4OpeningBook]
+        Book of precomputed opening moves
+    searched_depth: int
+        Depth of the deepest completed iteration of the last search
+    searched_nodes: int
+        Number of nodes visited by the last search
+    searched_score: float
+        Score of the move chosen by the last search
+    workers: int
+        Number of worker processes searching the root moves in parallel
+    """
+
+    interruptible = True
+
+    _WIN_SCORE = 1_000_000
+
+    def __init__(
+        self,
+        board: Connect4Board,
+        colour: Connect4DiskColour,
+        max_time: Optional[float] = 1.0,
+        max_nodes: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        transposition_table: Optional[Connect4TranspositionTable] = None,
+        opening_book: Optional["Connect4OpeningBook"] = None,
+        workers: int = 0,
+    ):
+        """
+        Parameters
+        ----------
+        board: Connect4Board
+            The board of the game
+        colour: Connect4DiskColour
+            This player's disk colour
+        max_time: Optional[float]
+            Wall-clock budget per move, in seconds. None for no time limit
+        max_nodes: Optional[int]
+            Budget of searched nodes per move. None for no node limit
+        max_depth: Optional[int]
+            Maximum search depth, in plies. None to search until the end of the game
+        transposition_table: Optional[Connect4TranspositionTable]
+            Table of the positions already searched. None to create a new table for this player
+        opening_book: Optional[Connect4OpeningBook]
+            Book of precomputed opening moves. None to always search
+        workers: int
+            Number of worker processes searching the root moves in parallel. 0 to search in the calling process only
+        """
+        super().__init__(board, colour, workers)
+        self.max_time = max_time
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.transposition_table = Connect4TranspositionTable() if transposition_table is None else transposition_table
+        self.opening_book = opening_book
+        self.searched_depth = 0
+        self.searched_nodes = 0
+        self.searched_score: float = 0
+        self._opponent_colour = (
+            Connect4DiskColour.yellow if colour == Connect4DiskColour.red else Connect4DiskColour.red
+        )
+        centre = (board.columns - 1) / 2
+        self._column_order = sorted(range(board.columns), key=lambda c: abs(c - centre))
+        self._deadline: Optional[float] = None
+        # Stop event of the pool, for a search running in a worker process
+        self._worker_stop_event: Optional["Event"] = None
+
+    def _count_node(self) -> None:
+        """Count a visited node and abort the search if the budget is exhausted or the player is interrupted."""
+        self.searched_nodes += 1
+        if self._interrupted:
+            raise _SearchAborted()
+        stop_event = self._worker_stop_event
+        if stop_event is not None and self.searched_nodes % _STOP_CHECK_NODES == 0 and stop_event.is_set():
+            raise _SearchAborted()
+        if self.max_nodes is not None and self.searched_nodes > self.max_nodes:
+            raise _SearchAborted()
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchAborted()
+
+    def _available_columns(self) -> List[int]:
+        """
+        Available columns, from the center outwards.
+
+        Returns
+        -------
+        List[int]
+            list of the available column indices
+        """
+        return [c for c in self._column_order if self.board.disks_in_column(c) < self.board.rows]
+
+    def _is_winning_column(self, column: int, colour: Connect4DiskColour) -> bool:
+        """
+        True if inserting a disk in the column wins the game.
+
+        Parameters
+        ----------
+        column: int
+            Column index
+        colour: Connect4DiskColour
+            Colour of the disk
+
+        Returns
+        -------
+        bool
+            True if the move wins
+        """
+        return self.board.is_winning_move(colour, column)
+
+    def _position_key(self, colour: Connect4DiskColour) -> Tuple[int, bool]:
+        """
+        Transposition table key of the current position, shared with its mirror image.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour to move
+
+        Returns
+        -------
+        Tuple[int, bool]
+            Key of the canonical position and of the colour to move, and whether the canonical position is the mirror
+            image of the board
+        """
+        key, mirror_key = self.board.position_key(), self.board.mirror_key()
+        if mirror_key < key:
+            return (mirror_key << 1) | (colour == Connect4DiskColour.red), True
+        return (key << 1) | (colour == Connect4DiskColour.red), False
+
+    def _score_to_table(self, score: float, ply: int) -> float:
+        """
+        Convert a win/loss score from distance to the root to distance to the current position.
+
+        Parameters
+        ----------
+        score: float
+            Score relative to the root
+        ply: int
+            Distance from the root, in plies
+
+        Returns
+        -------
+        float
+            Score relative to the current position
+        """
+        max_ply = self.board.rows * self.board.columns
+        if score > self._WIN_SCORE - max_ply:
+            return score + ply
+        if score < -self._WIN_SCORE + max_ply:
+            return score - ply
+        return score
+
+    def _score_from_table(self, score: float, ply: int) -> float:
+        """
+        Convert a win/loss score from distance to the current position to distance to the root.
+
+        Parameters
+        ----------
+        score: float
+            Score relative to the current position
+        ply: int
+            Distance from the root, in plies
+
+        Returns
+        -------
+        float
+            Score relative to the root
+        """
+        max_ply = self.board.rows * self.board.columns
+        if score > self._WIN_SCORE - max_ply:
+            return score - ply
+        if score < -self._WIN_SCORE + max_ply:
+            return score + ply
+        return score
+
+    def _evaluate(self, colour: Connect4DiskColour) -> float:
+        """
+        Static evaluation of a position where the given colour moves and cannot win immediately.
+
+        The heuristic score is maintained incrementally by the board.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour to move
+
+        Returns
+        -------
+        float
+            Score from the point of view of the colour to move
+        """
+        return self.board.heuristic_score(colour)
+
+    def _negamax(
+        self,
+        colour: Connect4DiskColour,
+        opponent_colour: Connect4DiskColour,
+        depth: int,
+        alpha: float,
+        beta: float,
+        ply: int,
+    ) -> float:
+        """
+        Negamax search with alpha-beta pruning.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour to move
+        opponent_colour: Connect4DiskColour
+            Colour of the opponent
+        depth: int
+            Remaining depth, in plies
+        alpha: float
+            Lower bound of the search window
+        beta: float
+            Upper bound of the search window
+        ply: int
+            Distance from the root, in plies
+
+        Returns
+        -------
+        float
+            Score from the point of view of the colour to move
+        """
+        self._count_node()
+        columns = self._available_columns()
+        if not columns:
+            return 0
+        for column in columns:
+            if self._is_winning_column(column, colour):
+                return self._WIN_SCORE - ply
+        if depth == 0:
+            return self._evaluate(colour)
+        key, mirrored = self._position_key(colour)
+        entry = self.transposition_table.lookup(key)
+        if entry is not None:
+            if entry.depth >= depth:
+                score = self._score_from_table(entry.score, ply)
+                if entry.bound == Connect4Bound.exact:
+                    return score
+                if entry.bound == Connect4Bound.lower:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+            table_column = self.board.mirror_column(entry.best_column) if mirrored else entry.best_column
+            if table_column in columns:
+                columns.remove(table_column)
+                columns.insert(0, table_column)
+        original_alpha = alpha
+        best_score = -float("inf")
+        best_column = columns[0]
+        for column in columns:
+            self.board.push_move(colour, column)
+            try:
+                score = -self._negamax(opponent_colour, colour, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                self.board.pop_move()
+            if score > best_score:
+                best_score, best_column = score, column
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        if best_score <= original_alpha:
+            bound = Connect4Bound.upper
+        elif best_score >= beta:
+            bound = Connect4Bound.lower
+        else:
+            bound = Connect4Bound.exact
+        if mirrored:
+            best_column = self.board.mirror_column(best_column)
+        self.transposition_table.store(key, depth, bound, self._score_to_table(best_score, ply), best_column)
+        return best_score
+
+    def _search_root(self, columns: List[int], depth: int) -> Tuple[float, int]:
+        """
+        Search the current position up to a given depth.
+
+        Parameters
+        ----------
+        columns: List[int]
+            Available columns, in search order
+        depth: int
+            Search depth, in plies
+
+        Returns
+        -------
+        Tuple[float, int]
+            Best score and best column
+        """
+        self._count_node()
+        for column in columns:
+            if self._is_winning_column(column, self.colour):
+                return self._WIN_SCORE, column
+        alpha = -float("inf")
+        best_column = columns[0]
+        for column in columns:
+            self.board.push_move(self.colour, column)
+            try:
+                score = -self._negamax(self._opponent_colour, self.colour, depth - 1, -float("inf"), -alpha, 1)
+            finally:
+                self.board.pop_move()
+            if score > alpha:
+                alpha, best_column = score, column
+        return alpha, best_column
+
+    def _search_root_parallel(self, columns: List[int], depth: int) -> Tuple[float, int]:
+        """
+        Search the current position up to a given depth, the root moves after the first one in worker processes.
+
+        Parameters
+        ----------
+        columns: List[int]
+            Available columns, in search order
+        depth: int
+            Search depth, in plies
+
+        Returns
+        -------
+        Tuple[float, int]
+            Best score and best column
+        """
+        self._count_node()
+        for column in columns:
+            if self._is_winning_column(column, self.colour):
+                return self._WIN_SCORE, column
+        best_column = columns[0]
+        self.board.push_move(self.colour, best_column)
+        try:
+            alpha = -self._negamax(self._opponent_colour, self.colour, depth - 1, -float("inf"), float("inf"), 1)
+        finally:
+            self.board.pop_move()
+        if len(columns) == 1:
+            return alpha, best_column
+        max_nodes = None if self.max_nodes is None else max(1, (self.max_nodes - self.searched_nodes) // len(columns))
+        max_time = None if self._deadline is None else self._deadline - time.perf_counter()
+        pool = self._worker_pool()
+        futures = [
+            pool.submit(_negamax_worker, self.board, self.colour, column, depth, alpha, max_nodes, max_time)
+            for column in columns[1:]
+        ]
+        pending = set(futures)
+        while pending:
+            if self._interrupted:
+                # Stop the searches still running, so that the workers are free for the next move
+                for future in futures:
+                    future.cancel()
+                self._stop_event.set()  # type: ignore[union-attr]
+                wait(futures)
+                self._stop_event.clear()  # type: ignore[union-attr]
+                raise _SearchAborted()
+            pending = wait(pending, timeout=_POLL_INTERVAL).not_done
+        results = [future.result() for future in futures]
+        self.searched_nodes += sum(nodes for _, nodes in results)
+        for column, (score, _) in zip(columns[1:], results):
+            if score is None:
+                raise _SearchAborted()
+            if score > alpha:
+                alpha, best_column = score, column
+        return alpha, best_column
+
+    def choose_column(self) -> int:
+        """
+        Choose where to insert the next disk.
+
+        The book move is played if the position is in the opening book. Otherwise, the position is searched with
+        increasing depth until the budget is exhausted.
+
+        Returns
+        -------
+        int
+            Chosen column index
+        """
+        self.searched_nodes = 0
+        self.searched_depth = 0
+        if self.opening_book is not None:
+            book_move = self.opening_book.lookup(self.board)
+            if book_move is not None:
+                self.searched_score = book_move[1]
+                return book_move[0]
+        self._deadline = None if self.max_time is None else time.perf_counter() + self.max_time
+        columns = self._available_columns()
+        best_column = columns[0]
+        remaining_moves = self.board.rows * self.board.columns - len(self.board)
+        max_depth = remaining_moves if self.max_depth is None else min(self.max_depth, remaining_moves)
+        search_root = self._search_root_parallel if self.workers > 0 else self._search_root
+        for depth in range(1, max_depth + 1):
+            try:
+                score, best_column = search_root(columns, depth)
+            except _SearchAborted:
+                break
+            self.searched_depth = depth
+            self.searched_score = score
+            if abs(score) > self._WIN_SCORE - remaining_moves:
+                break
+            # Search the best move first at the next iteration
+            columns.remove(best_column)
+            columns.insert(0, best_column)
+        return best_column
+
+
+class _MCTSNode:
+    """
+    Node of a Monte Carlo search tree
+
+    Attributes
+    ----------
+    colour: Connect4DiskColour
+        Colour of the disk inserted to reach this node
+    children: Dict[int, _MCTSNode]
+        Expanded children, by column
+    untried_columns: List[int]
+        Columns not expanded yet, the next one last
+    visits: int
+        Number of playouts through this node
+    wins: float
+        Playouts won by the colour of this node, draws counting half
+    winner: Optional[Connect4DiskColour]
+        Winning colour if the game is over at this node
+    terminal: bool
+        True if the game is over at this node
+    """
+
+    def __init__(self, colour: Connect4DiskColour, untried_columns: List[int]) -> None:
+        """
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour of the disk inserted to reach this node
+        untried_columns: List[int]
+            Columns not expanded yet, the next one last
+        """
+        self.colour = colour
+        self.children: Dict[int, _MCTSNode] = {}
+        self.untried_columns = untried_columns
+        self.visits = 0
+        self.wins = 0.0
+        self.winner: Optional[Connect4DiskColour] = None
+        self.terminal = False
+
+
+RootStatistics = Dict[int, Tuple[int, float]]
+
+
+def _mcts_worker(
+    board: Connect4Board,
+    colour: Connect4DiskColour,
+    playouts: int,
+    max_time: Optional[float],
+    exploration: float,
+    rollout_policy: Optional[Callable[[Connect4Board, Connect4DiskColour], Connect4Player]],
+    seed: int,
+) -> RootStatistics:
+    """
+    Run an independent Monte Carlo tree search in a worker process.
+
+    Parameters
+    ----------
+    board: Connect4Board
+        Copy of the board of the game
+    colour: Connect4DiskColour
+        Colour to move
+    playouts: int
+        Number of playouts
+    max_time: Optional[float]
+        Wall-clock budget, in seconds
+    exploration: float
+        UCT exploration constant
+    rollout_policy: Optional[Callable[[Connect4Board, Connect4DiskColour], Connect4Player]]
+        Builds the players of the rollouts. None for random moves
+    seed: int
+        Seed of the random number generator
+
+    Returns
+    -------
+    RootStatistics
+        Visits and wins of every move
+    """
+    # Custom rollout policies may draw from the random module
+    random.seed(seed)
+    player = Connect4MCTSAI(board, colour, playouts, max_time, exploration, rollout_policy, seed=seed)
+    player._search(playouts, None if max_time is None else time.perf_counter() + max_time)
+    return player._root_statistics()
+
+
+class Connect4MCTSAI(_Connect4PooledPlayer):
+    """
+    Connect-4 AI player. It runs a Monte Carlo tree search with UCT selection.
+
+    Every playout descends the tree, expands one node and plays a rollout until the end of the game. The tree of the
+    last search is reused at the next move. With worker processes, independent searches are run on copies of the
+    board and their root statistics are summed (root parallelization). The worker pool is shut down by ``close``, at
+    the end of a ``with`` block or when the player is garbage collected. An interrupted search, e.g. by the move
+    timeout of ``choose_column_async``, plays the most visited move so far.
+
+    Attributes
+    ----------
+    board: Connect4Board
+        The board of the game
+    colour: Connect4DiskColour
+        This player's disk colour
+    playouts: int
+        Playout budget per move, shared between the processes
+    max_time: Optional[float]
+        Wall-clock budget per move, in seconds
+    exploration: float
+        UCT exploration constant
+    workers: int
+        Number of worker processes running searches in parallel
+    """
+
+    interruptible = True
+
+    def __init__(
+        self,
+        board: Connect4Board,
+        colour: Connect4DiskColour,
+        playouts: int = 1000,
+        max_time: Optional[float] = None,
+        exploration: float = math.sqrt(2),
+        rollout_policy: Optional[Callable[[Connect4Board, Connect4DiskColour], Connect4Player]] = None,
+        workers: int = 0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Parameters
+        ----------
+        board: Connect4Board
+            The board of the game
+        colour: Connect4DiskColour
+            This player's disk colour
+        playouts: int
+            Playout budget per move, shared between the processes
+        max_time: Optional[float]
+            Wall-clock budget per move, in seconds. None for no time limit
+        exploration: float
+            UCT exploration constant
+        rollout_policy: Optional[Callable[[Connect4Board, Connect4DiskColour], Connect4Player]]
+            Builds the players of the rollouts, e.g. a ``Connect4Player`` class. It must be picklable to use workers.
+            None for ``Connect4DummyPlayer`` drawing from this player's random number generator
+        workers: int
+            Number of worker processes running searches in parallel
+        seed: Optional[int]
+            Seed of the random number generator of the rollouts and of the workers
+        """
+        super().__init__(board, colour, workers)
+        self.playouts = playouts
+        self.max_time = max_time
+        self.exploration = exploration
+        self._rollout_policy = rollout_policy
+        self._opponent_colour = (
+            Connect4DiskColour.yellow if colour == Connect4DiskColour.red else Connect4DiskColour.red
+        )
+        centre = (board.columns - 1) / 2
+        # Furthest columns first, as columns are expanded from the end of the list
+        self._column_order = sorted(range(board.columns), key=lambda c: -abs(c - centre))
+        self._rng = random.Random(seed)
+        self._root: Optional[_MCTSNode] = None
+        self._root_moves: Tuple[int, ...] = ()
+
+    def _new_node(self, colour: Connect4DiskColour) -> _MCTSNode:
+        """
+        Create a node for the current position of the board.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour of the disk inserted to reach the position
+
+        Returns
+        -------
+        _MCTSNode
+            New node
+        """
+        return _MCTSNode(colour, [c for c in self._column_order if self.board.disks_in_column(c) < self.board.rows])
+
+    def _update_root(self) -> None:
+        """Move the root of the tree to the current position, reusing the subtree of the moves played since."""
+        moves = self.board.moves
+        root = self._root
+        if root is not None and moves[: len(self._root_moves)] == self._root_moves:
+            for column in moves[len(self._root_moves) :]:
+                root = root.children.get(column)
+                if root is None:
+                    break
+        else:
+            root = None
+        if root is None or root.colour == self.colour:
+            root = self._new_node(self._opponent_colour)
+        self._root = root
+        self._root_moves = moves
+
+    def _select_child(self, node: _MCTSNode) -> Tuple[int, _MCTSNode]:
+        """
+        Select the child maximizing the UCT score.
+
+        Parameters
+        ----------
+        node: _MCTSNode
+            Fully expanded node
+
+        Returns
+        -------
+        Tuple[int, _MCTSNode]
+            Column and child
+        """
+        log_visits = math.log(node.visits)
+        return max(
+            node.children.items(),
+            key=lambda item: item[1].wins / item[1].visits + self.exploration * math.sqrt(log_visits / item[1].visits),
+        )
+
+    def _rollout(self, colour: Connect4DiskColour) -> Tuple[Optional[Connect4DiskColour], int]:
+        """
+        Play the game until the end with the rollout policy.
+
+        Parameters
+        ----------
+        colour: Connect4DiskColour
+            Colour to move
+
+        Returns
+        -------
+        Tuple[Optional[Connect4DiskColour], int]
+            Winning colour (None for a draw) and number of inserted disks
+        """
+        opponent_colour = Connect4DiskColour.yellow if colour == Connect4DiskColour.red else Connect4DiskColour.red
+        if self._rollout_policy is None:
+            players = [
+                Connect4DummyPlayer(self.board, colour, rng=self._rng),
+                Connect4DummyPlayer(self.board, opponent_colour, rng=self._rng),
+            ]
+        else:
+            players = [self._rollout_policy(self.board, colour), self._rollout_policy(self.board, opponent_colour)]
+        inserted = 0
+        while not self.board.is_full():
+            player = players[inserted % 2]
+            column = player.choose_column()
+            wins = self.board.is_winning_move(player.colour, column)
+            self.board.push_move(player.colour, column)
+            inserted += 1
+            if wins:
+                return player.colour, inserted
+        return None, inserted
+
+    def _playout(self) -> None:
+        """Run one playout from the root, updating the tree. The board is restored afterwards."""
+        node = self._root
+        path = [node]
+        inserted = 0
+        try:
+            while not node.terminal and not node.untried_columns and node.children:
+                column, node = self._select_child(node)
+                self.board.push_move(node.colour, column)
+                inserted += 1
+                path.append(node)
+            if not node.terminal and node.untried_columns:
+                colour = Connect4DiskColour.yellow if node.colour == Connect4DiskColour.red else Connect4DiskColour.red
+                column = node.untried_columns.pop()
+                wins = self.board.is_winning_move(colour, column)
+                self.board.push_move(colour, column)
+                inserted += 1
+                child = self._new_node(colour)
+                if wins:
+                    child.terminal, child.winner = True, colour
+                elif self.board.is_full():
+                    child.terminal = True
+                node.children[column] = child
+                node = child
+                path.append(node)
+            if node.terminal:
+                winner = node.winner
+            else:
+                colour = Connect4DiskColour.yellow if node.colour == Connect4DiskColour.red else Connect4DiskColour.red
+                winner, rollout_disks = self._rollout(colour)
+                inserted += rollout_disks
+        finally:
+            for _ in range(inserted):
+                self.board.pop_move()
+        for visited in path:
+            visited.visits += 1
+            if winner is None:
+                visited.wins += 0.5
+            elif winner == visited.colour:
+                visited.wins += 1
+
+    def _search(self, playouts: int, deadline: Optional[float]) -> None:
+        """
+        Run playouts from the current position.
+
+        Parameters
+        ----------
+        playouts: int
+            Number of playouts
+        deadline: Optional[float]
+            ``time.perf_counter`` value after which the search stops
+        """
+        self._update_root()
+        for _ in range(playouts):
+            if self._interrupted or deadline is not None and time.perf_counter() > deadline:
+                break
+            self._playout()
+
+    def _root_statistics(self) -> RootStatistics:
+        """
+        Visits and wins of the moves from the root.
+
+        Returns
+        -------
+        RootStatistics
+            Visits and wins of every move
+        """
+        return {column: (child.visits, child.wins) for column, child in self._root.children.items()}
+
+    def choose_column(self) -> int:
+        """
+        Choose where to insert the next disk.
+
+        The most visited move is played. Winning moves found in the tree are played straight away.
+
+        Returns
+        -------
+        int
+            Chosen column index
+        """
+        deadline = None if self.max_time is None else time.perf_counter() + self.max_time
+        local_playouts = self.playouts // (self.workers + 1)
+        futures = []
+        if self.workers > 0:
+            worker_playouts = (self.playouts - local_playouts) // self.workers
+            pool = self._worker_pool()
+            futures = [
+                pool.submit(
+                    _mcts_worker,
+                    self.board,
+                    self.colour,
+                    worker_playouts,
+                    self.max_time,
+                    self.exploration,
+                    self._rollout_policy,
+                    self._rng.getrandbits(32),
+                )
+                for _ in range(self.workers)
+            ]
+        self._search(local_playouts, deadline)
+        for column, child in self._root.children.items():
+            if child.winner == self.colour:
+                # Do not leave searches running into the next move
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                return column
+        statistics = self._root_statistics()
+        if self._interrupted:
+            # Worker searches still running are abandoned
+            for future in futures:
+                future.cancel()
+            futures = [future for future in futures if future.done() and not future.cancelled()]
+        for future in futures:
+            for column, (visits, wins) in future.result().items():
+                local_visits, local_wins = statistics.get(column, (0, 0.0))
+                statistics[column] = (local_visits + visits, local_wins + wins)
+        if not statistics:
+            return self._new_node(self._opponent_colour).untried_columns[-1]
+        return max(sorted(statistics), key=lambda column: statistics[column][0])
+
+
 class Connect4HumanPlayer(Connect4Player):
     """
     Human connect-4 player. The input is collected from the standard input.
@@ -142,3 +1169,80 @@ class Connect4HumanPlayer(Connect4Player):
             input_str = input(f"{self.colour.name} player. Choose column index (0-{self.board.columns-1}):")
             if input_str.isdigit() and int(input_str) < self.board.columns:
                 return int(input_str)
+
+
+class Connect4RemotePlayer(Connect4Player):
+    """
+    Connect-4 player whose moves are submitted from outside the game, e.g. by a network client.
+
+    It can only play asynchronously, in ``Connect4Game.play_async``.
+    """
+
+    def __init__(
+        self,
+        board: Connect4Board,
+        colour: Connect4DiskColour,
+        on_turn: Optional[Callable[["Connect4RemotePlayer"], None]] = None,
+    ):
+        """
+        Parameters
+        ----------
+        board: Connect4Board
+            The board of the game
+        colour: Connect4DiskColour
+            This player's disk colour
+        on_turn: Optional[Callable[[Connect4RemotePlayer], None]]
+            called with the player when it is its turn to move, e.g. to notify the client
+        """
+        super().__init__(board, colour)
+        import asyncio
+
+        self.on_turn = on_turn
+        self._moves: "asyncio.Queue[int]" = asyncio.Queue()
+
+    def submit_move(self, column_index: int) -> None:
+        """
+        Submit the next move of the player.
+
+        Parameters
+        ----------
+        column_index: int
+            Chosen column index
+        """
+        self._moves.put_nowait(column_index)
+
+    def choose_column(self) -> int:
+        """
+        Not supported: remote players wait for their moves in an event loop.
+
+        Raises
+        ----------
+        RuntimeError
+            always
+        """
+        raise RuntimeError("Remote players can only play asynchronously")
+
+    async def choose_column_async(self, executor: Optional[Executor] = None, timeout: Optional[float] = None) -> int:
+        """
+        Wait for the next move submitted with ``submit_move``.
+
+        Parameters
+        ----------
+        executor: Optional[Executor]
+            unused
+        timeout: Optional[float]
+            time allowed to submit the move, in seconds, after which ``fallback_column`` is played. None for no limit
+
+        Returns
+        ----------
+        int
+            Chosen column index
+        """
+        import asyncio
+
+        if self.on_turn is not None:
+            self.on_turn(self)
+        try:
+            return await asyncio.wait_for(self._moves.get(), timeout)
+        except asyncio.TimeoutError:
+            return self.fallback_column()
@@ -0,0 +1,251 @@
+import struct
+from dataclasses import dataclass
+from types import TracebackType
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple, Type
+
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.game import Connect4GameResult
+
+# File header: magic, format version, rows, columns, number of connected disks to win
+_HEADER = struct.Struct("<4sHHHH")
+_MAGIC = b"C4GR"
+_VERSION = 2
+# Game header: result, number of moves
+_GAME_HEADER = struct.Struct("<BH")
+_RESULT_CODES = {
+    Connect4GameResult.draw: 0,
+    Connect4GameResult.red_wins: 1,
+    Connect4GameResult.yellow_wins: 2,
+}
+_RESULTS = {code: result for result, code in _RESULT_CODES.items()}
+
+
+class Connect4InvalidRecord(Exception):
+    pass
+
+
+def _packs_nibbles(columns: int) -> bool:
+    """
+    Whether the moves of a board are packed as nibbles (two moves per byte) or stored as bytes.
+
+    Parameters
+    ----------
+    columns : int
+        number of columns of the board
+
+    Returns
+    ----------
+    bool
+        True for nibbles
+    """
+    return columns <= 16
+
+
+@dataclass(frozen=True)
+class Connect4GameRecord:
+    """
+    A recorded connect-4 game
+
+    Attributes
+    ----------
+    rows : int
+        number of rows of the board
+    columns : int
+        number of columns of the board
+    moves : Tuple[int, ...]
+        columns played, the red player moving first
+    result : Connect4GameResult
+        result of the game
+    connect : int
+        number of connected disks to win
+    """
+
+    rows: int
+    columns: int
+    moves: Tuple[int, ...]
+    result: Connect4GameResult
+    connect: int = 4
+
+    def replay(self) -> Connect4Board:
+        """
+        Replay the game on an empty board.
+
+        Returns
+        ----------
+        Connect4Board
+            board at the end of the game
+        """
+        board = Connect4Board(self.rows, self.columns, self.connect)
+        colour, opponent_colour = Connect4DiskColour.red, Connect4DiskColour.yellow
+        for column in self.moves:
+            board.insert_disk(colour, column)
+            colour, opponent_colour = opponent_colour, colour
+        return board
+
+
+class Connect4GameWriter:
+    """
+    Streaming writer of game records
+
+    The file holds a fixed-size header (magic, version, board size and number of connected disks to win) followed by
+    the games, one after the other. Every game holds its result, its number of moves and its columns: one nibble per
+    move, two moves per byte, for boards of up to 16 columns, one byte per move for larger boards.
+
+    The moves of the current game are fed one by one with ``add_move``, and the game is written by ``end_game``, e.g.
+    by ``Connect4Game.play``.
+    """
+
+    def __init__(self, path: str, rows: int, columns: int, append: bool = False, connect: int = 4) -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            output file
+        rows : int
+            number of rows of the recorded boards
+        columns : int
+            number of columns of the recorded boards
+        append: bool
+            add the games at the end of an existing file of the same board size and rule, instead of overwriting it
+        connect : int
+            number of connected disks to win on the recorded boards
+        """
+        if columns > 256 or rows * columns > 0xFFFF:
+            raise Connect4InvalidRecord(f"Board too large to record: {rows}x{columns}")
+        self.rows: int = rows
+        self.columns: int = columns
+        self.connect: int = connect
+        self.num_games: int = 0
+        self._nibbles: bool = _packs_nibbles(columns)
+        self._moves: List[int] = []
+        if append:
+            try:
+                with open(path, "rb") as f:
+                    header = f.read(_HEADER.size)
+            except FileNotFoundError:
+                header = b""
+            if header and _read_header(header) != (rows, columns, connect):
+                raise Connect4InvalidRecord(f"{path} records another board size or rule")
+            self._file: BinaryIO = open(path, "ab")
+            if not header:
+                self._file.write(_HEADER.pack(_MAGIC, _VERSION, rows, columns, connect))
+        else:
+            self._file = open(path, "wb")
+            self._file.write(_HEADER.pack(_MAGIC, _VERSION, rows, columns, connect))
+
+    def add_move(self, column: int) -> None:
+        """
+        Add a move to the current game.
+
+        Parameters
+        ----------
+        column: int
+            column played
+        """
+        self._moves.append(column)
+
+    def end_game(self, result: Connect4GameResult) -> None:
+        """
+        Write the current game and start a new one.
+
+        Parameters
+        ----------
+        result: Connect4GameResult
+            result of the game
+        """
+        self.write_game(self._moves, result)
+        self._moves = []
+
+    def write_game(self, moves: Sequence[int], result: Connect4GameResult) -> None:
+        """
+        Write a whole game.
+
+        Parameters
+        ----------
+        moves: Sequence[int]
+            columns played, the red player moving first
+        result: Connect4GameResult
+            result of the game
+        """
+        if self._nibbles:
+            padded = list(moves) + [0] * (len(moves) % 2)
+            packed = bytes(padded[i] | padded[i + 1] << 4 for i in range(0, len(padded), 2))
+        else:
+            packed = bytes(moves)
+        self._file.write(_GAME_HEADER.pack(_RESULT_CODES[result], len(moves)))
+        self._file.write(packed)
+        self.num_games += 1
+
+    def close(self) -> None:
+        """Flush and close the file. The moves of an unfinished game are discarded."""
+        self._file.close()
+
+    def __enter__(self) -> "Connect4GameWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _read_header(header: bytes) -> Tuple[int, int, int]:
+    """
+    Parse the header of a game record file.
+
+    Parameters
+    ----------
+    header: bytes
+        file header
+
+    Returns
+    ----------
+    Tuple[int, int, int]
+        number of rows, columns and connected disks to win of the recorded boards
+    """
+    if len(header) != _HEADER.size:
+        raise Connect4InvalidRecord("Truncated header")
+    magic, version, rows, columns, connect = _HEADER.unpack(header)
+    if magic != _MAGIC or version != _VERSION:
+        raise Connect4InvalidRecord("Not a connect-4 game record file")
+    return rows, columns, connect
+
+
+def read_games(path: str) -> Iterator[Connect4GameRecord]:
+    """
+    Iterate over the games of a record file.
+
+    Games are read one at a time through a buffered file, so that logs larger than the memory can be replayed.
+
+    Parameters
+    ----------
+    path: str
+        file written by ``Connect4GameWriter``
+
+    Yields
+    ----------
+    Connect4GameRecord
+        the recorded games, in order
+    """
+    with open(path, "rb") as f:
+        rows, columns, connect = _read_header(f.read(_HEADER.size))
+        nibbles = _packs_nibbles(columns)
+        while True:
+            game_header = f.read(_GAME_HEADER.size)
+            if not game_header:
+                return
+            if len(game_header) != _GAME_HEADER.size:
+                raise Connect4InvalidRecord("Truncated game")
+            result_code, num_moves = _GAME_HEADER.unpack(game_header)
+            size = (num_moves + 1) // 2 if nibbles else num_moves
+            packed = f.read(size)
+            if len(packed) != size or result_code not in _RESULTS:
+                raise Connect4InvalidRecord("Truncated or corrupted game")
+            if nibbles:
+                moves = tuple(column for byte in packed for column in (byte & 0xF, byte >> 4))[:num_moves]
+            else:
+                moves = tuple(packed)
+            yield Connect4GameRecord(rows, columns, moves, _RESULTS[result_code], connect)
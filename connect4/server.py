@@ -0,0 +1,383 @@
+import asyncio
+import itertools
+import json
+import logging
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from connect4.artist import Connect4ArtistTrivial
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.game import Connect4Game
+from connect4.instrumentation import Connect4GameObserver, Connect4MoveEvent
+from connect4.player import Connect4Player, Connect4RemotePlayer
+from connect4.simulation import Connect4PlayerFactory
+
+REMOTE_OPPONENT = "remote"
+
+
+@dataclass
+class _Connect4Session:
+    """
+    A game hosted by the server
+
+    Attributes
+    ----------
+    game_id : int
+        game identifier, unique in the server
+    game : Connect4Game
+        the game
+    clients : Dict[Connect4DiskColour, asyncio.StreamWriter]
+        connection of the client playing every remote colour
+    turn : Optional[Connect4DiskColour]
+        remote colour whose move is awaited
+    task : Optional[asyncio.Task]
+        task playing the game
+    """
+
+    game_id: int
+    game: Connect4Game
+    clients: Dict[Connect4DiskColour, asyncio.StreamWriter] = field(default_factory=dict)
+    turn: Optional[Connect4DiskColour] = None
+    task: Optional["asyncio.Task[Any]"] = None
+
+
+class _Connect4SessionObserver(Connect4GameObserver):
+    """Observer forwarding the moves of a game to its clients"""
+
+    def __init__(self, server: "Connect4GameServer", session: _Connect4Session) -> None:
+        self._server = server
+        self._session = session
+
+    def move_ended(self, event: Connect4MoveEvent) -> None:
+        # A move submitted after the timeout of the player is refused
+        self._session.turn = None
+        message = {"type": "move", "game": self._session.game_id, "colour": event.colour.name, "column": event.column}
+        for writer in self._session.clients.values():
+            self._server._send(writer, message)
+
+
+class Connect4GameServer:
+    """
+    Asyncio server hosting many connect-4 games concurrently in one event loop.
+
+    Clients connect over TCP and exchange JSON messages, one per line. A connection can play any number of games at
+    the same time. Requests:
+
+    - ``{"type": "new_game", "opponent": <name>, "colour": "red"}``: start a game against one of the AI opponents of
+      the server, or against the next client asking for the ``"remote"`` opponent. The colour defaults to red.
+    - ``{"type": "move", "game": <id>, "column": <column>}``: play a move.
+
+    Notifications: ``game_started`` (with the game id, colour and board size), ``waiting`` (for a remote opponent),
+    ``your_turn``, ``move`` (every move of the game, with its colour and column), ``game_over`` (with the result,
+    ``aborted`` if a client disconnected, and the moves) and ``error``.
+
+    The ``choose_column`` of the AI players runs in an executor, so that the event loop keeps serving the other
+    games. With a ``ThreadPoolExecutor``, the default, CPU-bound moves still hold the GIL: the AI moves of all the
+    games are computed one at a time, and only waiting for clients overlaps. With a move timeout, players who do not
+    move in time, clients included, play a fallback move.
+
+    Every game builds its own AI player. Factories of players with large per-player state, e.g. the transposition
+    table of ``Connect4NegamaxAI``, should share one bounded instance between the games so that memory does not grow
+    with the number of concurrent games.
+
+    Attributes
+    ----------
+    opponents : Dict[str, Connect4PlayerFactory]
+        AI opponents offered to the clients, by name
+    rows : int
+        number of rows of the boards
+    columns : int
+        number of columns of the boards
+    executor : Optional[Executor]
+        executor running the AI moves. None for the default executor of the event loop
+    move_timeout : Optional[float]
+        time allowed to every player to choose a move, in seconds
+    games_played : int
+        number of finished games
+    """
+
+    def __init__(
+        self,
+        opponents: Dict[str, Connect4PlayerFactory],
+        rows: int = 6,
+        columns: int = 7,
+        executor: Optional[Executor] = None,
+        move_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        opponents: Dict[str, Connect4PlayerFactory]
+            AI opponents offered to the clients, by name, e.g. ``Connect4Player`` classes
+        rows : int
+            number of rows of the boards
+        columns : int
+            number of columns of the boards
+        executor: Optional[Executor]
+            executor running the AI moves, e.g. a ``ThreadPoolExecutor``. None for the default executor of the event
+            loop
+        move_timeout: Optional[float]
+            time allowed to every player to choose a move, in seconds. None for no limit
+        """
+        self.opponents: Dict[str, Connect4PlayerFactory] = opponents
+        self.rows: int = rows
+        self.columns: int = columns
+        self.executor: Optional[Executor] = executor
+        self.move_timeout: Optional[float] = move_timeout
+        self.games_played: int = 0
+        self._sessions: Dict[int, _Connect4Session] = {}
+        self._game_ids = itertools.count()
+        self._waiting: Optional[asyncio.StreamWriter] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def num_games(self) -> int:
+        """Number of games in progress."""
+        return len(self._sessions)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """
+        Start accepting connections.
+
+        Parameters
+        ----------
+        host: str
+            interface to listen on
+        port: int
+            port to listen on. 0 for any free port
+
+        Returns
+        ----------
+        int
+            port listened on
+        """
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serve the clients until cancelled."""
+        if self._server is None:
+            raise RuntimeError("The server is not started")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Abort the games in progress and stop accepting connections."""
+        for session in list(self._sessions.values()):
+            if session.task is not None:
+                session.task.cancel()
+        await asyncio.sleep(0)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    @staticmethod
+    def _send(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+        """
+        Send a message to a client, unless it is disconnected.
+
+        Parameters
+        ----------
+        writer: asyncio.StreamWriter
+            connection of the client
+        message: Dict[str, Any]
+            the message
+        """
+        if not writer.is_closing():
+            writer.write(json.dumps(message).encode() + b"\n")
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve a client until it disconnects.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            incoming stream of the connection
+        writer: asyncio.StreamWriter
+            outgoing stream of the connection
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if request.get("type") == "new_game":
+                        self._new_game(writer, request)
+                    elif request.get("type") == "move":
+                        self._move(writer, request)
+                    else:
+                        raise ValueError(f"Unknown request type: {request.get('type')}")
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    self._send(writer, {"type": "error", "message": str(e)})
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._disconnect(writer)
+            writer.close()
+
+    def _new_game(self, writer: asyncio.StreamWriter, request: Dict[str, Any]) -> None:
+        """
+        Start a game, or wait for a remote opponent.
+
+        Parameters
+        ----------
+        writer: asyncio.StreamWriter
+            connection of the client
+        request: Dict[str, Any]
+            the ``new_game`` request
+        """
+        opponent = request.get("opponent", REMOTE_OPPONENT)
+        if opponent == REMOTE_OPPONENT:
+            if self._waiting is None or self._waiting.is_closing():
+                self._waiting = writer
+                self._send(writer, {"type": "waiting"})
+                return
+            clients = {Connect4DiskColour.red: self._waiting, Connect4DiskColour.yellow: writer}
+            self._waiting = None
+            self._start_session(clients)
+            return
+        if opponent not in self.opponents:
+            raise ValueError(f"Unknown opponent: {opponent}")
+        colour = Connect4DiskColour[request.get("colour", Connect4DiskColour.red.name)]
+        if colour == Connect4DiskColour.invalid:
+            raise ValueError("Invalid colour")
+        self._start_session({colour: writer}, opponent)
+
+    def _start_session(
+        self,
+        clients: Dict[Connect4DiskColour, asyncio.StreamWriter],
+        opponent: Optional[str] = None,
+    ) -> None:
+        """
+        Start a game between clients, or a client and an AI opponent.
+
+        Parameters
+        ----------
+        clients: Dict[Connect4DiskColour, asyncio.StreamWriter]
+            connection of the client playing every remote colour
+        opponent: Optional[str]
+            name of the AI opponent playing the other colour, if any
+        """
+        game_id = next(self._game_ids)
+        board = Connect4Board(self.rows, self.columns)
+        players: Dict[Connect4DiskColour, Connect4Player] = {}
+        for colour in (Connect4DiskColour.red, Connect4DiskColour.yellow):
+            if colour in clients:
+                players[colour] = Connect4RemotePlayer(board, colour, on_turn=partial(self._your_turn, game_id))
+            else:
+                players[colour] = self.opponents[opponent](board, colour)  # type: ignore[index]
+        game = Connect4Game(
+            board,
+            yellow_player=players[Connect4DiskColour.yellow],
+            red_player=players[Connect4DiskColour.red],
+            artist=Connect4ArtistTrivial(board),
+            move_timeout=self.move_timeout,
+        )
+        session = _Connect4Session(game_id, game, clients)
+        game.observers = [_Connect4SessionObserver(self, session)]
+        self._sessions[session.game_id] = session
+        for colour, writer in clients.items():
+            self._send(
+                writer,
+                {
+                    "type": "game_started",
+                    "game": session.game_id,
+                    "colour": colour.name,
+                    "rows": self.rows,
+                    "columns": self.columns,
+                },
+            )
+        session.task = asyncio.create_task(game.play_async(self.executor))
+        session.task.add_done_callback(lambda task: self._end_session(session, task))
+
+    def _your_turn(self, game_id: int, player: Connect4RemotePlayer) -> None:
+        """
+        Ask a client for its move.
+
+        Parameters
+        ----------
+        game_id: int
+            game identifier
+        player: Connect4RemotePlayer
+            player to move
+        """
+        session = self._sessions[game_id]
+        session.turn = player.colour
+        self._send(session.clients[player.colour], {"type": "your_turn", "game": session.game_id})
+
+    def _move(self, writer: asyncio.StreamWriter, request: Dict[str, Any]) -> None:
+        """
+        Play the move of a client.
+
+        Parameters
+        ----------
+        writer: asyncio.StreamWriter
+            connection of the client
+        request: Dict[str, Any]
+            the ``move`` request
+        """
+        session = self._sessions.get(request["game"])
+        if session is None:
+            raise ValueError(f"Unknown game: {request['game']}")
+        if session.turn is None or session.clients[session.turn] is not writer:
+            raise ValueError("Not your turn")
+        column = request["column"]
+        if not isinstance(column, int) or column not in session.game.board.available_columns():
+            raise ValueError(f"Invalid column: {column}")
+        player = session.game.red_player if session.turn == Connect4DiskColour.red else session.game.yellow_player
+        session.turn = None
+        player.submit_move(column)  # type: ignore[attr-defined]
+
+    def _end_session(self, session: _Connect4Session, task: "asyncio.Task[Any]") -> None:
+        """
+        Notify the clients of the end of a game.
+
+        Parameters
+        ----------
+        session: _Connect4Session
+            the session of the game
+        task: asyncio.Task
+            task which played the game
+        """
+        del self._sessions[session.game_id]
+        if task.cancelled():
+            result = "aborted"
+        elif task.exception() is not None:
+            logging.error(f"Game {session.game_id} failed", exc_info=task.exception())
+            result = "aborted"
+        else:
+            result = task.result().name
+            self.games_played += 1
+        for writer in session.clients.values():
+            self._send(
+                writer,
+                {
+                    "type": "game_over",
+                    "game": session.game_id,
+                    "result": result,
+                    "moves": list(session.game.board.moves),
+                },
+            )
+
+    def _disconnect(self, writer: asyncio.StreamWriter) -> None:
+        """
+        Abort the games of a disconnected client.
+
+        Parameters
+        ----------
+        writer: asyncio.StreamWriter
+            connection of the client
+        """
+        if self._waiting is writer:
+            self._waiting = None
+        aborted: List[_Connect4Session] = [
+            session for session in self._sessions.values() if writer in session.clients.values()
+        ]
+        for session in aborted:
+            if session.task is not None:
+                session.task.cancel()
@@ -0,0 +1,291 @@
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from connect4.artist import Connect4Artist, Connect4ArtistTrivial
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.game import Connect4Game, Connect4GameResult
+from connect4.instrumentation import Connect4GameObserver
+from connect4.player import Connect4Player
+from connect4.record import Connect4GameWriter
+
+Connect4PlayerFactory = Callable[[Connect4Board, Connect4DiskColour], Connect4Player]
+Connect4ArtistFactory = Callable[[Connect4Board], Connect4Artist]
+
+
+@dataclass
+class Connect4MoveTimes:
+    """
+    Wall-clock time spent choosing moves
+
+    Attributes
+    ----------
+    moves : int
+        number of timed moves
+    total : float
+        total time, in seconds
+    max : float
+        time of the slowest move, in seconds
+    """
+
+    moves: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean time per move, in seconds."""
+        return self.total / self.moves if self.moves else 0.0
+
+    def add(self, duration: float) -> None:
+        """
+        Add the time of a move.
+
+        Parameters
+        ----------
+        duration: float
+            time spent choosing the move, in seconds
+        """
+        self.moves += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def merge(self, other: "Connect4MoveTimes") -> None:
+        """
+        Add the moves of another record.
+
+        Parameters
+        ----------
+        other: Connect4MoveTimes
+            other record
+        """
+        self.moves += other.moves
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Machine-readable summary of the move times.
+
+        Returns
+        ----------
+        Dict[str, float]
+            summary of the move times
+        """
+        return {"moves": self.moves, "mean": self.mean, "max": self.max}
+
+
+def _colour_move_times() -> Dict[Connect4DiskColour, Connect4MoveTimes]:
+    """Empty move times of both colours."""
+    return {Connect4DiskColour.red: Connect4MoveTimes(), Connect4DiskColour.yellow: Connect4MoveTimes()}
+
+
+def _timed(player: Connect4Player, move_times: Connect4MoveTimes) -> Connect4Player:
+    """
+    Time every ``choose_column`` call of a player.
+
+    Parameters
+    ----------
+    player: Connect4Player
+        the player
+    move_times: Connect4MoveTimes
+        record of the move times
+
+    Returns
+    ----------
+    Connect4Player
+        the same player
+    """
+    choose_column = player.choose_column
+
+    def timed_choose_column() -> int:
+        start = time.perf_counter()
+        column = choose_column()
+        move_times.add(time.perf_counter() - start)
+        return column
+
+    player.choose_column = timed_choose_column  # type: ignore[assignment]
+    return player
+
+
+@dataclass
+class Connect4BatchResult:
+    """
+    Aggregate results of a batch of games
+
+    Attributes
+    ----------
+    red_wins : int
+        games won by the red player
+    yellow_wins : int
+        games won by the yellow player
+    draws : int
+        drawn games
+    game_lengths : Dict[int, int]
+        number of games by number of moves
+    total_time : float
+        wall-clock time spent playing the games, in seconds
+    move_times : Dict[Connect4DiskColour, Connect4MoveTimes]
+        time spent in ``choose_column`` by each colour
+    """
+
+    red_wins: int = 0
+    yellow_wins: int = 0
+    draws: int = 0
+    game_lengths: Dict[int, int] = field(default_factory=Counter)
+    total_time: float = 0.0
+    move_times: Dict[Connect4DiskColour, Connect4MoveTimes] = field(default_factory=_colour_move_times)
+
+    @property
+    def num_games(self) -> int:
+        """Number of games played."""
+        return self.red_wins + self.yellow_wins + self.draws
+
+    @property
+    def num_moves(self) -> int:
+        """Number of moves played."""
+        return sum(length * games for length, games in self.game_lengths.items())
+
+    @property
+    def mean_game_length(self) -> float:
+        """Mean number of moves per game."""
+        return self.num_moves / self.num_games if self.num_games else 0.0
+
+    @property
+    def mean_move_time(self) -> float:
+        """Mean wall-clock time per move, in seconds."""
+        return self.total_time / self.num_moves if self.num_moves else 0.0
+
+    def add(self, result: Connect4GameResult, length: int, duration: float) -> None:
+        """
+        Add the outcome of a game.
+
+        Parameters
+        ----------
+        result: Connect4GameResult
+            result of the game
+        length: int
+            number of moves of the game
+        duration: float
+            wall-clock time spent playing the game, in seconds
+        """
+        if result == Connect4GameResult.red_wins:
+            self.red_wins += 1
+        elif result == Connect4GameResult.yellow_wins:
+            self.yellow_wins += 1
+        else:
+            self.draws += 1
+        self.game_lengths[length] = self.game_lengths.get(length, 0) + 1
+        self.total_time += duration
+
+    def merge(self, other: "Connect4BatchResult") -> None:
+        """
+        Add the games of another batch.
+
+        Parameters
+        ----------
+        other: Connect4BatchResult
+            other batch
+        """
+        self.red_wins += other.red_wins
+        self.yellow_wins += other.yellow_wins
+        self.draws += other.draws
+        for length, games in other.game_lengths.items():
+            self.game_lengths[length] = self.game_lengths.get(length, 0) + games
+        self.total_time += other.total_time
+        for colour, move_times in other.move_times.items():
+            self.move_times[colour].merge(move_times)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Machine-readable summary of the batch.
+
+        Returns
+        ----------
+        Dict[str, Any]
+            summary of the batch
+        """
+        return {
+            "games": self.num_games,
+            "red_wins": self.red_wins,
+            "yellow_wins": self.yellow_wins,
+            "draws": self.draws,
+            "moves": self.num_moves,
+            "mean_game_length": self.mean_game_length,
+            "game_lengths": {str(length): games for length, games in sorted(self.game_lengths.items())},
+            "total_time": self.total_time,
+            "mean_move_time": self.mean_move_time,
+            "move_times": {colour.name: move_times.as_dict() for colour, move_times in self.move_times.items()},
+        }
+
+
+def run_games(
+    red_factory: Connect4PlayerFactory,
+    yellow_factory: Connect4PlayerFactory,
+    num_games: int,
+    rows: int = 6,
+    columns: int = 7,
+    artist_factory: Optional[Connect4ArtistFactory] = None,
+    seed: Optional[int] = None,
+    recorder: Optional[Connect4GameWriter] = None,
+    observers: Sequence[Connect4GameObserver] = (),
+    connect: int = 4,
+) -> Connect4BatchResult:
+    """
+    Play a batch of games between two players, without any user interaction.
+
+    Parameters
+    ----------
+    red_factory: Connect4PlayerFactory
+        builds the red player from the board and the colour, e.g. a ``Connect4Player`` class
+    yellow_factory: Connect4PlayerFactory
+        builds the yellow player from the board and the colour, e.g. a ``Connect4Player`` class
+    num_games: int
+        number of games to play
+    rows : int
+        number of rows of the board
+    columns : int
+        number of columns of the board
+    artist_factory: Optional[Connect4ArtistFactory]
+        builds the artist from the board. None to draw nothing
+    seed: Optional[int]
+        seed of the ``random`` module generator, for reproducible batches. Its previous state is restored at the end
+    recorder: Optional[Connect4GameWriter]
+        writer fed with every game. None not to record the games
+    observers: Sequence[Connect4GameObserver]
+        event sinks notified of the moves of every game, e.g. a ``Connect4MetricsCollector``
+    connect : int
+        number of connected disks to win
+
+    Returns
+    ----------
+    Connect4BatchResult
+        aggregate results of the games
+    """
+    random_state = random.getstate()
+    if seed is not None:
+        random.seed(seed)
+    batch_result = Connect4BatchResult()
+    red_times = batch_result.move_times[Connect4DiskColour.red]
+    yellow_times = batch_result.move_times[Connect4DiskColour.yellow]
+    try:
+        for _ in range(num_games):
+            board = Connect4Board(rows, columns, connect)
+            artist = Connect4ArtistTrivial(board) if artist_factory is None else artist_factory(board)
+            game = Connect4Game(
+                board,
+                yellow_player=_timed(yellow_factory(board, Connect4DiskColour.yellow), yellow_times),
+                red_player=_timed(red_factory(board, Connect4DiskColour.red), red_times),
+                artist=artist,
+                recorder=recorder,
+                observers=observers,
+            )
+            start = time.perf_counter()
+            result = game.play()
+            batch_result.add(result, len(board), time.perf_counter() - start)
+    finally:
+        if seed is not None:
+            random.setstate(random_state)
+    return batch_result
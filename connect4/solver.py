@@ -0,0 +1,400 @@
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.transposition import Connect4Bound, Connect4TranspositionTable
+
+
+@dataclass(frozen=True)
+class Connect4Solution:
+    """
+    Game-theoretic value of a position
+
+    Attributes
+    ----------
+    colour : Connect4DiskColour
+        colour to move
+    value : int
+        1 if the colour to move wins, -1 if it loses, 0 for a draw, with perfect play of both colours
+    distance : int
+        number of moves until the end of the game: the winner wins as fast as possible, the loser loses as late as
+        possible
+    """
+
+    colour: Connect4DiskColour
+    value: int
+    distance: int
+
+
+class Connect4SolverCache:
+    """
+    Persistent cache of solved positions, stored in a SQLite database
+
+    Positions are stored by board size, number of connected disks to win and canonical position key: a position and
+    its mirror image share an entry. Databases written before the rule was stored are read as connect-4 positions.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            database file, created if needed
+        """
+        self._connection = sqlite3.connect(path)
+        fields = [row[1] for row in self._connection.execute("PRAGMA table_info(solutions)")]
+        if fields and "connect" not in fields:
+            self._connection.execute("ALTER TABLE solutions RENAME TO solutions_connect4")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS solutions (rows INTEGER, columns INTEGER, connect INTEGER, key BLOB, "
+            "score INTEGER, PRIMARY KEY (rows, columns, connect, key))",
+        )
+        if fields and "connect" not in fields:
+            self._connection.execute(
+                "INSERT INTO solutions SELECT rows, columns, 4, key, score FROM solutions_connect4",
+            )
+            self._connection.execute("DROP TABLE solutions_connect4")
+        self._connection.commit()
+
+    @staticmethod
+    def _key_bytes(board: Connect4Board) -> bytes:
+        """
+        Serialized position key of a board.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board
+
+        Returns
+        ----------
+        bytes
+            canonical position key, shared with the mirror image of the position
+        """
+        key = board.canonical_key()
+        return key.to_bytes((key.bit_length() + 7) // 8, "little")
+
+    def get(self, board: Connect4Board) -> Optional[int]:
+        """
+        Solver score of the current position of a board.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board
+
+        Returns
+        ----------
+        Optional[int]
+            score, None if the position is not in the cache
+        """
+        row = self._connection.execute(
+            "SELECT score FROM solutions WHERE rows = ? AND columns = ? AND connect = ? AND key = ?",
+            (board.rows, board.columns, board.connect, self._key_bytes(board)),
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, board: Connect4Board, score: int) -> None:
+        """
+        Store the solver score of the current position of a board.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board
+        score: int
+            score
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?)",
+            (board.rows, board.columns, board.connect, self._key_bytes(board), score),
+        )
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        """
+        Number of cached positions.
+
+        Returns
+        ----------
+        int
+            Number of positions
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+
+class Connect4Solver:
+    """
+    Perfect-play connect-4 solver.
+
+    Positions are searched until the end of the game with alpha-beta pruning and a transposition table. The red
+    player is assumed to move first, so that the colour to move follows from the number of disks.
+
+    A win is scored ``WIN_SCORE`` minus the number of disks on the board when the game ends, and a loss the opposite:
+    the score depends on the position only, so it can be cached across searches and processes. The transposition
+    table is cleared when the board size or the number of connected disks to win changes.
+
+    Attributes
+    ----------
+    cache : Optional[Connect4SolverCache]
+        persistent cache of solved positions
+    searched_nodes : int
+        number of nodes visited by the last search
+    """
+
+    WIN_SCORE = 1000
+
+    def __init__(self, cache_path: Optional[str] = None, table_size: int = 2**20) -> None:
+        """
+        Parameters
+        ----------
+        cache_path: Optional[str]
+            database file of the persistent cache. None not to persist the solved positions
+        table_size: int
+            number of slots of the transposition table
+        """
+        self.cache: Optional[Connect4SolverCache] = None if cache_path is None else Connect4SolverCache(cache_path)
+        self.searched_nodes: int = 0
+        self._transposition_table = Connect4TranspositionTable(table_size)
+        # Board size and number of connected disks to win of the positions in the transposition table
+        self._table_rules: Optional[Tuple[int, int, int]] = None
+        self._column_order: List[int] = []
+
+    def close(self) -> None:
+        """Close the persistent cache."""
+        if self.cache is not None:
+            self.cache.close()
+
+    @staticmethod
+    def colour_to_move(board: Connect4Board) -> Connect4DiskColour:
+        """
+        Colour to move, the red player moving first.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board
+
+        Returns
+        ----------
+        Connect4DiskColour
+            colour to move
+        """
+        return Connect4DiskColour.red if len(board) % 2 == 0 else Connect4DiskColour.yellow
+
+    def _negamax(
+        self,
+        board: Connect4Board,
+        colour: Connect4DiskColour,
+        opponent_colour: Connect4DiskColour,
+        alpha: int,
+        beta: int,
+    ) -> int:
+        """
+        Negamax search with alpha-beta pruning until the end of the game.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board, restored after the search
+        colour: Connect4DiskColour
+            colour to move
+        opponent_colour: Connect4DiskColour
+            colour of the opponent
+        alpha: int
+            lower bound of the search window
+        beta: int
+            upper bound of the search window
+
+        Returns
+        ----------
+        int
+            score from the point of view of the colour to move
+        """
+        self.searched_nodes += 1
+        num_disks = len(board)
+        if board.is_full():
+            return 0
+        columns = [column for column in self._column_order if board.disks_in_column(column) < board.rows]
+        for column in columns:
+            if board.is_winning_move(colour, column):
+                return self.WIN_SCORE - num_disks - 1
+        # The opponent wins at the earliest with its next disk: a forced move blocks it
+        forced = [column for row, column in board.threats(opponent_colour) if row == board.disks_in_column(column)]
+        if len(forced) > 1:
+            return -(self.WIN_SCORE - num_disks - 2)
+        if forced:
+            columns = forced
+        elif len(columns) > 1:
+            # Moves creating the most threats first, the centre first among them
+            threat_counts = {}
+            for column in columns:
+                board.push_move(colour, column)
+                threat_counts[column] = len(board.threats(colour))
+                board.pop_move()
+            columns.sort(key=lambda column: -threat_counts[column])
+        # The colour to move wins at the earliest with its second next disk
+        beta = min(beta, self.WIN_SCORE - num_disks - 3)
+        if alpha >= beta:
+            return beta
+
+        # A position and its mirror image share an entry, whose column is in the canonical orientation
+        key, mirror_key = board.position_key(), board.mirror_key()
+        mirrored = mirror_key < key
+        if mirrored:
+            key = mirror_key
+        entry = self._transposition_table.lookup(key)
+        if entry is not None:
+            if entry.bound == Connect4Bound.exact:
+                return int(entry.score)
+            if entry.bound == Connect4Bound.lower:
+                alpha = max(alpha, int(entry.score))
+            else:
+                beta = min(beta, int(entry.score))
+            if alpha >= beta:
+                return int(entry.score)
+            table_column = board.mirror_column(entry.best_column) if mirrored else entry.best_column
+            if table_column in columns:
+                columns = [table_column] + [column for column in columns if column != table_column]
+
+        original_alpha = alpha
+        best_score = -self.WIN_SCORE
+        best_column = columns[0]
+        for column in columns:
+            board.push_move(colour, column)
+            try:
+                score = -self._negamax(board, opponent_colour, colour, -beta, -alpha)
+            finally:
+                board.pop_move()
+            if score > best_score:
+                best_score, best_column = score, column
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        if best_score <= original_alpha:
+            bound = Connect4Bound.upper
+        elif best_score >= beta:
+            bound = Connect4Bound.lower
+        else:
+            bound = Connect4Bound.exact
+        if mirrored:
+            best_column = board.mirror_column(best_column)
+        self._transposition_table.store(key, board.rows * board.columns - num_disks, bound, best_score, best_column)
+        return best_score
+
+    def score(self, board: Connect4Board) -> int:
+        """
+        Exact score of the current position of a board, from the point of view of the colour to move.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board, restored after the search
+
+        Returns
+        ----------
+        int
+            score
+        """
+        self.searched_nodes = 0
+        if self.cache is not None:
+            cached = self.cache.get(board)
+            if cached is not None:
+                return cached
+        colour = self.colour_to_move(board)
+        opponent_colour = Connect4DiskColour.yellow if colour == Connect4DiskColour.red else Connect4DiskColour.red
+        if board.has_connected(opponent_colour):
+            score = -(self.WIN_SCORE - len(board))
+        else:
+            rules = (board.rows, board.columns, board.connect)
+            if rules != self._table_rules:
+                self._transposition_table.clear()
+                self._table_rules = rules
+            centre = (board.columns - 1) / 2
+            self._column_order = sorted(range(board.columns), key=lambda c: abs(c - centre))
+            # Null-window searches narrowing the score down, faster than one search with a full window
+            low, high = -(self.WIN_SCORE - len(board)), self.WIN_SCORE - len(board)
+            while low < high:
+                middle = low + (high - low) // 2
+                if middle <= 0 and low // 2 < middle:
+                    middle = low // 2
+                elif middle >= 0 and high // 2 > middle:
+                    middle = high // 2
+                result = self._negamax(board, colour, opponent_colour, middle, middle + 1)
+                if result <= middle:
+                    high = result
+                else:
+                    low = result
+            score = low
+        if self.cache is not None:
+            self.cache.put(board, score)
+        return score
+
+    def _solution(self, board: Connect4Board, colour: Connect4DiskColour, score: int) -> Connect4Solution:
+        """
+        Convert a score to a solution.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board
+        colour: Connect4DiskColour
+            colour to move
+        score: int
+            score from the point of view of the colour to move
+
+        Returns
+        ----------
+        Connect4Solution
+            the solution
+        """
+        if score == 0:
+            return Connect4Solution(colour, 0, board.rows * board.columns - len(board))
+        return Connect4Solution(colour, 1 if score > 0 else -1, self.WIN_SCORE - abs(score) - len(board))
+
+    def solve(self, board: Connect4Board) -> Connect4Solution:
+        """
+        Solve the current position of a board.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board, restored after the search
+
+        Returns
+        ----------
+        Connect4Solution
+            value and distance to the end of the game
+        """
+        return self._solution(board, self.colour_to_move(board), self.score(board))
+
+    def solve_moves(self, board: Connect4Board) -> Dict[int, Connect4Solution]:
+        """
+        Solve every move available in the current position, e.g. to grade the moves of a player.
+
+        Parameters
+        ----------
+        board: Connect4Board
+            the board, restored after the search
+
+        Returns
+        ----------
+        Dict[int, Connect4Solution]
+            solution of every available column, from the point of view of the colour to move before the move
+        """
+        colour = self.colour_to_move(board)
+        solutions = {}
+        for column in board.available_columns():
+            board.insert_disk(colour, column)
+            try:
+                score = -self.score(board)
+            finally:
+                board.undo_last()
+            solutions[column] = self._solution(board, colour, score)
+        return solutions
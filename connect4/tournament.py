@@ -0,0 +1,258 @@
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from connect4.simulation import Connect4BatchResult, Connect4PlayerFactory, run_games
+
+
+@dataclass(frozen=True)
+class Connect4MatchResult:
+    """
+    Results of a batch of games between two tournament entrants
+
+    Attributes
+    ----------
+    red : str
+        name of the entrant playing red
+    yellow : str
+        name of the entrant playing yellow
+    result : Connect4BatchResult
+        results of the games
+    """
+
+    red: str
+    yellow: str
+    result: Connect4BatchResult
+
+
+class Connect4EloRatings:
+    """
+    Elo rating table
+
+    Attributes
+    ----------
+    ratings : Dict[str, float]
+        rating of every player
+    k_factor : float
+        maximum rating change per game
+    """
+
+    def __init__(self, initial_rating: float = 1500.0, k_factor: float = 16.0) -> None:
+        """
+        Parameters
+        ----------
+        initial_rating : float
+            rating of new players
+        k_factor : float
+            maximum rating change per game
+        """
+        self.ratings: Dict[str, float] = {}
+        self.k_factor: float = k_factor
+        self._initial_rating: float = initial_rating
+
+    def rating(self, name: str) -> float:
+        """
+        Rating of a player.
+
+        Parameters
+        ----------
+        name : str
+            player name
+
+        Returns
+        ----------
+        float
+            rating
+        """
+        return self.ratings.setdefault(name, self._initial_rating)
+
+    def update(self, name1: str, name2: str, score1: float, games: int = 1) -> None:
+        """
+        Update the ratings of two players after a batch of games against each other.
+
+        Parameters
+        ----------
+        name1 : str
+            first player name
+        name2 : str
+            second player name
+        score1 : float
+            points scored by the first player: 1 per win, 0.5 per draw
+        games : int
+            number of games played
+        """
+        expected1 = 1 / (1 + 10 ** ((self.rating(name2) - self.rating(name1)) / 400))
+        delta = self.k_factor * (score1 - games * expected1)
+        self.ratings[name1] += delta
+        self.ratings[name2] -= delta
+
+    def table(self) -> List[Tuple[str, float]]:
+        """
+        Rating table, from the highest rating.
+
+        Returns
+        ----------
+        List[Tuple[str, float]]
+            player names and ratings
+        """
+        return sorted(self.ratings.items(), key=lambda item: -item[1])
+
+
+def _play_chunk(
+    task: Tuple[Connect4PlayerFactory, Connect4PlayerFactory, int, int, int, int, int],
+) -> Connect4BatchResult:
+    """
+    Play a chunk of a match in a worker process.
+
+    Parameters
+    ----------
+    task: Tuple[Connect4PlayerFactory, Connect4PlayerFactory, int, int, int, int, int]
+        red factory, yellow factory, number of games, rows, columns, number of connected disks to win and seed
+
+    Returns
+    ----------
+    Connect4BatchResult
+        results of the games
+    """
+    red_factory, yellow_factory, num_games, rows, columns, connect, seed = task
+    return run_games(red_factory, yellow_factory, num_games, rows=rows, columns=columns, seed=seed, connect=connect)
+
+
+class Connect4Tournament:
+    """
+    Tournament between connect-4 players, played over a pool of worker processes.
+
+    Every pairing plays the same number of games with each colour. Games are split in chunks that run in parallel;
+    the results are streamed in scheduling order, so that ratings do not depend on the order the workers finish in.
+
+    Attributes
+    ----------
+    entrants : Dict[str, Connect4PlayerFactory]
+        player factories by name. They must be picklable, e.g. ``Connect4Player`` classes or ``functools.partial``
+    games_per_pairing : int
+        games played by every pairing with each colour
+    ratings : Connect4EloRatings
+        rating table, updated as results come in
+    """
+
+    def __init__(
+        self,
+        entrants: Dict[str, Connect4PlayerFactory],
+        games_per_pairing: int = 100,
+        games_per_chunk: int = 25,
+        rows: int = 6,
+        columns: int = 7,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+        ratings: Optional[Connect4EloRatings] = None,
+        connect: int = 4,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        entrants : Dict[str, Connect4PlayerFactory]
+            player factories by name. They must be picklable, e.g. ``Connect4Player`` classes or
+            ``functools.partial``
+        games_per_pairing : int
+            games played by every pairing with each colour
+        games_per_chunk : int
+            games played by a worker in one go
+        rows : int
+            number of rows of the board
+        columns : int
+            number of columns of the board
+        seed : int
+            seed from which the seed of every chunk is drawn
+        max_workers : Optional[int]
+            number of worker processes. None to use all the cores
+        ratings : Optional[Connect4EloRatings]
+            rating table to update. None for a new table
+        connect : int
+            number of connected disks to win
+        """
+        if len(entrants) < 2:
+            raise ValueError("A tournament needs at least two entrants.")
+        self.entrants: Dict[str, Connect4PlayerFactory] = entrants
+        self.games_per_pairing: int = games_per_pairing
+        self.ratings: Connect4EloRatings = Connect4EloRatings() if ratings is None else ratings
+        for name in entrants:
+            self.ratings.rating(name)
+        self._games_per_chunk: int = games_per_chunk
+        self._rows: int = rows
+        self._columns: int = columns
+        self._connect: int = connect
+        self._rng = random.Random(seed)
+        self._max_workers: int = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self._played: Set[Tuple[str, str]] = set()
+
+    def _play_pairings(self, pairings: List[Tuple[str, str]]) -> Iterator[Connect4MatchResult]:
+        """
+        Play the games of some pairings, with both colours, and update the ratings.
+
+        Parameters
+        ----------
+        pairings : List[Tuple[str, str]]
+            pairs of entrant names
+
+        Yields
+        ----------
+        Connect4MatchResult
+            results of every chunk of games, in scheduling order
+        """
+        chunks = []
+        for name1, name2 in pairings:
+            self._played.add((name1, name2))
+            self._played.add((name2, name1))
+            for red, yellow in [(name1, name2), (name2, name1)]:
+                for first_game in range(0, self.games_per_pairing, self._games_per_chunk):
+                    num_games = min(self._games_per_chunk, self.games_per_pairing - first_game)
+                    chunks.append((red, yellow, num_games, self._rng.getrandbits(32)))
+        tasks = [
+            (self.entrants[red], self.entrants[yellow], num_games, self._rows, self._columns, self._connect, seed)
+            for red, yellow, num_games, seed in chunks
+        ]
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            for (red, yellow, _, _), result in zip(chunks, executor.map(_play_chunk, tasks)):
+                self.ratings.update(red, yellow, result.red_wins + 0.5 * result.draws, result.num_games)
+                yield Connect4MatchResult(red, yellow, result)
+
+    def round_robin(self) -> Iterator[Connect4MatchResult]:
+        """
+        Play every entrant against every other one.
+
+        Yields
+        ----------
+        Connect4MatchResult
+            results of every chunk of games, in scheduling order
+        """
+        yield from self._play_pairings(list(itertools.combinations(self.entrants, 2)))
+
+    def swiss(self, rounds: int) -> Iterator[Connect4MatchResult]:
+        """
+        Play a Swiss tournament: at every round, entrants with close ratings are paired.
+
+        Pairings already played are avoided when possible. With an odd number of entrants, the lowest rated one
+        unable to be paired sits the round out.
+
+        Parameters
+        ----------
+        rounds : int
+            number of rounds
+
+        Yields
+        ----------
+        Connect4MatchResult
+            results of every chunk of games, in scheduling order
+        """
+        for _ in range(rounds):
+            unpaired = [name for name, _ in self.ratings.table() if name in self.entrants]
+            pairings = []
+            while len(unpaired) >= 2:
+                name1 = unpaired.pop(0)
+                opponents = [name for name in unpaired if (name1, name) not in self._played] or unpaired
+                unpaired.remove(opponents[0])
+                pairings.append((name1, opponents[0]))
+            yield from self._play_pairings(pairings)
@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import List, Optional
+
+# Odd 64-bit constant (2^64 / golden ratio) for multiplicative hashing
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+class Connect4Bound(Enum):
+    """Type of bound stored for a searched score"""
+
+    exact = auto()
+    lower = auto()
+    upper = auto()
+
+
+@dataclass(frozen=True)
+class Connect4TranspositionEntry:
+    """
+    Search result stored in a transposition table
+
+    Attributes
+    ----------
+    key : int
+        position key
+    depth : int
+        depth of the search, in plies
+    bound : Connect4Bound
+        whether the score is exact, a lower bound or an upper bound
+    score : float
+        searched score
+    best_column : int
+        best column found by the search
+    """
+
+    key: int
+    depth: int
+    bound: Connect4Bound
+    score: float
+    best_column: int
+
+
+class Connect4TranspositionTable:
+    """
+    Fixed-size transposition table for connect-4 searches.
+
+    Positions are hashed to a slot by multiplicative hashing of their key, so that every bit of the key affects the
+    slot whatever the table size. Every slot holds two entries: a depth-preferred one, replaced only by
+    searches at least as deep, and one that is always replaced. Memory is therefore bounded by the number of slots.
+
+    Attributes
+    ----------
+    size : int
+        number of slots
+    probes : int
+        number of lookups
+    hits : int
+        number of lookups that found the position
+    """
+
+    def __init__(self, size: int = 2**18) -> None:
+        """
+        Parameters
+        ----------
+        size : int
+            number of slots
+        """
+        if size <= 0:
+            raise ValueError("size must be positive.")
+        self.size: int = size
+        self.probes: int = 0
+        self.hits: int = 0
+        self._depth_preferred: List[Optional[Connect4TranspositionEntry]] = [None] * size
+        self._always_replace: List[Optional[Connect4TranspositionEntry]] = [None] * size
+
+    def __len__(self) -> int:
+        """
+        Number of stored entries.
+
+        Returns
+        ----------
+        int
+            Number of entries
+        """
+        return sum(entry is not None for entry in self._depth_preferred) + sum(
+            entry is not None for entry in self._always_replace
+        )
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        self._depth_preferred = [None] * self.size
+        self._always_replace = [None] * self.size
+        self.probes = 0
+        self.hits = 0
+
+    def _slot(self, key: int) -> int:
+        """
+        Slot of a position.
+
+        Parameters
+        ----------
+        key : int
+            position key
+
+        Returns
+        ----------
+        int
+            slot index
+        """
+        # hash() folds keys longer than 64 bits; the high bits of the product are mapped to the slot range
+        mixed = (hash(key) * _HASH_MULTIPLIER) & _MASK_64
+        return (mixed * self.size) >> 64
+
+    def store(self, key: int, depth: int, bound: Connect4Bound, score: float, best_column: int) -> None:
+        """
+        Store a search result.
+
+        Parameters
+        ----------
+        key : int
+            position key
+        depth : int
+            depth of the search, in plies
+        bound : Connect4Bound
+            whether the score is exact, a lower bound or an upper bound
+        score : float
+            searched score
+        best_column : int
+            best column found by the search
+        """
+        slot = self._slot(key)
+        entry = Connect4TranspositionEntry(key, depth, bound, score, best_column)
+        stored = self._depth_preferred[slot]
+        if stored is None or depth >= stored.depth:
+            self._depth_preferred[slot] = entry
+            if stored is not None and stored.key != key:
+                self._always_replace[slot] = stored
+        else:
+            self._always_replace[slot] = entry
+
+    def lookup(self, key: int) -> Optional[Connect4TranspositionEntry]:
+        """
+        Look up a position.
+
+        Parameters
+        ----------
+        key : int
+            position key
+
+        Returns
+        ----------
+        Optional[Connect4TranspositionEntry]
+            the stored entry, None if the position is not in the table
+        """
+        self.probes += 1
+        slot = self._slot(key)
+        for entry in (self._depth_preferred[slot], self._always_replace[slot]):
+            if entry is not None and entry.key == key:
+                self.hits += 1
+                return entry
+        return None
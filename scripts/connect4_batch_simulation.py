@@ -0,0 +1,69 @@
+import argparse
+import json
+import logging
+
+from connect4 import __version__
+from connect4.instrumentation import Connect4MetricsCollector
+from connect4.player import (
+    Connect4DummyPlayer,
+    Connect4MCTSAI,
+    Connect4NegamaxAI,
+    Connect4ShortSightedAI,
+)
+from connect4.record import Connect4GameWriter
+from connect4.simulation import run_games
+
+PLAYERS = {
+    "dummy": Connect4DummyPlayer,
+    "short_sighted": Connect4ShortSightedAI,
+    "negamax": Connect4NegamaxAI,
+    "mcts": Connect4MCTSAI,
+}
+
+parser = argparse.ArgumentParser(description="Play a batch of connect-4 games between two AI players.")
+parser.add_argument("--red", choices=PLAYERS, default="short_sighted")
+parser.add_argument("--yellow", choices=PLAYERS, default="dummy")
+parser.add_argument("--games", type=int, default=1000, help="number of games")
+parser.add_argument("--rows", type=int, default=6)
+parser.add_argument("--columns", type=int, default=7)
+parser.add_argument("--connect", type=int, default=4, help="number of connected disks to win")
+parser.add_argument("--seed", type=int, default=None)
+parser.add_argument("--output", default=None, help="JSON file for the results. Default: standard output")
+parser.add_argument("--record", default=None, help="game record file, appended to. Default: no record")
+parser.add_argument("--metrics", action="store_true", help="add p50/p99 timings of the players, board and artist")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info(f"Connect4 v: {__version__}")
+logging.info(f"{args.games} games, {args.red} (red) vs {args.yellow} (yellow).")
+
+collector = Connect4MetricsCollector()
+recorder = (
+    None
+    if args.record is None
+    else Connect4GameWriter(args.record, args.rows, args.columns, append=True, connect=args.connect)
+)
+try:
+    result = run_games(
+        PLAYERS[args.red],
+        PLAYERS[args.yellow],
+        args.games,
+        rows=args.rows,
+        columns=args.columns,
+        seed=args.seed,
+        recorder=recorder,
+        observers=[collector] if args.metrics else [],
+        connect=args.connect,
+    )
+finally:
+    if recorder is not None:
+        recorder.close()
+report = {"red": args.red, "yellow": args.yellow, **result.as_dict()}
+if args.metrics:
+    report["metrics"] = collector.as_dict()
+summary = json.dumps(report, indent=2)
+if args.output is None:
+    print(summary)
+else:
+    with open(args.output, "w") as f:
+        f.write(summary)
@@ -0,0 +1,39 @@
+import argparse
+import json
+import logging
+import sys
+
+from connect4 import __version__
+from connect4.benchmark import compare_benchmarks, run_benchmarks
+
+parser = argparse.ArgumentParser(description="Benchmark the connect-4 board, AI players and game loop.")
+parser.add_argument("--output", default=None, help="JSON file for the results. Default: standard output")
+parser.add_argument("--baseline", default=None, help="JSON results of a previous run to compare with")
+parser.add_argument(
+    "--max-slowdown",
+    type=float,
+    default=None,
+    help="exit with an error if a benchmark is slower than the baseline by more than this ratio, e.g. 1.2",
+)
+parser.add_argument("--quick", action="store_true", help="few operations per benchmark, to check the suite")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info(f"Connect4 v: {__version__}")
+
+report = run_benchmarks(quick=args.quick)
+summary = json.dumps(report, indent=2)
+if args.output is None:
+    print(summary)
+else:
+    with open(args.output, "w") as f:
+        f.write(summary)
+
+if args.baseline is not None:
+    with open(args.baseline) as f:
+        ratios = compare_benchmarks(json.load(f), report)
+    for key, ratio in ratios.items():
+        logging.info(f"{key}: {ratio:.2f}x the baseline time")
+    if args.max_slowdown is not None and any(ratio > args.max_slowdown for ratio in ratios.values()):
+        logging.error(f"Benchmarks slower than {args.max_slowdown}x the baseline")
+        sys.exit(1)
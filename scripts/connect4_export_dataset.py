@@ -0,0 +1,26 @@
+import argparse
+import logging
+
+from connect4 import __version__
+from connect4.dataset import export_records
+
+parser = argparse.ArgumentParser(description="Export the positions of recorded connect-4 games to NumPy shards.")
+parser.add_argument("record", help="game record file")
+parser.add_argument("output", help="dataset directory")
+parser.add_argument("--shard-size", type=int, default=2**16, help="maximum number of positions per shard")
+parser.add_argument("--no-mirror", action="store_true", help="do not add the mirror image of every position")
+parser.add_argument("--keep-duplicates", action="store_true", help="export every occurrence of a position")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info(f"Connect4 v: {__version__}")
+logging.info(f"Exporting the positions of {args.record}.")
+
+writer = export_records(
+    args.record,
+    args.output,
+    shard_size=args.shard_size,
+    mirror=not args.no_mirror,
+    deduplicate=not args.keep_duplicates,
+)
+logging.info(f"{writer.num_positions} positions written to {writer.num_shards} shards in {args.output}")
@@ -0,0 +1,24 @@
+import argparse
+import logging
+
+from connect4 import __version__
+from connect4.book import build_opening_book, write_opening_book
+
+parser = argparse.ArgumentParser(description="Generate a connect-4 opening book.")
+parser.add_argument("output", help="opening book file")
+parser.add_argument("--plies", type=int, default=4, help="positions with up to this number of disks are searched")
+parser.add_argument("--depth", type=int, default=8, help="search depth of every position")
+parser.add_argument("--rows", type=int, default=6)
+parser.add_argument("--columns", type=int, default=7)
+parser.add_argument("--connect", type=int, default=4, help="number of connected disks to win")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info(f"Connect4 v: {__version__}")
+logging.info(f"Opening book up to {args.plies} plies, search depth {args.depth}.")
+
+entries = build_opening_book(
+    args.plies, rows=args.rows, columns=args.columns, max_depth=args.depth, connect=args.connect
+)
+write_opening_book(args.output, args.rows, args.columns, entries, connect=args.connect)
+logging.info(f"{len(entries)} positions written to {args.output}")
@@ -0,0 +1,57 @@
+import argparse
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from connect4 import __version__
+from connect4.player import (
+    Connect4DummyPlayer,
+    Connect4MCTSAI,
+    Connect4NegamaxAI,
+    Connect4ShortSightedAI,
+)
+from connect4.server import Connect4GameServer
+from connect4.transposition import Connect4TranspositionTable
+
+# One bounded table shared by all the negamax games, instead of a 2**18-slot table per game
+NEGAMAX_TABLE = Connect4TranspositionTable()
+
+OPPONENTS = {
+    "dummy": Connect4DummyPlayer,
+    "short_sighted": Connect4ShortSightedAI,
+    "negamax": partial(Connect4NegamaxAI, max_time=0.5, transposition_table=NEGAMAX_TABLE),
+    "mcts": partial(Connect4MCTSAI, max_time=0.5),
+}
+
+parser = argparse.ArgumentParser(description="Host connect-4 games for remote clients over TCP (JSON lines).")
+parser.add_argument("--host", default="127.0.0.1")
+parser.add_argument("--port", type=int, default=4000)
+parser.add_argument("--rows", type=int, default=6)
+parser.add_argument("--columns", type=int, default=7)
+parser.add_argument("--workers", type=int, default=None, help="threads running the AI moves. Default: Python's")
+parser.add_argument("--move-timeout", type=float, default=None, help="seconds allowed per move. Default: no limit")
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info(f"Connect4 v: {__version__}")
+
+
+async def main() -> None:
+    with ThreadPoolExecutor(args.workers) as executor:
+        server = Connect4GameServer(
+            OPPONENTS,
+            rows=args.rows,
+            columns=args.columns,
+            executor=executor,
+            move_timeout=args.move_timeout,
+        )
+        port = await server.start(args.host, args.port)
+        logging.info(f"Serving on {args.host}:{port}, opponents: {', '.join(OPPONENTS)}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+
+asyncio.run(main())
@@ -0,0 +1,40 @@
+import argparse
+import logging
+from functools import partial
+
+from connect4 import __version__
+from connect4.player import (
+    Connect4DummyPlayer,
+    Connect4NegamaxAI,
+    Connect4ShortSightedAI,
+)
+from connect4.tournament import Connect4Tournament
+
+ENTRANTS = {
+    "dummy": Connect4DummyPlayer,
+    "short_sighted": Connect4ShortSightedAI,
+    "negamax_depth2": partial(Connect4NegamaxAI, max_time=None, max_depth=2),
+    "negamax_depth4": partial(Connect4NegamaxAI, max_time=None, max_depth=4),
+}
+
+parser = argparse.ArgumentParser(description="Play a tournament between connect-4 AI players.")
+parser.add_argument("--games", type=int, default=100, help="games per pairing and colour")
+parser.add_argument("--swiss", type=int, default=None, help="number of Swiss rounds. Default: round robin")
+parser.add_argument("--workers", type=int, default=None, help="worker processes. Default: all the cores")
+parser.add_argument("--connect", type=int, default=4, help="number of connected disks to win")
+parser.add_argument("--seed", type=int, default=0)
+args = parser.parse_args()
+
+logging.basicConfig(level=logging.INFO)
+logging.info(f"Connect4 v: {__version__}")
+
+tournament = Connect4Tournament(
+    ENTRANTS, games_per_pairing=args.games, seed=args.seed, max_workers=args.workers, connect=args.connect
+)
+matches = tournament.round_robin() if args.swiss is None else tournament.swiss(args.swiss)
+for match in matches:
+    logging.info(
+        f"{match.red} vs {match.yellow}: {match.result.red_wins}-{match.result.yellow_wins}-{match.result.draws}",
+    )
+for name, rating in tournament.ratings.table():
+    logging.info(f"{name}: {rating:.0f}")
@@ -0,0 +1,81 @@
+import random
+import subprocess
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from connect4.artist import Connect4ArtistMatplotlib
+from connect4.board import Connect4Board, Connect4DiskColour
+
+
+def _count_full_draws(monkeypatch, artist):
+    calls = []
+    draw = artist._fig.canvas.draw
+
+    def counting_draw(*args, **kwargs):
+        calls.append(1)
+        return draw(*args, **kwargs)
+
+    monkeypatch.setattr(artist._fig.canvas, "draw", counting_draw)
+    return calls
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_artist_updates_one_image(monkeypatch, incremental):
+    rng = random.Random(0)
+    board = Connect4Board(rows=6, columns=7)
+    artist = Connect4ArtistMatplotlib(board, incremental=incremental)
+    full_draws = _count_full_draws(monkeypatch, artist)
+    artist.draw()
+    for _ in range(20):
+        board.insert_disk(rng.choice([Connect4DiskColour.red, Connect4DiskColour.yellow]), rng.choice(range(7)))
+        if rng.random() < 0.2:
+            board.undo_last()
+        artist.draw()
+        assert np.array_equal(artist._image.get_array(), board.as_matrix())
+    assert len(artist._axis.images) == 1
+    # Only the first draw redraws the whole figure when blitting
+    assert len(full_draws) == 1 if incremental else len(full_draws) > 1
+    plt.close(artist._fig)
+
+
+def test_artist_throttling(monkeypatch):
+    board = Connect4Board(rows=2, columns=2)
+    artist = Connect4ArtistMatplotlib(board, min_interval=60)
+    refreshes = []
+    refresh = artist._refresh
+
+    def counting_refresh(full=False):
+        refreshes.append(full)
+        refresh(full)
+
+    monkeypatch.setattr(artist, "_refresh", counting_refresh)
+    artist.draw()
+    board.insert_disk(Connect4DiskColour.red, 0)
+    artist.draw()
+    board.insert_disk(Connect4DiskColour.yellow, 0)
+    artist.draw()
+    assert len(refreshes) == 1
+    # The changes are shown once the board is full
+    board.insert_disk(Connect4DiskColour.red, 1)
+    board.insert_disk(Connect4DiskColour.yellow, 1)
+    artist.draw()
+    assert len(refreshes) == 2
+    assert np.array_equal(artist._image.get_array(), board.as_matrix())
+    plt.close(artist._fig)
+
+
+def test_matplotlib_imported_lazily():
+    code = (
+        "import sys\n"
+        "from connect4.artist import Connect4ArtistTrivial\n"
+        "from connect4.board import Connect4Board\n"
+        "from connect4.simulation import run_games\n"
+        "from connect4.player import Connect4ShortSightedAI\n"
+        "run_games(Connect4ShortSightedAI, Connect4ShortSightedAI, 2, seed=0)\n"
+        "print(sorted(m for m in ('matplotlib', 'numpy', 'asyncio', 'multiprocessing') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
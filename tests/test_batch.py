@@ -0,0 +1,69 @@
+import random
+
+import numpy as np
+import pytest
+
+from connect4.batch import Connect4BoardBatch
+from connect4.board import Connect4Board, Connect4DiskColour
+
+
+def _random_boards(num_boards, seed):
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(num_boards):
+        board = Connect4Board(rows=6, columns=7)
+        colour = Connect4DiskColour.red
+        for _ in range(rng.randrange(0, 42)):
+            disk = board.insert_disk(colour, rng.choice(board.available_columns()))
+            if board.max_num_connected_disks(disk) >= 4:
+                break
+            colour = Connect4DiskColour.yellow if colour == Connect4DiskColour.red else Connect4DiskColour.red
+        boards.append(board)
+    return boards
+
+
+def test_from_boards():
+    boards = _random_boards(20, seed=0)
+    batch = Connect4BoardBatch.from_boards(boards)
+    assert len(batch) == 20
+    for idx, board in enumerate(boards):
+        np.testing.assert_array_equal(batch.cells[idx], board.as_matrix())
+        np.testing.assert_array_equal(
+            np.flatnonzero(batch.available_columns()[idx]),
+            board.available_columns(),
+        )
+        np.testing.assert_array_equal(batch.board(idx).as_matrix(), board.as_matrix())
+
+
+def test_winners():
+    boards = _random_boards(50, seed=1)
+    winners = Connect4BoardBatch.from_boards(boards).winners()
+    for board, winner in zip(boards, winners):
+        if board.has_connected(Connect4DiskColour.red):
+            assert winner == Connect4DiskColour.red.value
+        elif board.has_connected(Connect4DiskColour.yellow):
+            assert winner == Connect4DiskColour.yellow.value
+        else:
+            assert winner == Connect4DiskColour.invalid.value
+
+
+def test_insert():
+    batch = Connect4BoardBatch(3, rows=2, columns=3)
+    rows = batch.insert(np.array([0, 0, 2]), Connect4DiskColour.red)
+    np.testing.assert_array_equal(rows, [0, 0, 0])
+    rows = batch.insert(np.array([0, 1, 2]), np.array([-1, -1, -1]), active=np.array([True, False, True]))
+    np.testing.assert_array_equal(rows, [1, -1, 1])
+    np.testing.assert_array_equal(batch.available_columns()[0], [False, True, True])
+    with pytest.raises(ValueError):
+        batch.insert(np.array([0, 0, 0]), Connect4DiskColour.red)
+
+
+def test_random_playouts():
+    batch = Connect4BoardBatch(100, rows=6, columns=7)
+    winners = batch.random_playouts(Connect4DiskColour.red, rng=np.random.default_rng(0))
+    assert np.all(np.isin(winners, [-1, 0, 1]))
+    assert np.all((winners != 0) | batch.is_full())
+    np.testing.assert_array_equal(batch.winners(), winners)
+    disks = batch.heights.sum(axis=1)
+    red_disks = (batch.cells == 1).sum(axis=(1, 2))
+    np.testing.assert_array_equal(red_disks, (disks + 1) // 2)
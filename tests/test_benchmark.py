@@ -0,0 +1,46 @@
+import json
+
+from connect4.benchmark import (
+    board_benchmarks,
+    compare_benchmarks,
+    random_position,
+    run_benchmarks,
+)
+from connect4.board import Connect4DiskColour
+
+
+def test_random_position():
+    for fill_level in (0.0, 0.5, 0.95):
+        board = random_position(fill_level)
+        assert len(board) <= round(fill_level * 42)
+        assert not board.has_connected(Connect4DiskColour.red) and not board.has_connected(Connect4DiskColour.yellow)
+    assert random_position(0.5).moves == random_position(0.5).moves
+    assert len(random_position(0.5)) == 21
+
+
+def test_board_benchmarks():
+    results = board_benchmarks(fill_levels=[0.0, 0.5], number=10, repeats=2)
+    assert [result.key for result in results[:10]] == [
+        "insert_disk[fill_level=0.0]",
+        "push_move[fill_level=0.0]",
+        "available_columns[fill_level=0.0]",
+        "max_num_connected_disks[fill_level=0.0]",
+        "connections_after[fill_level=0.0]",
+        "wins_after[fill_level=0.0]",
+        "is_winning_move[fill_level=0.0]",
+        "as_matrix[fill_level=0.0]",
+        "copy[fill_level=0.0]",
+        "to_bytes[fill_level=0.0]",
+    ]
+    assert len(results) == 20
+    assert all(len(result.times) == 2 and 0 < result.best <= result.median for result in results)
+
+
+def test_run_and_compare_benchmarks():
+    report = json.loads(json.dumps(run_benchmarks(quick=True)))
+    keys = [result["key"] for result in report["results"]]
+    assert "short_sighted.choose_column[fill_level=0.5]" in keys
+    assert "game.play[players=dummy]" in keys
+    assert len(set(keys)) == len(keys)
+    ratios = compare_benchmarks(report, report)
+    assert set(ratios) == set(keys) and all(ratio == 1 for ratio in ratios.values())
@@ -1,9 +1,15 @@
+import copy
+import pickle
+import random
+
+import numpy as np
 import pytest
 
 from connect4.board import (
     Connect4Board,
     Connect4Disk,
     Connect4DiskColour,
+    Connect4InvalidMove,
     consecutive_elements,
 )
 
@@ -114,3 +120,381 @@ def test_diagonal_connections(insertion_list, disk, expected_connections):
         board.insert_disk(colour, column_index=column)
     diag1_connections, diag2_connections = board._diagonally_connected_disks(disk)
     assert len(diag1_connections) == expected_connections[0] and len(diag2_connections) == expected_connections[1]
+
+
+def _brute_force_max_connections(matrix, disk):
+    max_connections = 1
+    for d_row, d_column in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+        connections = 1
+        for sign in (1, -1):
+            row, column = disk.row + sign * d_row, disk.column + sign * d_column
+            while 0 <= row < matrix.shape[0] and 0 <= column < matrix.shape[1]:
+                if matrix[row, column] != disk.colour.value:
+                    break
+                connections += 1
+                row, column = row + sign * d_row, column + sign * d_column
+        max_connections = max(max_connections, connections)
+    return max_connections
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_max_num_connected_disks_random_games(seed):
+    rng = random.Random(seed)
+    board = Connect4Board(rows=6, columns=7)
+    colour = r
+    while not board.is_full():
+        disk = board.insert_disk(colour, rng.choice(board.available_columns()))
+        assert board.max_num_connected_disks(disk) == _brute_force_max_connections(board.as_matrix(), disk)
+        colour = y if colour == r else r
+
+
+def test_has_connected():
+    board = Connect4Board(rows=6, columns=7)
+    for column in [0, 1, 2]:
+        board.insert_disk(r, column)
+        board.insert_disk(y, column)
+    assert board.has_connected(r, 3) is True
+    assert board.has_connected(r, 4) is False
+    board.insert_disk(r, 3)
+    assert board.has_connected(r, 4) is True
+    assert board.has_connected(y, 3) is True
+    assert board.has_connected(y, 4) is False
+
+
+def test_as_matrix():
+    board = Connect4Board(rows=3, columns=4)
+    board.insert_disk(r, 1)
+    board.insert_disk(y, 1)
+    board.insert_disk(y, 3)
+    expected = np.zeros((3, 4), dtype=int)
+    expected[0, 1], expected[1, 1], expected[0, 3] = r.value, y.value, y.value
+    np.testing.assert_array_equal(board.as_matrix(), expected)
+    assert board.available_columns() == [0, 1, 2, 3]
+    assert len(board) == 3
+
+
+@pytest.mark.parametrize("column", [-1, 7])
+def test_insert_invalid_column(column):
+    board = Connect4Board(rows=6, columns=7)
+    with pytest.raises(Connect4InvalidMove):
+        board.insert_disk(y, column)
+
+
+def test_insert_full_column():
+    board = Connect4Board(rows=2, columns=2)
+    board.insert_disk(y, 0)
+    board.insert_disk(r, 0)
+    with pytest.raises(Connect4InvalidMove):
+        board.insert_disk(y, 0)
+    assert board.available_columns() == [1]
+
+
+def test_undo_last():
+    board = Connect4Board(rows=6, columns=7)
+    empty_matrix = board.as_matrix()
+    board.insert_disk(r, 3)
+    board.insert_disk(y, 3)
+    board.insert_disk(r, 4)
+    assert board.moves == (3, 3, 4)
+    assert board.undo_last() == Connect4Disk(0, 4, r)
+    assert board.undo_last() == Connect4Disk(1, 3, y)
+    assert board.moves == (3,)
+    assert board.disks_in_column(3) == 1
+    assert board.undo_last() == Connect4Disk(0, 3, r)
+    assert len(board) == 0
+    np.testing.assert_array_equal(board.as_matrix(), empty_matrix)
+    with pytest.raises(Connect4InvalidMove):
+        board.undo_last()
+
+
+def test_pop_disk():
+    board = Connect4Board(rows=6, columns=7)
+    for colour, column in [(r, 0), (y, 1), (r, 0), (y, 2)]:
+        board.insert_disk(colour, column)
+    assert board.pop_disk(0) == Connect4Disk(1, 0, r)
+    assert board.moves == (0, 1, 2)
+    assert board.pop_disk(2) == Connect4Disk(0, 2, y)
+    assert board.moves == (0, 1)
+    assert board.max_num_connected_disks(board.insert_disk(r, 0)) == 2
+    with pytest.raises(Connect4InvalidMove):
+        board.pop_disk(5)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_insert_undo_roundtrip(seed):
+    rng = random.Random(seed)
+    board = Connect4Board(rows=6, columns=7)
+    colour = r
+    snapshots = []
+    while not board.is_full():
+        snapshots.append(board.as_matrix())
+        board.insert_disk(colour, rng.choice(board.available_columns()))
+        colour = y if colour == r else r
+    while snapshots:
+        board.undo_last()
+        np.testing.assert_array_equal(board.as_matrix(), snapshots.pop())
+    assert not board.has_connected(r, 1) and not board.has_connected(y, 1)
+
+
+def test_position_key():
+    board1 = Connect4Board(rows=6, columns=7)
+    board2 = Connect4Board(rows=6, columns=7)
+    assert board1.position_key() == board2.position_key()
+    for column in [3, 2, 3]:
+        board1.insert_disk(r, column)
+    board1.insert_disk(y, 2)
+    for colour, column in [(r, 3), (r, 2), (y, 2), (r, 3)]:
+        board2.insert_disk(colour, column)
+    assert board1.position_key() == board2.position_key()
+    board2.undo_last()
+    board2.insert_disk(y, 3)
+    assert board1.position_key() != board2.position_key()
+
+
+def test_position_key_unique():
+    keys = {}
+    for seed in range(20):
+        rng = random.Random(seed)
+        board = Connect4Board(rows=4, columns=4)
+        while not board.is_full():
+            board.insert_disk(rng.choice([r, y]), rng.choice(board.available_columns()))
+            matrix = board.as_matrix()
+            assert keys.setdefault(board.position_key(), matrix.tobytes()) == matrix.tobytes()
+
+
+@pytest.mark.parametrize("rows, columns", [(6, 7), (4, 4), (5, 8)])
+def test_mirror_key(rows, columns):
+    rng = random.Random(rows * columns)
+    board = Connect4Board(rows=rows, columns=columns)
+    mirrored_board = Connect4Board(rows=rows, columns=columns)
+    while not board.is_full():
+        colour, column = rng.choice([r, y]), rng.choice(board.available_columns())
+        board.insert_disk(colour, column)
+        mirrored_board.insert_disk(colour, board.mirror_column(column))
+        assert board.mirror_key() == mirrored_board.position_key()
+        assert board.canonical_key() == mirrored_board.canonical_key() == min(board.position_key(), board.mirror_key())
+        canonical_column = board.canonical_column(column)
+        assert board.canonical_column(canonical_column) == column
+        if board.position_key() != board.mirror_key():
+            assert board.is_canonical() != mirrored_board.is_canonical()
+            assert mirrored_board.canonical_column(board.mirror_column(column)) == canonical_column
+
+
+def _brute_force_evaluation(matrix, colour, length=4):
+    open_lines = [0] * (length + 1)
+    threats = set()
+    rows, columns = matrix.shape
+    for d_row, d_column in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+        for row in range(rows):
+            for column in range(columns):
+                cells = [(row + i * d_row, column + i * d_column) for i in range(length)]
+                if not all(0 <= c_row < rows and 0 <= c_col < columns for c_row, c_col in cells):
+                    continue
+                values = [matrix[cell] for cell in cells]
+                if -colour.value in values:
+                    continue
+                open_lines[values.count(colour.value)] += 1
+                if values.count(colour.value) == length - 1:
+                    threats.add(cells[values.index(0)])
+    return open_lines, sorted(threats)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_evaluation(seed):
+    rng = random.Random(seed)
+    board = Connect4Board(rows=6, columns=7)
+    while not board.is_full():
+        board.insert_disk(rng.choice([r, y]), rng.choice(board.available_columns()))
+        if rng.random() < 0.2:
+            board.pop_disk(rng.choice([c for c in range(board.columns) if board.disks_in_column(c)]))
+        matrix = board.as_matrix()
+        for colour in (r, y):
+            open_lines, threats = _brute_force_evaluation(matrix, colour)
+            assert [board.open_lines(colour, n) for n in range(5)] == open_lines
+            assert board.live_lines(colour) == sum(open_lines[1:])
+            assert board.threats(colour) == threats
+
+
+def test_heuristic_score():
+    board = Connect4Board(rows=6, columns=7)
+    assert board.heuristic_score(r) == board.heuristic_score(y) == 0
+    board.insert_disk(r, 3)
+    assert board.heuristic_score(r) == -board.heuristic_score(y) > 0
+    board.insert_disk(r, 2)
+    board.insert_disk(r, 4)
+    assert board.threats(r) == [(0, 1), (0, 5)]
+    board.undo_last()
+    board.undo_last()
+    board.undo_last()
+    assert board.heuristic_score(r) == 0
+    assert board.threats(r) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_evaluation_built_on_first_query(seed):
+    rng = random.Random(seed)
+    board = Connect4Board(rows=6, columns=7)
+    for _ in range(rng.randrange(1, 30)):
+        board.insert_disk(rng.choice([r, y]), rng.choice(board.available_columns()))
+    for colour in (r, y):
+        open_lines, threats = _brute_force_evaluation(board.as_matrix(), colour)
+        assert [board.open_lines(colour, n) for n in range(5)] == open_lines
+        assert board.threats(colour) == threats
+    board.undo_last()
+    open_lines, threats = _brute_force_evaluation(board.as_matrix(), r)
+    assert [board.open_lines(r, n) for n in range(5)] == open_lines
+    assert board.threats(r) == threats
+
+
+@pytest.mark.parametrize("rows, columns", [(6, 7), (4, 5), (9, 11)])
+def test_copy_and_serialization(rows, columns):
+    rng = random.Random(rows)
+    board = Connect4Board(rows=rows, columns=columns)
+    sizes = set()
+    for _ in range(rows * columns):
+        sizes.add(len(board.to_bytes()))
+        restored = Connect4Board.from_bytes(board.to_bytes())
+        assert np.array_equal(restored.as_matrix(), board.as_matrix())
+        assert restored.key() == board.key() and restored.available_columns() == board.available_columns()
+        assert sorted(restored.moves) == sorted(board.moves)
+        pickled = pickle.loads(pickle.dumps(board))
+        assert pickled.moves == board.moves and pickled.key() == board.key()
+        board.insert_disk(rng.choice([r, y]), rng.choice(board.available_columns()))
+    assert len(sizes) == 1
+    assert Connect4Board(rows=rows, columns=columns).key() != board.key()
+    # Boards of different sizes have different keys
+    assert Connect4Board(rows=rows + 1, columns=columns).key() != Connect4Board(rows=rows, columns=columns).key()
+
+
+def test_copy_is_independent():
+    board = Connect4Board(rows=6, columns=7)
+    for column in [3, 3, 2, 4]:
+        board.insert_disk(r if len(board) % 2 == 0 else y, column)
+    score = board.heuristic_score(r)
+    for board_copy in (board.copy(), copy.deepcopy(board)):
+        board_copy.insert_disk(r, 1)
+        assert board_copy.threats(r) == [(0, 0)]
+        assert len(board) == 4 and board.moves == (3, 3, 2, 4)
+        assert board.heuristic_score(r) == score and board.threats(r) == []
+        board_copy.undo_last()
+        assert board_copy.heuristic_score(r) == score
+
+
+def test_from_bytes_errors():
+    board = Connect4Board(rows=6, columns=7)
+    board.insert_disk(r, 3)
+    data = board.to_bytes()
+    with pytest.raises(ValueError):
+        Connect4Board.from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        Connect4Board.from_bytes(data[:4] + bytes(len(data) - 4))
+    with pytest.raises(ValueError):
+        Connect4Board.from_bytes(data, moves=[2])
+    assert Connect4Board.from_bytes(data, moves=[3]).moves == (3,)
+
+
+def test_disk_is_slotted():
+    disk = Connect4Disk(1, 2, r)
+    assert not hasattr(disk, "__dict__")
+    assert pickle.loads(pickle.dumps(disk)) == disk
+    with pytest.raises(AttributeError):
+        disk.row = 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_int_fast_paths(seed):
+    rng = random.Random(seed)
+    board = Connect4Board(rows=6, columns=7)
+    reference = Connect4Board(rows=6, columns=7)
+    board.threats(r)
+    while not board.is_full():
+        colour = rng.choice([r, y])
+        column = rng.choice(board.available_columns())
+        connections = board.connections_after(colour, column)
+        assert board.push_move(colour, column) == reference.disks_in_column(column)
+        assert connections == min(4, reference.max_num_connected_disks(reference.insert_disk(colour, column)))
+        assert board.key() == reference.key() and board.threats(colour) == reference.threats(colour)
+    with pytest.raises(Connect4InvalidMove):
+        board.connections_after(r, 0)
+    with pytest.raises(Connect4InvalidMove):
+        board.push_move(r, 0)
+    while len(board):
+        assert board.pop_move() == reference.undo_last().column
+        assert board.key() == reference.key()
+    with pytest.raises(Connect4InvalidMove):
+        board.pop_move()
+    assert board.threats(r) == []
+
+
+def test_win_detection():
+    board = Connect4Board(rows=6, columns=7)
+    for column in [0, 0, 1, 1, 2, 2]:
+        board.push_move(r if len(board) % 2 == 0 else y, column)
+    assert board.is_winning_move(r, 3) and not board.is_winning_move(y, 3)
+    assert not board.is_winning_move(r, 4)
+    # Before the insertion, a disk is checked as if it were on the board
+    disk = Connect4Disk(0, 3, r)
+    assert board.wins_after(disk) and board.wins_after(Connect4Disk(1, 3, y))
+    assert board.insert_disk(r, 3) == disk and board.wins_after(disk)
+    assert not board.wins_after(Connect4Disk(0, 3, Connect4DiskColour.invalid))
+    for _ in range(6):
+        board.push_move(y, 6)
+    with pytest.raises(Connect4InvalidMove):
+        board.is_winning_move(r, 6)
+    assert Connect4Board(rows=3, columns=3, connect=1).is_winning_move(y, 1)
+
+
+def test_cell():
+    board = Connect4Board(rows=6, columns=7)
+    for column in [3, 3, 2]:
+        board.insert_disk(r if len(board) % 2 == 0 else y, column)
+    matrix = board.as_matrix()
+    assert all(board.cell(row, column).value == matrix[row, column] for row in range(6) for column in range(7))
+
+
+def _brute_force_max_connected(matrix, row, column):
+    rows, columns = matrix.shape
+    best = 1
+    for d_row, d_column in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+        connected = 1
+        for sign in (1, -1):
+            c_row, c_column = row + sign * d_row, column + sign * d_column
+            while 0 <= c_row < rows and 0 <= c_column < columns and matrix[c_row, c_column] == matrix[row, column]:
+                connected += 1
+                c_row, c_column = c_row + sign * d_row, c_column + sign * d_column
+        best = max(best, connected)
+    return best
+
+
+@pytest.mark.parametrize("rows, columns, connect", [(20, 20, 5), (9, 30, 6), (5, 5, 3), (100, 100, 5)])
+def test_connect_k(rows, columns, connect):
+    rng = random.Random(rows)
+    board = Connect4Board(rows=rows, columns=columns, connect=connect)
+    evaluated = Connect4Board.from_bytes(board.to_bytes())
+    assert evaluated.connect == connect
+    if rows * columns <= 400:
+        evaluated.threats(r)
+    for _ in range(min(rows * columns, 600)):
+        colour, column = rng.choice([r, y]), rng.choice(board.available_columns())
+        connections = board.connections_after(colour, column)
+        wins = board.is_winning_move(colour, column)
+        disk = board.insert_disk(colour, column)
+        evaluated.insert_disk(colour, column)
+        matrix = board.as_matrix()
+        expected = _brute_force_max_connected(matrix, disk.row, disk.column)
+        assert board.max_num_connected_disks(disk) == expected
+        assert connections == min(connect, expected)
+        assert wins == board.wins_after(disk) == (expected >= connect)
+    for colour in (r, y):
+        for num_disks in range(1, connect + 3):
+            expected = any(
+                _brute_force_max_connected(matrix, row, column) >= num_disks
+                for row in range(rows)
+                for column in range(columns)
+                if matrix[row, column] == colour.value
+            )
+            assert board.has_connected(colour, num_disks) == expected
+        if rows * columns <= 400:
+            open_lines, threats = _brute_force_evaluation(matrix, colour, connect)
+            assert [evaluated.open_lines(colour, n) for n in range(connect + 1)] == open_lines
+            assert evaluated.threats(colour) == threats
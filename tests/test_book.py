@@ -0,0 +1,70 @@
+import pytest
+
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.book import Connect4OpeningBook, build_opening_book, write_opening_book
+from connect4.player import Connect4NegamaxAI
+
+
+@pytest.fixture
+def book_path(tmp_path):
+    path = str(tmp_path / "book.bin")
+    entries = build_opening_book(max_plies=2, rows=4, columns=5, max_depth=3)
+    write_opening_book(path, 4, 5, entries)
+    return path, entries
+
+
+def test_book_roundtrip(book_path):
+    path, entries = book_path
+    book = Connect4OpeningBook(path)
+    assert (book.rows, book.columns) == (4, 5)
+    # A position and its mirror image share an entry
+    assert len(book) == len(entries) == 1 + 3 + 13
+    board = Connect4Board(rows=4, columns=5)
+    assert book.lookup(board) == entries[board.canonical_key()]
+    board.insert_disk(Connect4DiskColour.red, 2)
+    board.insert_disk(Connect4DiskColour.yellow, 2)
+    assert book.lookup(board) == entries[board.canonical_key()]
+    board.insert_disk(Connect4DiskColour.red, 0)
+    board.insert_disk(Connect4DiskColour.yellow, 0)
+    assert book.lookup(board) is None
+    assert book.lookup(Connect4Board(rows=6, columns=7)) is None
+    assert book.connect == 4 and book.lookup(Connect4Board(rows=4, columns=5, connect=2)) is None
+
+
+def test_book_connect_k(tmp_path):
+    path = str(tmp_path / "book.bin")
+    entries = build_opening_book(max_plies=1, rows=4, columns=4, max_depth=3, connect=3)
+    write_opening_book(path, 4, 4, entries, connect=3)
+    book = Connect4OpeningBook(path)
+    assert book.connect == 3
+    board = Connect4Board(rows=4, columns=4, connect=3)
+    assert book.lookup(board) == entries[board.canonical_key()]
+    assert book.lookup(Connect4Board(rows=4, columns=4)) is None
+
+
+def test_book_move_played(book_path):
+    path, entries = book_path
+    board = Connect4Board(rows=4, columns=5)
+    board.insert_disk(Connect4DiskColour.red, 1)
+    ai = Connect4NegamaxAI(board, Connect4DiskColour.yellow, opening_book=Connect4OpeningBook(path))
+    assert ai.choose_column() == board.canonical_column(entries[board.canonical_key()][0])
+    assert ai.searched_nodes == 0
+
+
+def test_book_mirrored_lookup(book_path):
+    path, _ = book_path
+    book = Connect4OpeningBook(path)
+    for column in range(5):
+        board = Connect4Board(rows=4, columns=5)
+        board.insert_disk(Connect4DiskColour.red, column)
+        mirrored_board = Connect4Board(rows=4, columns=5)
+        mirrored_board.insert_disk(Connect4DiskColour.red, 4 - column)
+        best_column, score = book.lookup(board)
+        assert book.lookup(mirrored_board) == (4 - best_column, score)
+
+
+def test_invalid_book(tmp_path):
+    path = tmp_path / "invalid.bin"
+    path.write_bytes(b"\x00" * 32)
+    with pytest.raises(ValueError):
+        Connect4OpeningBook(str(path))
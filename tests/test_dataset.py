@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.dataset import Connect4DatasetWriter, export_records, load_shards
+from connect4.game import Connect4GameResult
+from connect4.player import Connect4DummyPlayer
+from connect4.record import Connect4GameWriter, read_games
+from connect4.simulation import run_games
+
+r = Connect4DiskColour.red
+y = Connect4DiskColour.yellow
+
+
+def _load(directory):
+    shards = list(load_shards(directory))
+    return tuple(np.concatenate([shard[i] for shard in shards]) for i in range(3)), shards
+
+
+def test_dataset_positions(tmp_path):
+    directory = str(tmp_path / "dataset")
+    with Connect4DatasetWriter(directory, 6, 7, mirror=False, deduplicate=False) as writer:
+        writer.add_game([3, 3, 2, 2, 1, 1, 0], Connect4GameResult.red_wins)
+    (positions, colours, outcomes), shards = _load(directory)
+    assert len(shards) == 1 and isinstance(shards[0][0], np.memmap)
+    assert positions.dtype == colours.dtype == outcomes.dtype == np.int8
+    assert positions.shape == (7, 6, 7)
+    board = Connect4Board(rows=6, columns=7)
+    colour = r
+    for i, column in enumerate([3, 3, 2, 2, 1, 1, 0]):
+        assert np.array_equal(positions[i], board.as_matrix(np.int8))
+        assert colours[i] == colour.value
+        board.insert_disk(colour, column)
+        colour = y if colour == r else r
+    assert outcomes.tolist() == [r.value] * 7
+
+
+def test_dataset_mirror_and_deduplicate(tmp_path):
+    directory = str(tmp_path / "dataset")
+    with Connect4DatasetWriter(directory, 6, 7) as writer:
+        writer.add_game([0, 6, 1], Connect4GameResult.draw)
+        writer.add_game([6, 0, 5], Connect4GameResult.yellow_wins)
+    (positions, colours, outcomes), _ = _load(directory)
+    # Empty board, then (0), (0, 6), and their mirror images (6), (6, 0): the mirrored game adds nothing
+    assert len(positions) == 5
+    assert len({position.tobytes() for position in positions}) == 5
+    assert outcomes.tolist() == [0] * 5
+    for position in positions:
+        assert any(np.array_equal(position[:, ::-1], other) for other in positions)
+
+
+@pytest.mark.parametrize("shard_size", [1, 10, 1000])
+def test_dataset_shards(tmp_path, shard_size):
+    directory = str(tmp_path / "dataset")
+    with Connect4DatasetWriter(directory, 6, 7, shard_size=shard_size, mirror=False, deduplicate=False) as writer:
+        writer.add_game(list(range(7)) * 3, Connect4GameResult.draw)
+    (positions, _, _), shards = _load(directory)
+    assert writer.num_positions == len(positions) == 21
+    assert writer.num_shards == len(shards) == -(-21 // shard_size)
+    assert all(len(shard[0]) <= shard_size for shard in shards)
+
+
+def test_export_records(tmp_path):
+    record_path = str(tmp_path / "games.c4r")
+    with Connect4GameWriter(record_path, 6, 7) as recorder:
+        run_games(Connect4DummyPlayer, Connect4DummyPlayer, 20, recorder=recorder, seed=0)
+    writer = export_records(record_path, str(tmp_path / "dataset"), shard_size=100)
+    (positions, colours, outcomes), _ = _load(str(tmp_path / "dataset"))
+    assert len(positions) == writer.num_positions
+    assert len({position.tobytes() for position in positions}) == len(positions)
+    num_moves = sum(len(record.moves) for record in read_games(record_path))
+    assert len(positions) <= 2 * num_moves
+    # Red moves with as many disks of each colour on the board
+    assert np.array_equal(colours == r.value, positions.sum(axis=(1, 2)) == 0)
+    assert set(outcomes.tolist()) <= {-1, 0, 1}
@@ -3,12 +3,13 @@ import time
 
 import pytest
 
-from connect4.artist import Connect4ArtistMatplotlib
+from connect4.artist import Connect4ArtistMatplotlib, Connect4ArtistTrivial
 from connect4.board import Connect4Board, Connect4DiskColour
 from connect4.game import Connect4Game, Connect4GameResult
 from connect4.player import (
     Connect4DummyPlayer,
     Connect4HumanPlayer,
+    Connect4NegamaxAI,
     Connect4ShortSightedAI,
 )
 
@@ -59,3 +60,29 @@ def test_game_dummy_vs_AI(monkeypatch, games_to_play=5):
         monkeypatch.setattr("sys.stdin", io.StringIO("a"))
         result = game.play()
         assert result == Connect4GameResult.yellow_wins
+
+
+def test_game_move_timeout():
+    board = Connect4Board(rows=4, columns=5)
+    game = Connect4Game(
+        board,
+        yellow_player=Connect4NegamaxAI(board, Connect4DiskColour.yellow, max_time=None),
+        red_player=Connect4NegamaxAI(board, Connect4DiskColour.red, max_time=None),
+        artist=Connect4ArtistTrivial(board),
+        move_timeout=0.02,
+    )
+    start = time.perf_counter()
+    result = game.play()
+    assert time.perf_counter() - start < 0.1 * board.rows * board.columns
+    assert result in Connect4GameResult
+    assert board.is_full() or result != Connect4GameResult.draw
+
+
+def test_game_connect_k(monkeypatch):
+    board = Connect4Board(rows=4, columns=4, connect=3)
+    human1 = Connect4HumanPlayer(board, Connect4DiskColour.red)
+    human2 = Connect4HumanPlayer(board, Connect4DiskColour.yellow)
+    game = Connect4Game(board, yellow_player=human2, red_player=human1, artist=Connect4ArtistTrivial(board))
+    monkeypatch.setattr("sys.stdin", io.StringIO("1\n1\n2\n2\n3\n"))
+    assert game.play() == Connect4GameResult.red_wins
+    assert len(board) == 5
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from connect4.artist import Connect4ArtistTrivial
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.game import Connect4Game, Connect4GameResult
+from connect4.instrumentation import (
+    Connect4GameObserver,
+    Connect4Histogram,
+    Connect4MetricsCollector,
+)
+from connect4.player import Connect4DummyPlayer
+from connect4.simulation import run_games
+
+
+class _EventLog(Connect4GameObserver):
+    def __init__(self):
+        self.events = []
+
+    def game_started(self, game):
+        self.events.append(("game_started", game))
+
+    def move_started(self, colour, ply):
+        self.events.append(("move_started", colour, ply))
+
+    def move_ended(self, event):
+        self.events.append(("move_ended", event))
+
+    def game_ended(self, result, num_moves):
+        self.events.append(("game_ended", result, num_moves))
+
+
+def _game(observers):
+    board = Connect4Board(rows=6, columns=7)
+    return Connect4Game(
+        board,
+        yellow_player=Connect4DummyPlayer(board, Connect4DiskColour.yellow),
+        red_player=Connect4DummyPlayer(board, Connect4DiskColour.red),
+        artist=Connect4ArtistTrivial(board),
+        observers=observers,
+    )
+
+
+def test_observer_events():
+    log = _EventLog()
+    game = _game([log])
+    result = game.play()
+    moves = game.board.moves
+    assert log.events[0] == ("game_started", game)
+    assert log.events[-1] == ("game_ended", result, len(moves))
+    move_events = log.events[1:-1]
+    assert len(move_events) == 2 * len(moves)
+    for ply, column in enumerate(moves):
+        colour = Connect4DiskColour.red if ply % 2 == 0 else Connect4DiskColour.yellow
+        assert move_events[2 * ply] == ("move_started", colour, ply)
+        event = move_events[2 * ply + 1][1]
+        assert (event.colour, event.column, event.ply) == (colour, column, ply)
+        assert min(event.choose_time, event.insert_time, event.win_check_time, event.draw_time) >= 0
+        assert event.total_time >= event.choose_time
+
+
+def test_histogram_quantiles():
+    rng = random.Random(0)
+    durations = [rng.lognormvariate(-9, 1) for _ in range(10000)]
+    histogram = Connect4Histogram()
+    for duration in durations:
+        histogram.add(duration)
+    durations.sort()
+    for q in (0.5, 0.99):
+        exact = durations[int(q * len(durations)) - 1]
+        assert exact <= histogram.quantile(q) <= exact * 2 ** (1 / 8) * 1.001
+    assert histogram.quantile(1) == histogram.max == durations[-1]
+    assert histogram.mean == pytest.approx(sum(durations) / len(durations))
+    merged = Connect4Histogram()
+    merged.merge(histogram)
+    merged.merge(histogram)
+    assert merged.count == 20000 and merged.quantile(0.5) == histogram.quantile(0.5)
+    assert Connect4Histogram().as_dict() == {"count": 0, "mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+
+
+def test_metrics_collector():
+    collector = Connect4MetricsCollector()
+    result = run_games(Connect4DummyPlayer, Connect4DummyPlayer, 20, observers=[collector], seed=0)
+    metrics = collector.as_dict()
+    assert metrics["counters"] == {
+        "games": 20,
+        "moves": result.num_moves,
+        "red_wins": result.red_wins,
+        "yellow_wins": result.yellow_wins,
+        "draw": result.draws,
+    }
+    histograms = metrics["histograms"]
+    assert histograms["move"]["count"] == histograms["draw"]["count"] == result.num_moves
+    assert histograms["choose_column.red"]["count"] + histograms["choose_column.yellow"]["count"] == result.num_moves
+    assert all(0 <= summary["p50"] <= summary["p99"] <= summary["max"] for summary in histograms.values())
+
+
+def test_game_without_observers():
+    game = _game(())
+    assert game.play() in Connect4GameResult
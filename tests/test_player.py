@@ -1,4 +1,7 @@
+import asyncio
 import io
+import random
+import time
 
 import pytest
 
@@ -6,8 +9,14 @@ from connect4.board import Connect4Board, Connect4DiskColour
 from connect4.player import (
     Connect4DummyPlayer,
     Connect4HumanPlayer,
+    Connect4MCTSAI,
+    Connect4NegamaxAI,
     Connect4ShortSightedAI,
 )
+from connect4.transposition import Connect4TranspositionTable
+
+y = Connect4DiskColour.yellow
+r = Connect4DiskColour.red
 
 
 def test_dummy_player():
@@ -46,3 +55,215 @@ def test_human_player(monkeypatch, list_inputs):
         col = human.choose_column()
         assert col < board.columns
         board.insert_disk(human.colour, col)
+
+
+def _play(board, moves):
+    colour = r
+    for column in moves:
+        board.insert_disk(colour, column)
+        colour = y if colour == r else r
+
+
+def test_negamax_AI_mirrored_transposition_table():
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [3, 3, 2, 4])
+    table = Connect4TranspositionTable()
+    first = Connect4NegamaxAI(board, r, max_time=None, max_depth=6, transposition_table=table)
+    first.choose_column()
+    mirrored_board = Connect4Board(rows=6, columns=7)
+    _play(mirrored_board, [3, 3, 4, 2])
+    second = Connect4NegamaxAI(mirrored_board, r, max_time=None, max_depth=6, transposition_table=table)
+    # The mirror image of the position is found in the table
+    assert second.choose_column() in mirrored_board.available_columns()
+    assert second.searched_nodes < first.searched_nodes
+    assert second.searched_score == first.searched_score
+
+
+@pytest.mark.parametrize(
+    "moves, colour, expected_column",
+    [
+        ([0, 6, 1, 6, 2], y, 3),  # block the horizontal threat
+        ([0, 6, 1, 6, 2, 6], r, 3),  # win rather than block
+        ([3, 3, 4, 4], r, 2),  # open three with two winning squares
+    ],
+)
+def test_negamax_AI_tactics(moves, colour, expected_column):
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, moves)
+    ai = Connect4NegamaxAI(board, colour, max_time=None, max_depth=4)
+    assert ai.choose_column() == expected_column
+    assert board.moves == tuple(moves)
+
+
+def test_negamax_AI_node_budget():
+    board = Connect4Board(rows=6, columns=7)
+    ai = Connect4NegamaxAI(board, r, max_time=None, max_nodes=500)
+    col = ai.choose_column()
+    assert col in board.available_columns()
+    assert ai.searched_nodes <= 501
+    assert len(board) == 0
+
+
+def test_negamax_AI_workers():
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [3, 3, 2, 4])
+    sequential = Connect4NegamaxAI(board, r, max_time=None, max_depth=5)
+    expected_column = sequential.choose_column()
+    with Connect4NegamaxAI(board, r, max_time=None, max_depth=5, workers=2) as ai:
+        for _ in range(2):
+            assert ai.choose_column() == expected_column
+            assert (ai.searched_depth, ai.searched_score) == (5, sequential.searched_score)
+        executor = ai._executor
+        assert executor is not None
+        board.insert_disk(r, expected_column)
+        board.insert_disk(y, 0)
+        ai.choose_column()
+        assert ai._executor is executor
+        assert len(board) == 6
+        ai.max_depth, ai.max_nodes = None, 500
+        assert ai.choose_column() in board.available_columns()
+        assert ai.searched_nodes <= 500 + board.columns
+    assert ai._executor is None
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [0, 6, 1, 6, 2])
+    with Connect4NegamaxAI(board, y, max_time=None, max_depth=4, workers=2) as ai:
+        assert ai.choose_column() == 3
+
+
+def test_negamax_AI_time_budget():
+    board = Connect4Board(rows=6, columns=7)
+    ai = Connect4NegamaxAI(board, r, max_time=0.2)
+    start = time.perf_counter()
+    ai.choose_column()
+    assert time.perf_counter() - start < 0.5
+    assert ai.searched_depth >= 1
+
+
+class _SlowPlayer(Connect4DummyPlayer):
+    def choose_column(self):
+        time.sleep(0.5)
+        return 0
+
+
+def test_async_move_timeout_fallback():
+    board = Connect4Board(rows=6, columns=7)
+    board.insert_disk(r, 0)
+    player = _SlowPlayer(board, y)
+
+    async def main():
+        start = time.perf_counter()
+        col = await player.choose_column_async(timeout=0.05)
+        # The slow choice is left to finish in the background
+        assert time.perf_counter() - start < 0.4
+        assert col in board.available_columns()
+        assert await player.choose_column_async() == 0
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_negamax_AI_async_move_timeout(workers):
+    board = Connect4Board(rows=6, columns=7)
+    ai = Connect4NegamaxAI(board, r, max_time=None, workers=workers)
+    start = time.perf_counter()
+    col = asyncio.run(ai.choose_column_async(timeout=0.2))
+    assert time.perf_counter() - start < 0.5
+    assert col in board.available_columns()
+    assert ai.searched_depth >= 1
+    assert len(board) == 0
+    # The interruption does not leak into the next move
+    ai.max_depth = 2
+    ai.choose_column()
+    assert ai.searched_depth == 2
+    ai.close()
+
+
+def test_MCTS_AI_async_move_timeout():
+    board = Connect4Board(rows=6, columns=7)
+    ai = Connect4MCTSAI(board, r, playouts=10**7, seed=0)
+    start = time.perf_counter()
+    col = asyncio.run(ai.choose_column_async(timeout=0.2))
+    assert time.perf_counter() - start < 0.5
+    assert col in board.available_columns()
+    assert len(board) == 0
+
+
+def test_negamax_AI_full_game():
+    random.seed(0)
+    board = Connect4Board(rows=6, columns=7)
+    players = [Connect4NegamaxAI(board, r, max_time=None, max_depth=3), Connect4DummyPlayer(board, y)]
+    idx = 0
+    while not board.is_full():
+        player = players[idx % 2]
+        disk = board.insert_disk(player.colour, player.choose_column())
+        if board.max_num_connected_disks(disk) >= 4:
+            break
+        idx += 1
+    assert board.has_connected(r, 4) or board.is_full()
+
+
+def test_negamax_AI_shared_transposition_table():
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [3, 3, 2, 4])
+    table = Connect4TranspositionTable()
+    first = Connect4NegamaxAI(board, r, max_time=None, max_depth=6, transposition_table=table)
+    first.choose_column()
+    second = Connect4NegamaxAI(board, r, max_time=None, max_depth=6, transposition_table=table)
+    assert second.choose_column() in board.available_columns()
+    assert second.searched_nodes < first.searched_nodes
+    assert table.hits > 0
+
+
+@pytest.mark.parametrize(
+    "moves, colour, expected_column",
+    [
+        ([0, 6, 1, 6, 2, 6], r, 3),
+        ([0, 6, 1, 6, 2], y, 3),
+    ],
+)
+def test_MCTS_AI_tactics(moves, colour, expected_column):
+    random.seed(0)
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, moves)
+    ai = Connect4MCTSAI(board, colour, playouts=2000)
+    assert ai.choose_column() == expected_column
+    assert board.moves == tuple(moves)
+
+
+def test_MCTS_AI_tree_reuse():
+    random.seed(0)
+    board = Connect4Board(rows=6, columns=7)
+    ai = Connect4MCTSAI(board, r, playouts=300)
+    column = ai.choose_column()
+    board.insert_disk(r, column)
+    board.insert_disk(y, 3)
+    reused_visits = ai._root.children[column].children[3].visits
+    ai.choose_column()
+    assert ai._root.visits >= reused_visits + 300 > 300
+
+
+def test_MCTS_AI_workers():
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [0, 6, 1, 6, 2, 6])
+    with Connect4MCTSAI(board, r, playouts=900, workers=2, seed=0) as ai:
+        assert ai.choose_column() == 3
+        assert ai._executor is not None
+    assert ai._executor is None
+    assert len(board) == 6
+
+
+def test_MCTS_AI_seeded():
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [3, 3, 2])
+    statistics = []
+    for _ in range(2):
+        ai = Connect4MCTSAI(board, y, playouts=200, seed=5)
+        ai.choose_column()
+        statistics.append(ai._root_statistics())
+    assert statistics[0] == statistics[1]
+
+
+def test_dummy_player_rng():
+    board = Connect4Board(rows=6, columns=7)
+    columns = [Connect4DummyPlayer(board, r, rng=random.Random(1)).choose_column() for _ in range(2)]
+    assert columns[0] == columns[1]
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from connect4.artist import Connect4ArtistTrivial
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.game import Connect4Game, Connect4GameResult
+from connect4.player import Connect4DummyPlayer
+from connect4.record import (
+    Connect4GameRecord,
+    Connect4GameWriter,
+    Connect4InvalidRecord,
+    read_games,
+)
+from connect4.simulation import run_games
+
+
+@pytest.mark.parametrize("rows, columns", [(6, 7), (4, 16), (20, 20)])
+def test_record_roundtrip(tmp_path, rows, columns):
+    path = str(tmp_path / "games.c4r")
+    games = [
+        ((), Connect4GameResult.draw),
+        ((0,), Connect4GameResult.red_wins),
+        (tuple(range(columns)) + (columns - 1, 0), Connect4GameResult.yellow_wins),
+    ]
+    with Connect4GameWriter(path, rows, columns) as writer:
+        for moves, result in games:
+            writer.write_game(moves, result)
+    assert list(read_games(path)) == [Connect4GameRecord(rows, columns, moves, result) for moves, result in games]
+
+
+def test_record_size(tmp_path):
+    path = str(tmp_path / "games.c4r")
+    with Connect4GameWriter(path, 6, 7) as writer:
+        writer.write_game([3] * 6 + [2] * 6 + [4] * 6 + [0] * 3, Connect4GameResult.red_wins)
+    # Header, result and number of moves, 21 moves in 11 bytes
+    assert os.path.getsize(path) == 12 + 3 + 11
+
+
+def test_record_append(tmp_path):
+    path = str(tmp_path / "games.c4r")
+    for moves in ([1, 2], [3]):
+        with Connect4GameWriter(path, 6, 7, append=True) as writer:
+            writer.write_game(moves, Connect4GameResult.draw)
+    assert [record.moves for record in read_games(path)] == [(1, 2), (3,)]
+    with pytest.raises(Connect4InvalidRecord):
+        Connect4GameWriter(path, 4, 4, append=True)
+    with pytest.raises(Connect4InvalidRecord):
+        Connect4GameWriter(path, 6, 7, append=True, connect=3)
+
+
+def test_record_connect_k(tmp_path):
+    path = str(tmp_path / "games.c4r")
+    with Connect4GameWriter(path, 4, 4, connect=3) as writer:
+        writer.write_game([0, 0, 1, 1, 2], Connect4GameResult.red_wins)
+    (record,) = read_games(path)
+    assert record == Connect4GameRecord(4, 4, (0, 0, 1, 1, 2), Connect4GameResult.red_wins, connect=3)
+    board = record.replay()
+    assert board.connect == 3 and board.has_connected(Connect4DiskColour.red)
+
+
+def test_record_corrupted(tmp_path):
+    path = str(tmp_path / "games.c4r")
+    with Connect4GameWriter(path, 6, 7) as writer:
+        writer.write_game([1, 2, 3], Connect4GameResult.draw)
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:-1])
+    with pytest.raises(Connect4InvalidRecord):
+        list(read_games(path))
+    with open(path, "wb") as f:
+        f.write(b"not a record")
+    with pytest.raises(Connect4InvalidRecord):
+        list(read_games(path))
+
+
+def test_game_recorder(tmp_path):
+    path = str(tmp_path / "games.c4r")
+    boards = []
+    with Connect4GameWriter(path, 6, 7) as writer:
+        for _ in range(10):
+            board = Connect4Board(rows=6, columns=7)
+            game = Connect4Game(
+                board,
+                yellow_player=Connect4DummyPlayer(board, Connect4DiskColour.yellow),
+                red_player=Connect4DummyPlayer(board, Connect4DiskColour.red),
+                artist=Connect4ArtistTrivial(board),
+                recorder=writer,
+            )
+            boards.append((board, game.play()))
+    records = list(read_games(path))
+    assert [(record.moves, record.result) for record in records] == [(board.moves, result) for board, result in boards]
+    assert all(
+        record.replay().as_matrix().tolist() == board.as_matrix().tolist()
+        for record, (board, _) in zip(records, boards)
+    )
+
+
+def test_run_games_recorder(tmp_path):
+    path = str(tmp_path / "games.c4r")
+    with Connect4GameWriter(path, 6, 7) as writer:
+        result = run_games(Connect4DummyPlayer, Connect4DummyPlayer, 50, recorder=writer, seed=0)
+    records = list(read_games(path))
+    assert len(records) == writer.num_games == 50
+    assert sum(len(record.moves) for record in records) == result.num_moves
+    assert sum(record.result == Connect4GameResult.red_wins for record in records) == result.red_wins
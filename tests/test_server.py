@@ -0,0 +1,191 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from connect4.artist import Connect4ArtistTrivial
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.game import Connect4Game, Connect4GameResult
+from connect4.player import (
+    Connect4DummyPlayer,
+    Connect4RemotePlayer,
+    Connect4ShortSightedAI,
+)
+from connect4.server import Connect4GameServer
+
+
+class _Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, port):
+        return cls(*await asyncio.open_connection("127.0.0.1", port))
+
+    async def send(self, **message):
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        await self.writer.drain()
+
+    async def receive(self):
+        return json.loads(await asyncio.wait_for(self.reader.readline(), timeout=10))
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def _play_random_game(client, rng, **new_game):
+    """Play random legal moves until the end of the game, return the game_over message and the moves seen."""
+    await client.send(type="new_game", **new_game)
+    started = await client.receive()
+    assert started["type"] == "game_started"
+    heights = [0] * started["columns"]
+    moves = []
+    while True:
+        message = await client.receive()
+        if message["type"] == "your_turn":
+            column = rng.choice([c for c, height in enumerate(heights) if height < started["rows"]])
+            await client.send(type="move", game=started["game"], column=column)
+        elif message["type"] == "move":
+            heights[message["column"]] += 1
+            moves.append(message["column"])
+        elif message["type"] == "game_over":
+            return message, moves
+        else:
+            raise AssertionError(message)
+
+
+def test_remote_player_async_game():
+    async def main():
+        board = Connect4Board(rows=6, columns=7)
+        turns = []
+        game = Connect4Game(
+            board,
+            yellow_player=Connect4RemotePlayer(board, Connect4DiskColour.yellow, on_turn=turns.append),
+            red_player=Connect4RemotePlayer(board, Connect4DiskColour.red, on_turn=turns.append),
+            artist=Connect4ArtistTrivial(board),
+        )
+        task = asyncio.create_task(game.play_async())
+        for ply, column in enumerate([3, 0, 3, 0, 3, 0, 3]):
+            while len(turns) <= ply:
+                await asyncio.sleep(0)
+            assert turns[ply] is (game.red_player if ply % 2 == 0 else game.yellow_player)
+            turns[ply].submit_move(column)
+        assert await task == Connect4GameResult.red_wins
+        assert board.moves == (3, 0, 3, 0, 3, 0, 3)
+        with pytest.raises(RuntimeError):
+            game.red_player.choose_column()
+
+    asyncio.run(main())
+
+
+def test_server_games_against_ai():
+    async def main():
+        server = Connect4GameServer({"dummy": Connect4DummyPlayer, "short_sighted": Connect4ShortSightedAI})
+        port = await server.start()
+        clients = [await _Client.connect(port) for _ in range(20)]
+        results = await asyncio.gather(
+            *(
+                _play_random_game(client, random.Random(i), opponent="short_sighted", colour=["red", "yellow"][i % 2])
+                for i, client in enumerate(clients)
+            )
+        )
+        for game_over, moves in results:
+            assert game_over["result"] in ("red_wins", "yellow_wins", "draw")
+            assert game_over["moves"] == moves
+        assert server.games_played == 20 and server.num_games == 0
+        for client in clients:
+            await client.close()
+        await server.close()
+
+    asyncio.run(main())
+
+
+def test_server_many_games_on_one_connection():
+    async def main():
+        server = Connect4GameServer({"dummy": Connect4DummyPlayer})
+        port = await server.start()
+        client = await _Client.connect(port)
+        rng = random.Random(0)
+        for _ in range(3):
+            await client.send(type="new_game", opponent="dummy", colour="yellow")
+        heights, results = {}, {}
+        while len(results) < 3:
+            message = await client.receive()
+            if message["type"] == "game_started":
+                heights[message["game"]] = [0] * message["columns"]
+            elif message["type"] == "move":
+                heights[message["game"]][message["column"]] += 1
+            elif message["type"] == "your_turn":
+                columns = [c for c, height in enumerate(heights[message["game"]]) if height < 6]
+                await client.send(type="move", game=message["game"], column=rng.choice(columns))
+            elif message["type"] == "game_over":
+                results[message["game"]] = message["result"]
+        assert len(heights) == 3 and set(results) == set(heights)
+        await client.close()
+        await server.close()
+
+    asyncio.run(main())
+
+
+def test_server_remote_opponents_and_errors():
+    async def main():
+        server = Connect4GameServer({"dummy": Connect4DummyPlayer}, rows=4, columns=4)
+        port = await server.start()
+        first, second = await _Client.connect(port), await _Client.connect(port)
+        await first.send(type="new_game", opponent="nobody")
+        assert (await first.receive())["type"] == "error"
+        await first.send(type="move", game=42, column=0)
+        assert (await first.receive())["type"] == "error"
+        first.writer.write(b"not json\n")
+        assert (await first.receive())["type"] == "error"
+
+        await first.send(type="new_game", opponent="remote")
+        assert (await first.receive()) == {"type": "waiting"}
+        await second.send(type="new_game", opponent="remote")
+        red_started, yellow_started = await first.receive(), await second.receive()
+        assert (red_started["colour"], yellow_started["colour"]) == ("red", "yellow")
+        assert red_started["game"] == yellow_started["game"]
+        game_id = red_started["game"]
+        assert (await first.receive()) == {"type": "your_turn", "game": game_id}
+        await second.send(type="move", game=game_id, column=0)
+        assert (await second.receive()) == {"type": "error", "message": "Not your turn"}
+        await first.send(type="move", game=game_id, column=7)
+        assert (await first.receive())["type"] == "error"
+        await first.send(type="move", game=game_id, column=1)
+        assert (await first.receive())["column"] == (await second.receive())["column"] == 1
+        assert (await second.receive()) == {"type": "your_turn", "game": game_id}
+
+        # The opponent disconnects: the game is aborted
+        await first.close()
+        assert (await second.receive()) == {"type": "game_over", "game": game_id, "result": "aborted", "moves": [1]}
+        assert server.games_played == 0
+        await second.close()
+        await server.close()
+
+    asyncio.run(main())
+
+
+def test_server_move_timeout():
+    async def main():
+        server = Connect4GameServer({"dummy": Connect4DummyPlayer}, move_timeout=0.01)
+        port = await server.start()
+        client = await _Client.connect(port)
+        await client.send(type="new_game", opponent="dummy", colour="red")
+        game_id = (await client.receive())["game"]
+        # The client never moves: fallback moves are played for it until the end of the game
+        turns, moves = 0, []
+        while (message := await client.receive())["type"] != "game_over":
+            if message["type"] == "your_turn":
+                turns += 1
+            else:
+                moves.append(message["column"])
+        assert message["game"] == game_id and message["moves"] == moves
+        assert turns == len(moves[::2])
+        assert server.games_played == 1
+        await client.close()
+        await server.close()
+
+    asyncio.run(main())
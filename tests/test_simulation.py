@@ -0,0 +1,57 @@
+import random
+
+from connect4.board import Connect4DiskColour
+from connect4.game import Connect4GameResult
+from connect4.player import Connect4DummyPlayer, Connect4ShortSightedAI
+from connect4.simulation import Connect4BatchResult, run_games
+
+
+def test_run_games():
+    result = run_games(Connect4ShortSightedAI, Connect4DummyPlayer, num_games=50, seed=0)
+    assert result.num_games == 50
+    assert result.red_wins > result.yellow_wins
+    assert sum(result.game_lengths.values()) == 50
+    assert min(result.game_lengths) >= 7
+    assert result.mean_move_time > 0
+
+
+def test_run_games_reproducible():
+    result1 = run_games(Connect4DummyPlayer, Connect4DummyPlayer, num_games=20, rows=4, columns=5, seed=3)
+    result2 = run_games(Connect4DummyPlayer, Connect4DummyPlayer, num_games=20, rows=4, columns=5, seed=3)
+    assert (result1.red_wins, result1.yellow_wins, result1.draws) == (
+        result2.red_wins,
+        result2.yellow_wins,
+        result2.draws,
+    )
+    assert result1.game_lengths == result2.game_lengths
+
+
+def test_batch_result_merge():
+    result1 = Connect4BatchResult()
+    result1.add(Connect4GameResult.red_wins, 7, 1.0)
+    result2 = Connect4BatchResult()
+    result2.add(Connect4GameResult.draw, 42, 3.0)
+    result2.add(Connect4GameResult.yellow_wins, 8, 1.0)
+    result1.merge(result2)
+    assert (result1.red_wins, result1.yellow_wins, result1.draws) == (1, 1, 1)
+    assert result1.num_moves == 57
+    assert result1.mean_move_time == 5.0 / 57
+    assert result1.as_dict()["game_lengths"] == {"7": 1, "8": 1, "42": 1}
+
+
+def test_run_games_move_times():
+    result = run_games(Connect4ShortSightedAI, Connect4DummyPlayer, num_games=10, seed=0)
+    red_times = result.move_times[Connect4DiskColour.red]
+    yellow_times = result.move_times[Connect4DiskColour.yellow]
+    assert red_times.moves + yellow_times.moves == result.num_moves
+    assert red_times.moves >= yellow_times.moves
+    assert 0 < red_times.mean <= red_times.max
+    assert set(result.as_dict()["move_times"]) == {"red", "yellow"}
+
+
+def test_run_games_restores_random_state():
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    run_games(Connect4DummyPlayer, Connect4DummyPlayer, num_games=2, seed=0)
+    assert random.random() == expected
@@ -0,0 +1,129 @@
+import sqlite3
+
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.solver import Connect4Solver
+
+y = Connect4DiskColour.yellow
+r = Connect4DiskColour.red
+
+
+def _play(board, moves):
+    colour = r
+    for column in moves:
+        board.insert_disk(colour, column)
+        colour = y if colour == r else r
+
+
+def test_solve_empty_small_board():
+    solution = Connect4Solver().solve(Connect4Board(rows=4, columns=4))
+    assert (solution.colour, solution.value, solution.distance) == (r, 0, 16)
+
+
+def test_solve_win():
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [3, 3, 2, 2])
+    solution = Connect4Solver().solve(board)
+    # Red opens a double threat on the bottom row with column 1 or 4, yellow blocks one side and red wins
+    assert (solution.colour, solution.value, solution.distance) == (r, 1, 3)
+
+
+def test_solve_loss():
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [3, 3, 2, 2, 4])
+    solution = Connect4Solver().solve(board)
+    # Yellow can block one side of the double threat only
+    assert (solution.colour, solution.value, solution.distance) == (y, -1, 2)
+
+
+def test_solve_game_over():
+    board = Connect4Board(rows=6, columns=7)
+    _play(board, [0, 6, 1, 6, 2, 6, 3])
+    solution = Connect4Solver().solve(board)
+    assert (solution.colour, solution.value, solution.distance) == (y, -1, 0)
+
+
+def test_solve_moves():
+    board = Connect4Board(rows=4, columns=5)
+    _play(board, [2, 2, 1, 1])
+    solver = Connect4Solver()
+    solutions = solver.solve_moves(board)
+    # Only column 3 opens the double threat on the bottom row, every other move loses
+    assert {column: (solution.value, solution.distance) for column, solution in solutions.items()} == {
+        0: (-1, 16),
+        1: (-1, 16),
+        2: (-1, 16),
+        3: (1, 3),
+        4: (-1, 16),
+    }
+    assert all(solution.colour == r for solution in solutions.values())
+    assert solver.solve(board) == solutions[3]
+    assert board.moves == (2, 2, 1, 1)
+
+
+def test_persistent_cache(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    board = Connect4Board(rows=4, columns=5)
+    _play(board, [2, 2, 1])
+    solver = Connect4Solver(cache_path=path)
+    solution = solver.solve(board)
+    assert solver.searched_nodes > 0
+    solver.close()
+
+    solver = Connect4Solver(cache_path=path)
+    assert len(solver.cache) == 1
+    assert solver.solve(board) == solution
+    assert solver.searched_nodes == 0
+    solver.close()
+
+
+def test_mirrored_positions_share_cache(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    solver = Connect4Solver(cache_path=path)
+    board = Connect4Board(rows=4, columns=5)
+    _play(board, [2, 2, 1])
+    mirrored_board = Connect4Board(rows=4, columns=5)
+    _play(mirrored_board, [2, 2, 3])
+    solution = solver.solve(board)
+    assert solver.solve(mirrored_board) == solution
+    assert solver.searched_nodes == 0
+    assert len(solver.cache) == 1
+    solver.close()
+
+
+def test_solve_connect_k(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    solver = Connect4Solver(cache_path=path)
+    assert solver.solve(Connect4Board(rows=4, columns=4)) == Connect4Solver().solve(Connect4Board(rows=4, columns=4))
+    # The cached connect-4 solution and transposition table are not used for connect-3
+    solution = solver.solve(Connect4Board(rows=4, columns=4, connect=3))
+    assert (solution.colour, solution.value, solution.distance) == (r, 1, 9)
+    assert len(solver.cache) == 2
+    board = Connect4Board(rows=4, columns=4, connect=3)
+    _play(board, [1, 1])
+    assert solver.solve(board) == Connect4Solver().solve(board)
+    assert solver.solve(Connect4Board(rows=4, columns=4)).value == 0
+    solver.close()
+
+
+def test_cache_without_connect_column(tmp_path):
+    path = str(tmp_path / "solutions.sqlite")
+    solver = Connect4Solver(cache_path=path)
+    board = Connect4Board(rows=4, columns=5)
+    _play(board, [2, 2, 1])
+    solution = solver.solve(board)
+    solver.close()
+    # A database of the previous schema, without the rule
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE old AS SELECT rows, columns, key, score FROM solutions")
+    connection.execute("DROP TABLE solutions")
+    connection.execute("ALTER TABLE old RENAME TO solutions")
+    connection.commit()
+    connection.close()
+
+    solver = Connect4Solver(cache_path=path)
+    assert len(solver.cache) == 1
+    assert solver.solve(board) == solution and solver.searched_nodes == 0
+    connect_3_board = Connect4Board(rows=4, columns=5, connect=3)
+    _play(connect_3_board, [2, 2, 1])
+    assert solver.cache.get(connect_3_board) is None
+    solver.close()
@@ -0,0 +1,62 @@
+from functools import partial
+
+import pytest
+
+from connect4.player import (
+    Connect4DummyPlayer,
+    Connect4NegamaxAI,
+    Connect4ShortSightedAI,
+)
+from connect4.tournament import Connect4EloRatings, Connect4Tournament
+
+ENTRANTS = {
+    "dummy": Connect4DummyPlayer,
+    "short_sighted": Connect4ShortSightedAI,
+    "negamax": partial(Connect4NegamaxAI, max_time=None, max_depth=2),
+}
+
+
+def test_elo_update():
+    ratings = Connect4EloRatings(k_factor=10)
+    ratings.update("a", "b", score1=1)
+    assert ratings.rating("a") == pytest.approx(1505)
+    assert ratings.rating("b") == pytest.approx(1495)
+    ratings.update("a", "b", score1=1, games=2)
+    assert ratings.rating("a") + ratings.rating("b") == pytest.approx(3000)
+    assert [name for name, _ in ratings.table()] == ["a", "b"]
+
+
+def test_round_robin():
+    tournament = Connect4Tournament(ENTRANTS, games_per_pairing=4, games_per_chunk=2, seed=1, max_workers=2)
+    results = list(tournament.round_robin())
+    assert len(results) == 3 * 2 * 2
+    assert sum(match.result.num_games for match in results) == 3 * 2 * 4
+    assert {(match.red, match.yellow) for match in results} == {
+        (name1, name2) for name1 in ENTRANTS for name2 in ENTRANTS if name1 != name2
+    }
+    assert tournament.ratings.table()[-1][0] == "dummy"
+
+
+def test_round_robin_connect_k():
+    tournament = Connect4Tournament(ENTRANTS, games_per_pairing=2, seed=1, max_workers=2, connect=1)
+    # Any disk connects one disk: red wins with its first move
+    assert all(match.result.red_wins == match.result.num_games for match in tournament.round_robin())
+
+
+def test_round_robin_reproducible():
+    tables = []
+    for _ in range(2):
+        tournament = Connect4Tournament(ENTRANTS, games_per_pairing=3, seed=7, max_workers=2)
+        list(tournament.round_robin())
+        tables.append(tournament.ratings.table())
+    assert tables[0] == tables[1]
+
+
+def test_swiss():
+    entrants = {f"dummy{idx}": Connect4DummyPlayer for idx in range(5)}
+    tournament = Connect4Tournament(entrants, games_per_pairing=1, seed=0, max_workers=2)
+    results = list(tournament.swiss(rounds=2))
+    pairings = [frozenset((match.red, match.yellow)) for match in results]
+    # Two pairings per round, each played with both colours, never repeated
+    assert len(pairings) == 8
+    assert len(set(pairings)) == 4
@@ -0,0 +1,52 @@
+from connect4.board import Connect4Board, Connect4DiskColour
+from connect4.transposition import Connect4Bound, Connect4TranspositionTable
+
+
+def test_store_and_lookup():
+    table = Connect4TranspositionTable(size=8)
+    assert table.lookup(3) is None
+    table.store(3, depth=2, bound=Connect4Bound.exact, score=1.0, best_column=4)
+    entry = table.lookup(3)
+    assert (entry.depth, entry.bound, entry.score, entry.best_column) == (2, Connect4Bound.exact, 1.0, 4)
+    assert (table.probes, table.hits) == (2, 1)
+    assert len(table) == 1
+
+
+def test_two_tier_replacement():
+    # A single slot: all the positions collide
+    table = Connect4TranspositionTable(size=1)
+    table.store(1, depth=5, bound=Connect4Bound.lower, score=0.0, best_column=0)
+    # Shallower search of a colliding position goes to the always-replace tier
+    table.store(9, depth=2, bound=Connect4Bound.upper, score=0.0, best_column=1)
+    assert table.lookup(1).depth == 5
+    assert table.lookup(9).depth == 2
+    table.store(17, depth=1, bound=Connect4Bound.upper, score=0.0, best_column=2)
+    assert table.lookup(9) is None
+    assert table.lookup(1).depth == 5
+    # Deeper search takes the depth-preferred tier and demotes the old entry
+    table.store(25, depth=7, bound=Connect4Bound.exact, score=0.0, best_column=3)
+    assert table.lookup(25).depth == 7
+    assert table.lookup(1).depth == 5
+    assert table.lookup(17) is None
+    assert len(table) == 2
+
+
+def test_clear():
+    table = Connect4TranspositionTable(size=4)
+    table.store(1, depth=1, bound=Connect4Bound.exact, score=0.0, best_column=0)
+    table.clear()
+    assert len(table) == 0
+    assert table.lookup(1) is None
+
+
+def test_slots_spread_centre_columns():
+    table = Connect4TranspositionTable()
+    slots = set()
+    for height in range(7):
+        board = Connect4Board(rows=6, columns=7)
+        for _ in range(height):
+            board.insert_disk(Connect4DiskColour.red, 3)
+        slots.add(table._slot(board.position_key()))
+    # Positions differing only in column 3 land in different slots
+    assert len(slots) == 7
+    assert all(0 <= slot < table.size for slot in slots)